@@ -0,0 +1 @@
+"""Benchmarks for Athena Plant Monitor."""
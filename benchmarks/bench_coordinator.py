@@ -0,0 +1,326 @@
+"""Benchmark of the coordinator hot path at 1, 10, 100 and 500 tents.
+
+Run from the repository root (Home Assistant must be installed):
+
+    python -m benchmarks.bench_coordinator
+    python -m benchmarks.bench_coordinator --tents 1,10 --rounds 50
+    python -m benchmarks.bench_coordinator --save     # Baseline speichern
+    python -m benchmarks.bench_coordinator --check    # Exit 1 bei Regression
+
+Every tent is a ``SimulatedTent`` whose states are written into the
+hass stand-in; every coordinator runs in hub mode (no timers of its own)
+with the entities of all platforms attached. One round advances the
+simulation by the default update interval and then, per tent, measures:
+
+- ``update``: ``_async_update_data`` (read, filter, derive, finalize)
+- ``derive``: ``_calculate_derived_values`` with a full recompute; the
+  state it touches is restored afterwards, so every round measures the
+  same coordinator state the tick left behind
+- ``strategy``: ``_determine_climate_strategy``
+- ``fanout``: ``async_set_updated_data`` to all entities incl. writes
+
+Latencies are reported as p50/p99 in milliseconds. A separate pass with
+tracemalloc enabled reports the peak memory allocated during one update
+plus fan-out and the memory still held afterwards. Baselines are stored
+per tent count in ``baselines.json`` next to this file.
+"""
+import argparse
+import asyncio
+import copy
+import gc
+import importlib
+import json
+import logging
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.util import dt as dt_util
+
+from custom_components.athena_plant_monitor.const import (
+    DOMAIN,
+    PLATFORMS,
+    DATA_COORDINATOR,
+    DEFAULT_UPDATE_INTERVAL,
+)
+from custom_components.athena_plant_monitor.coordinator import AthenaPlantCoordinator
+from custom_components.athena_plant_monitor.simulator import SimulatedTent, simulated_device_ids
+
+from .hass_standin import StandInHass, attach_entity
+
+_LOGGER = logging.getLogger(__name__)
+
+BASELINE_FILE = Path(__file__).with_name("baselines.json")
+DEFAULT_TENTS = (1, 10, 100, 500)
+DEFAULT_ROUNDS = 20
+DEFAULT_TOLERANCE = 0.25  # erlaubte Verschlechterung gegenüber der Baseline
+ALLOCATION_SAMPLE = 20  # Zelte je Runde im tracemalloc-Durchlauf
+STAGES = ("update", "derive", "strategy", "fanout")
+
+# Kennzahlen, die beim Vergleich mit der Baseline geprüft werden (größer = schlechter)
+COMPARED_METRICS = (
+    "update_p50_ms", "update_p99_ms", "fanout_p50_ms", "fanout_p99_ms",
+    "tick_ms", "alloc_peak_kib", "alloc_retained_kib",
+)
+
+
+@contextmanager
+def restored_derive_state(coordinator: AthenaPlantCoordinator) -> Iterator[None]:
+    """Undo what an extra derivation pass changes on a live coordinator.
+
+    The pass raises max_vwc_today, feeds the dryback estimator, clears the
+    dirty inputs and refills the derivation cache; without restoring them
+    the measurement would change the next tick's inputs.
+    """
+    irrigation_state = dict(coordinator._irrigation_state)
+    estimator = copy.deepcopy(coordinator._dryback_estimator)
+    dirty_inputs = set(coordinator._dirty_inputs)
+    cache = dict(coordinator._derivations._cache)
+    try:
+        yield
+    finally:
+        # Der Scheduler hält dasselbe Dict: nur den Inhalt zurücksetzen
+        coordinator._irrigation_state.clear()
+        coordinator._irrigation_state.update(irrigation_state)
+        coordinator._dryback_estimator = estimator
+        coordinator._dirty_inputs = dirty_inputs
+        coordinator._derivations._cache = cache
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+class Bench:
+    """Tents, coordinators and entities for one tent count."""
+
+    def __init__(self, hass: StandInHass, count: int) -> None:
+        self.hass = hass
+        self.tents = [SimulatedTent(device_id) for device_id in simulated_device_ids(count)]
+        self.coordinators: List[AthenaPlantCoordinator] = []
+        self.entity_count = 0
+        self.fanout_seconds = 0.0
+        self.clock = dt_util.now()
+
+    def publish(self) -> None:
+        async_set = self.hass.states.async_set
+        for tent in self.tents:
+            for entity_id, state in tent.states().items():
+                async_set(entity_id, state)
+
+    def step(self, seconds: float) -> None:
+        self.clock += timedelta(seconds=seconds)
+        for tent in self.tents:
+            tent.step(seconds, self.clock)
+        self.publish()
+
+    async def async_setup(self) -> None:
+        """Create a coordinator per tent and attach all platform entities."""
+        hass = self.hass
+        self.publish()
+        platforms = [
+            importlib.import_module(f"custom_components.{DOMAIN}.{name}") for name in PLATFORMS
+        ]
+        for tent in self.tents:
+            coordinator = AthenaPlantCoordinator(
+                hass, tent.device_id, DEFAULT_UPDATE_INTERVAL, {}, hub_mode=True
+            )
+            entry = SimpleNamespace(entry_id=tent.device_id, data={}, options={})
+            hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_COORDINATOR: coordinator}
+
+            entities: List[Any] = []
+            for module in platforms:
+                await module.async_setup_entry(hass, entry, entities.extend)
+            for index, entity in enumerate(entities):
+                attach_entity(hass, entity, f"sensor.bench_{tent.device_id}_{index}")
+                coordinator.async_add_listener(entity._handle_coordinator_update)
+            self.entity_count += len(entities)
+
+            # Erstes vollständiges Update (alles wird berechnet und geschrieben)
+            coordinator.async_set_updated_data(await coordinator._async_update_data())
+            self.coordinators.append(coordinator)
+
+    async def async_round(self, samples: Dict[str, List[float]]) -> Tuple[float, int]:
+        """Update every coordinator once; return the tick time (ms) and writes."""
+        self.step(DEFAULT_UPDATE_INTERVAL)
+        perf = time.perf_counter
+        writes_before = self.hass.states.writes
+        fanout_total = 0.0
+        tick_start = perf()
+        for coordinator in self.coordinators:
+            start = perf()
+            data = await coordinator._async_update_data()
+            samples["update"].append((perf() - start) * 1000)
+
+            start = perf()
+            coordinator.async_set_updated_data(data)
+            elapsed = perf() - start
+            samples["fanout"].append(elapsed * 1000)
+            fanout_total += elapsed
+        tick_ms = (perf() - tick_start) * 1000
+
+        # Einzelne Stufen auf den aktuellen Daten (nicht Teil des Ticks)
+        for coordinator in self.coordinators:
+            raw = {key: coordinator.data.get(key) for key in coordinator._entity_ids}
+            with restored_derive_state(coordinator):
+                start = perf()
+                coordinator._calculate_derived_values(raw, None)
+                samples["derive"].append((perf() - start) * 1000)
+
+            start = perf()
+            coordinator._determine_climate_strategy(coordinator.data, coordinator.data)
+            samples["strategy"].append((perf() - start) * 1000)
+
+        # Hintergrundaufgaben (Bewässerungsschüsse) laufen lassen
+        await asyncio.sleep(0)
+        self.fanout_seconds += fanout_total
+        return tick_ms, self.hass.states.writes - writes_before
+
+    async def async_allocations(self, rounds: int) -> Tuple[float, float]:
+        """Return mean peak and retained KiB per update incl. fan-out."""
+        peaks: List[float] = []
+        retained: List[float] = []
+        sample = self.coordinators[:ALLOCATION_SAMPLE]
+        tracemalloc.start()
+        try:
+            for _ in range(rounds):
+                self.step(DEFAULT_UPDATE_INTERVAL)
+                for coordinator in sample:
+                    gc.collect()
+                    tracemalloc.reset_peak()
+                    before = tracemalloc.get_traced_memory()[0]
+                    coordinator.async_set_updated_data(await coordinator._async_update_data())
+                    current, peak = tracemalloc.get_traced_memory()
+                    peaks.append((peak - before) / 1024)
+                    retained.append((current - before) / 1024)
+        finally:
+            tracemalloc.stop()
+        return sum(peaks) / len(peaks), sum(retained) / len(retained)
+
+    async def async_shutdown(self) -> None:
+        for coordinator in self.coordinators:
+            await coordinator.async_shutdown()
+
+
+async def async_run(count: int, rounds: int) -> Dict[str, Any]:
+    """Benchmark one tent count and return its metrics."""
+    hass = StandInHass(asyncio.get_running_loop())
+    bench = Bench(hass, count)
+    try:
+        await bench.async_setup()
+        suppressed_before = sum(c.write_stats["suppressed"] for c in bench.coordinators)
+
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        ticks: List[float] = []
+        writes = 0
+        for _ in range(rounds):
+            tick_ms, round_writes = await bench.async_round(samples)
+            ticks.append(tick_ms)
+            writes += round_writes
+        suppressed = sum(c.write_stats["suppressed"] for c in bench.coordinators) - suppressed_before
+
+        alloc_peak, alloc_retained = await bench.async_allocations(max(1, min(rounds, 5)))
+    finally:
+        await bench.async_shutdown()
+        await hass.async_stop()
+
+    updates = rounds * count
+    result: Dict[str, Any] = {
+        "tents": count,
+        "entities": bench.entity_count,
+        "rounds": rounds,
+    }
+    for stage in STAGES:
+        result[f"{stage}_p50_ms"] = round(percentile(samples[stage], 0.50), 4)
+        result[f"{stage}_p99_ms"] = round(percentile(samples[stage], 0.99), 4)
+    result["tick_ms"] = round(percentile(ticks, 0.50), 3)
+    result["writes_per_update"] = round(writes / updates, 2)
+    result["suppressed_per_update"] = round(suppressed / updates, 2)
+    result["writes_per_s"] = round(writes / bench.fanout_seconds) if bench.fanout_seconds else None
+    result["alloc_peak_kib"] = round(alloc_peak, 1)
+    result["alloc_retained_kib"] = round(alloc_retained, 1)
+    return result
+
+
+def compare(results: List[Dict[str, Any]], baselines: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return the metrics that got worse than baseline * (1 + tolerance)."""
+    regressions = []
+    for result in results:
+        baseline = baselines.get("results", {}).get(str(result["tents"]))
+        if not baseline:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = baseline.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > 0.01:
+                regressions.append(f"{result['tents']} tents: {metric} {old} -> {new}")
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    columns = (
+        ("tents", "tents"), ("entities", "entities"),
+        ("update_p50_ms", "upd p50"), ("update_p99_ms", "upd p99"),
+        ("derive_p50_ms", "derive p50"), ("strategy_p50_ms", "strat p50"),
+        ("fanout_p50_ms", "fanout p50"), ("fanout_p99_ms", "fanout p99"),
+        ("tick_ms", "tick ms"), ("writes_per_update", "writes/upd"),
+        ("writes_per_s", "writes/s"), ("alloc_peak_kib", "peak KiB"),
+        ("alloc_retained_kib", "kept KiB"),
+    )
+    print("  ".join(f"{title:>10}" for _, title in columns))
+    for result in results:
+        print("  ".join(f"{str(result.get(key)):>10}" for key, _ in columns))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tents", default=",".join(map(str, DEFAULT_TENTS)), help="comma separated tent counts")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="update rounds per tent count")
+    parser.add_argument("--save", action="store_true", help=f"store the results as baseline in {BASELINE_FILE.name}")
+    parser.add_argument("--check", action="store_true", help="exit with 1 if a metric regressed")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    for count in (int(value) for value in args.tents.split(",")):
+        result = asyncio.run(async_run(count, args.rounds))
+        results.append(result)
+        _LOGGER.info(f"{count} tents done")
+    print_table(results)
+
+    baselines = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    regressions = compare(results, baselines, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if baselines and not regressions:
+        print(f"No regressions against {BASELINE_FILE.name} (tolerance {args.tolerance:.0%})")
+
+    if args.save:
+        stored = baselines.get("results", {})
+        stored.update({str(result["tents"]): result for result in results})
+        BASELINE_FILE.write_text(json.dumps({
+            "python": platform.python_version(),
+            "homeassistant": HA_VERSION,
+            "machine": platform.machine(),
+            "results": stored,
+        }, indent=2) + "\n")
+        print(f"Baseline saved to {BASELINE_FILE}")
+
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""Minimal in-process Home Assistant stand-in for the benchmarks.
+
+The coordinators and entities run unchanged; only the ``hass`` object
+they talk to is replaced. It keeps real ``State`` objects in a plain dict,
+counts events and service calls instead of dispatching them and schedules
+timers on the running event loop. Home Assistant itself must be installed
+(the integration imports it), but no instance is started: no recorder,
+no entity registry, no platforms.
+
+Entities are attached with ``attach_entity``: their state write computes
+``state`` and ``extra_state_attributes`` like Home Assistant does and
+stores them in the stand-in state machine, so the fan-out cost of the
+integration is measured without Home Assistant's own write path.
+"""
+import asyncio
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from homeassistant.const import STATE_UNKNOWN
+from homeassistant.core import CoreState, State
+from homeassistant.helpers.entity import Entity
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StandInStates:
+    """Dict-backed state machine with a write counter."""
+
+    def __init__(self) -> None:
+        self._states: Dict[str, State] = {}
+        self.writes = 0
+
+    def get(self, entity_id: str) -> Optional[State]:
+        return self._states.get(entity_id)
+
+    def async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Optional[Mapping[str, Any]] = None,
+        force_update: bool = False,
+        context: Any = None,
+    ) -> None:
+        self.writes += 1
+        self._states[entity_id] = State(entity_id, new_state, attributes)
+
+    def async_entity_ids(self, domain_filter: Optional[str] = None) -> list:
+        if domain_filter is None:
+            return list(self._states)
+        return [entity_id for entity_id in self._states if entity_id.startswith(f"{domain_filter}.")]
+
+
+class StandInBus:
+    """Event bus that only counts fired events."""
+
+    def __init__(self) -> None:
+        self.fired: Dict[str, int] = {}
+
+    def async_fire(self, event_type: str, event_data: Optional[Mapping[str, Any]] = None, *args: Any, **kwargs: Any) -> None:
+        self.fired[event_type] = self.fired.get(event_type, 0) + 1
+
+    def async_listen(self, event_type: str, listener: Callable, *args: Any, **kwargs: Any) -> Callable[[], None]:
+        return lambda: None
+
+    def async_listen_once(self, event_type: str, listener: Callable, *args: Any, **kwargs: Any) -> Callable[[], None]:
+        return lambda: None
+
+
+class StandInServices:
+    """Service registry that accepts and counts every call."""
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = {}
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return True
+
+    async def async_call(self, domain: str, service: str, service_data: Any = None, blocking: bool = False, **kwargs: Any) -> None:
+        name = f"{domain}.{service}"
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+
+class StandInHass:
+    """The parts of ``HomeAssistant`` used by the coordinator and entities."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.state = CoreState.running
+        self.data: Dict[str, Any] = {}
+        self.states = StandInStates()
+        self.bus = StandInBus()
+        self.services = StandInServices()
+        self._config_dir = tempfile.TemporaryDirectory(prefix="athena_bench_")
+        self.config = SimpleNamespace(
+            components=set(),
+            config_dir=self._config_dir.name,
+            time_zone="UTC",
+            units=METRIC_SYSTEM,
+            path=lambda *parts: "/".join((self._config_dir.name, *parts)),
+        )
+        self._tasks: set = set()
+        self._executor = ThreadPoolExecutor(thread_name_prefix="athena_bench")
+
+    def _track(self, task: asyncio.Task) -> asyncio.Task:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_create_task(self, target: Any, name: Optional[str] = None, eager_start: bool = False) -> asyncio.Task:
+        return self._track(self.loop.create_task(target))
+
+    def async_create_background_task(self, target: Any, name: Optional[str] = None, eager_start: bool = False) -> asyncio.Task:
+        return self._track(self.loop.create_task(target))
+
+    def async_add_executor_job(self, target: Callable, *args: Any) -> asyncio.Future:
+        return self.loop.run_in_executor(self._executor, target, *args)
+
+    def async_run_hass_job(self, job: Any, *args: Any, **kwargs: Any) -> Any:
+        result = job.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.async_create_task(result)
+        return result
+
+    async def async_stop(self) -> None:
+        """Cancel background tasks (irrigation shots) and remove the temp dir.
+
+        Cancelling a task does not stop an executor job it awaits (e.g. a
+        Store write), so the executor is drained before the cleanup.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+        self._config_dir.cleanup()
+
+
+def attach_entity(hass: StandInHass, entity: Entity, entity_id: str) -> None:
+    """Give an entity its hass and entity id and a stand-in state write."""
+    entity.hass = hass
+    entity.entity_id = entity_id
+
+    def _write() -> None:
+        state = entity.state
+        hass.states.async_set(
+            entity_id,
+            STATE_UNKNOWN if state is None else str(state),
+            entity.extra_state_attributes,
+        )
+
+    entity.async_write_ha_state = _write
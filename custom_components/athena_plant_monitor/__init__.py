@@ -25,10 +25,22 @@ from .const import (
     CONF_GROWTH_PHASE,
     CONF_CROP_STEERING,
     CONF_SUBSTRATE_SIZE,
+    CONF_HUB_MODE,
+    CONF_SIMULATOR,
+    CONF_SIMULATOR_TENTS,
+    CONF_SIMULATOR_TIME_SCALE,
     DATA_COORDINATOR,
     DATA_CONFIG,
+    DATA_HUB,
+    DATA_SIMULATOR,
+    DATA_SIMULATOR_STOP,
 )
 from .coordinator import AthenaPlantCoordinator
+from .hub import AthenaPlantHub
+from .registry import async_get_registry
+from .store import AthenaPlantStore
+from .services import async_setup_services, async_unload_services
+from .simulator import async_setup_simulator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +56,13 @@ CONFIG_SCHEMA = vol.Schema(
                     "vegetative", "generative", "balanced"
                 ]),
                 vol.Optional(CONF_SUBSTRATE_SIZE, default=10): vol.Coerce(float),
+                vol.Optional(CONF_HUB_MODE, default=False): bool,
+                # Simulierte Zelte für Last- und Dauertests (ohne Hardware)
+                vol.Optional(CONF_SIMULATOR): vol.Schema({
+                    vol.Required(CONF_SIMULATOR_TENTS): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+                    vol.Optional(CONF_UPDATE_INTERVAL, default=10): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                    vol.Optional(CONF_SIMULATOR_TIME_SCALE, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                }),
             }
         )
     },
@@ -57,6 +76,24 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     
     if DOMAIN in config:
         hass.data[DOMAIN][DATA_CONFIG] = config[DOMAIN]
+        
+        # Hub-Modus: ein gemeinsamer Update-Zyklus für alle Zelte
+        if config[DOMAIN].get(CONF_HUB_MODE):
+            hass.data[DOMAIN][DATA_HUB] = AthenaPlantHub(
+                hass, config[DOMAIN].get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+            )
+        
+        simulator_config = config[DOMAIN].get(CONF_SIMULATOR)
+        if simulator_config:
+            _LOGGER.warning("Athena Plant Monitor simulator enabled - simulated tents are not real hardware")
+            simulator, stop = async_setup_simulator(
+                hass,
+                simulator_config[CONF_SIMULATOR_TENTS],
+                simulator_config[CONF_UPDATE_INTERVAL],
+                simulator_config[CONF_SIMULATOR_TIME_SCALE],
+            )
+            hass.data[DOMAIN][DATA_SIMULATOR] = simulator
+            hass.data[DOMAIN][DATA_SIMULATOR_STOP] = stop
     
     return True
 
@@ -68,30 +105,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store config data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {}
+    hub: Optional[AthenaPlantHub] = hass.data[DOMAIN].get(DATA_HUB)
+    
+    # Optionen überschreiben die Werte aus der Ersteinrichtung
+    config = {**entry.data, **entry.options}
     
     # Create coordinator
     coordinator = AthenaPlantCoordinator(
         hass,
-        entry.data.get(CONF_DEVICE_ID, "esphome_node_1"),
-        entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-        entry.data  # Übergebe komplette Konfiguration für externe Lichtsteuerung
+        config.get(CONF_DEVICE_ID, "esphome_node_1"),
+        config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        config,  # Übergebe komplette Konfiguration für externe Lichtsteuerung
+        hub_mode=hub is not None,
     )
     
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR] = coordinator
     
+    # Gespeicherten Zustand (Tageswasser, Max VWC, ...) vor dem ersten Update laden
+    await coordinator.async_restore_state()
+    
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
     
+    # Auf Zustandsänderungen der ESPHome-Entitäten reagieren (Event-Modus)
+    entry.async_on_unload(coordinator.async_start_listeners())
+    
+    # Tageszähler (Wassermenge, Max VWC) um Mitternacht zurücksetzen
+    entry.async_on_unload(coordinator.async_start_day_rollover())
+    
+    # Im Hub-Modus übernimmt der gemeinsame Scheduler das Polling
+    if hub is not None:
+        entry.async_on_unload(hub.async_register(coordinator))
+    
     # Forward the setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Register services
-    await _async_register_services(hass, coordinator)
+    # Für Service-Aufrufe auffindbar machen (ESPHome-ID, Gerät, Entitäten)
+    entry.async_on_unload(async_get_registry(hass).async_register(entry.entry_id, coordinator))
+    
+    # Services einmalig für alle Geräte registrieren
+    if not hass.services.has_service(DOMAIN, "irrigation_shot"):
+        await async_setup_services(hass)
+    
+    # Geänderte Optionen werden durch Neuladen übernommen
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading Athena Plant Monitor integration")
@@ -99,110 +166,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)[DATA_COORDINATOR]
+        await coordinator.async_shutdown()
+        
+        # Letztes Gerät entfernt -> Services abmelden
+        # (die Registry-Abmeldung über async_on_unload läuft erst danach)
+        registry = async_get_registry(hass)
+        unloaded = registry.get_by_entry(entry.entry_id)
+        if not [c for c in registry.coordinators if c is not unloaded]:
+            await async_unload_services(hass)
     
     return unload_ok
 
 
-async def _async_register_services(hass: HomeAssistant, coordinator: AthenaPlantCoordinator) -> None:
-    """Register integration services."""
-    
-    async def handle_irrigation_shot(call):
-        """Handle manual irrigation shot service."""
-        shot_size = call.data.get("shot_size", 3.0)  # Default 3% shot
-        duration = call.data.get("duration", 30)  # Default 30 seconds
-        
-        await coordinator.trigger_irrigation_shot(shot_size, duration)
-        
-    async def handle_set_growth_phase(call):
-        """Handle set growth phase service."""
-        phase = call.data.get("phase")
-        await coordinator.set_growth_phase(phase)
-        
-    async def handle_set_crop_steering(call):
-        """Handle set crop steering service."""
-        strategy = call.data.get("strategy")
-        await coordinator.set_crop_steering(strategy)
-        
-    # Register services
-    hass.services.async_register(
-        DOMAIN,
-        "irrigation_shot",
-        handle_irrigation_shot,
-        schema=vol.Schema({
-            vol.Optional("shot_size", default=3.0): vol.Coerce(float),
-            vol.Optional("duration", default=30): vol.Coerce(int),
-        }),
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "set_growth_phase",
-        handle_set_growth_phase,
-        schema=vol.Schema({
-            vol.Required("phase"): vol.In([
-                "vegetative", "flowering_stretch", "flowering_bulk", "flowering_finish"
-            ]),
-        }),
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "set_crop_steering",
-        handle_set_crop_steering,
-        schema=vol.Schema({
-            vol.Required("strategy"): vol.In([
-                "vegetative", "generative", "balanced"
-            ]),
-        }),
-    )
-    
-    # Climate control services
-    async def handle_apply_climate_strategy(call):
-        """Handle apply climate strategy service."""
-        strategy = call.data.get("strategy")
-        await coordinator.apply_climate_strategy(strategy)
-        
-    async def handle_set_ventilation_mode(call):
-        """Handle set ventilation mode service."""
-        mode = call.data.get("mode")
-        await coordinator.set_ventilation_mode(mode)
-        
-    async def handle_optimize_vpd(call):
-        """Handle optimize VPD service."""
-        target_vpd = call.data.get("target_vpd")
-        await coordinator.optimize_vpd(target_vpd)
-    
-    hass.services.async_register(
-        DOMAIN,
-        "apply_climate_strategy",
-        handle_apply_climate_strategy,
-        schema=vol.Schema({
-            vol.Optional("strategy"): vol.In([
-                "maintain_optimal", "intake_air", "heat_dehumidify", 
-                "cool_humidify", "dehumidify_only", "humidify_only",
-                "cooling_ventilation", "cooling_only", "heating"
-            ]),
-        }),
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "set_ventilation_mode",
-        handle_set_ventilation_mode,
-        schema=vol.Schema({
-            vol.Required("mode"): vol.In([
-                "reduce_intake", "normal", "increase_intake",
-                "increase_exhaust", "maximum_intake", "reduce_exhaust"
-            ]),
-        }),
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "optimize_vpd",
-        handle_optimize_vpd,
-        schema=vol.Schema({
-            vol.Optional("target_vpd"): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=2.0)),
-        }),
-    )
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted state when a device is removed."""
+    await AthenaPlantStore(hass, entry.data.get(CONF_DEVICE_ID, "esphome_node_1")).async_remove()
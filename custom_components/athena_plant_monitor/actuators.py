@@ -0,0 +1,126 @@
+"""Batched actuator commands for Athena Plant Monitor."""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import ACTUATOR_MIN_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ActuatorDispatcher:
+    """Send desired on/off states of one device's actuators as a batch.
+
+    ``async_apply`` takes the desired state per entity. Entities that are
+    already in that state are skipped, the remaining commands are grouped
+    into one service call per domain and service, and the groups run
+    concurrently. Batches of a device are at least ``min_interval`` seconds
+    apart: desired states arriving in between are coalesced (latest wins)
+    and sent with the next batch.
+    """
+
+    def __init__(self, hass: HomeAssistant, min_interval: float = ACTUATOR_MIN_INTERVAL) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self.min_interval = min_interval
+        self._desired: Dict[str, bool] = {}
+        self._next_batch = 0.0
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._stats = {
+            "batches": 0,
+            "commands": 0,
+            "skipped": 0,
+            "coalesced": 0,
+            "failed": 0,
+            "last_latency_ms": None,
+            "max_latency_ms": None,
+            "total_latency_ms": 0.0,
+        }
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return command counters and batch latencies."""
+        stats = dict(self._stats)
+        total = stats.pop("total_latency_ms")
+        stats["avg_latency_ms"] = round(total / stats["batches"], 1) if stats["batches"] else None
+        stats["pending"] = dict(self._desired)
+        return stats
+
+    async def async_apply(self, desired: Mapping[str, bool], force: bool = False) -> int:
+        """Bring the entities into the desired states; return the commands sent.
+
+        With ``force`` the batch is sent immediately, ignoring the interval.
+        """
+        self._desired.update(desired)
+        wait = self._next_batch - time.monotonic()
+        if wait > 0 and not force:
+            self._stats["coalesced"] += len(desired)
+            if self._unsub_timer is None:
+                self._unsub_timer = async_call_later(self.hass, wait, self._async_batch_due)
+            return 0
+        return await self._async_send()
+
+    @callback
+    def _async_batch_due(self, _now: Any) -> None:
+        self._unsub_timer = None
+        self.hass.async_create_task(self._async_send())
+
+    def _diff(self, desired: Mapping[str, bool]) -> Dict[Tuple[str, str], List[str]]:
+        """Group the commands that change something by (domain, service)."""
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for entity_id, on in desired.items():
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state == (STATE_ON if on else STATE_OFF):
+                self._stats["skipped"] += 1
+                continue
+            service = "turn_on" if on else "turn_off"
+            groups.setdefault((entity_id.split(".")[0], service), []).append(entity_id)
+        return groups
+
+    async def _async_send(self) -> int:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        desired, self._desired = self._desired, {}
+        groups = self._diff(desired)
+        if not groups:
+            return 0
+
+        self._next_batch = time.monotonic() + self.min_interval
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self.hass.services.async_call(domain, service, {"entity_id": entity_ids}, blocking=True)
+                for (domain, service), entity_ids in groups.items()
+            ),
+            return_exceptions=True,
+        )
+        latency = round((time.perf_counter() - start) * 1000, 1)
+
+        sent = 0
+        for ((domain, service), entity_ids), result in zip(groups.items(), results):
+            sent += len(entity_ids)
+            if isinstance(result, Exception):
+                self._stats["failed"] += len(entity_ids)
+                _LOGGER.error(f"{domain}.{service} for {', '.join(entity_ids)} failed: {result}")
+
+        stats = self._stats
+        stats["batches"] += 1
+        stats["commands"] += sent
+        stats["last_latency_ms"] = latency
+        stats["max_latency_ms"] = max(stats["max_latency_ms"] or 0.0, latency)
+        stats["total_latency_ms"] += latency
+        _LOGGER.debug(f"Actuator batch: {sent} command(s) in {len(groups)} call(s), {latency} ms")
+        return sent
+
+    @callback
+    def async_stop(self) -> None:
+        """Drop coalesced commands that were not sent yet."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._desired.clear()
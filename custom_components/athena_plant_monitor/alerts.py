@@ -0,0 +1,191 @@
+"""Alert engine for Athena Plant Monitor."""
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from .const import ALERT_THRESHOLDS, ALERT_HYSTERESIS, ALERT_MIN_DURATION
+
+_LOGGER = logging.getLogger(__name__)
+
+SEVERITIES = ("critical", "warning", "info")
+
+# Präfix in ALERT_THRESHOLDS -> Datenschlüssel
+ALERT_KEYS = {
+    "vwc": "vwc",
+    "ec": "ec_substrate",
+    "ph": "ph_substrate",
+    "temp": "temperature",
+    "vpd": "vpd_calculated",
+}
+
+# Schweregrad je Schwellwert (Standard: warning)
+ALERT_SEVERITIES = {
+    "vwc_critical_low": "critical",
+    "ec_critical_high": "critical",
+    "vpd_critical_low": "info",
+}
+
+ALERT_MESSAGES = {
+    "vwc_critical_low": "VWC kritisch niedrig: {value}% (< {threshold}%)",
+    "vwc_critical_high": "VWC sehr hoch: {value}% (> {threshold}%)",
+    "ec_critical_low": "EC niedrig: {value} (< {threshold})",
+    "ec_critical_high": "EC kritisch hoch: {value} (> {threshold})",
+    "ph_critical_low": "pH zu niedrig: {value} (< {threshold})",
+    "ph_critical_high": "pH zu hoch: {value} (> {threshold})",
+    "temp_critical_low": "Temperatur zu niedrig: {value}°C (< {threshold}°C)",
+    "temp_critical_high": "Temperatur zu hoch: {value}°C (> {threshold}°C)",
+    "vpd_critical_low": "VPD niedrig: {value} kPa (< {threshold} kPa, Schimmelrisiko)",
+    "vpd_critical_high": "VPD hoch: {value} kPa (> {threshold} kPa, Trockenstress)",
+}
+
+
+class AlertRule(NamedTuple):
+    """A threshold on one data key."""
+
+    alert_id: str
+    key: str
+    above: bool  # True: Alarm über dem Schwellwert, False: darunter
+    threshold: float
+    hysteresis: float
+    severity: str
+    message: str
+    min_duration: float  # seconds
+
+    def violated(self, value: float) -> bool:
+        """Return whether the value crosses the threshold."""
+        return value > self.threshold if self.above else value < self.threshold
+
+    def cleared(self, value: float) -> bool:
+        """Return whether the value is back beyond the hysteresis band."""
+        if self.above:
+            return value <= self.threshold - self.hysteresis
+        return value >= self.threshold + self.hysteresis
+
+
+def build_rules(
+    thresholds: Mapping[str, float] = ALERT_THRESHOLDS,
+    min_duration: float = ALERT_MIN_DURATION,
+) -> List[AlertRule]:
+    """Create the rules from ALERT_THRESHOLDS (``<prefix>_critical_low/high``)."""
+    rules = []
+    for alert_id, threshold in thresholds.items():
+        prefix, _, direction = alert_id.rpartition("_")
+        prefix = prefix.replace("_critical", "")
+        key = ALERT_KEYS.get(prefix)
+        if key is None or direction not in ("low", "high"):
+            _LOGGER.warning(f"Ignoring unknown alert threshold {alert_id}")
+            continue
+        rules.append(AlertRule(
+            alert_id=alert_id,
+            key=key,
+            above=direction == "high",
+            threshold=threshold,
+            hysteresis=ALERT_HYSTERESIS.get(prefix, 0.0),
+            severity=ALERT_SEVERITIES.get(alert_id, "warning"),
+            message=ALERT_MESSAGES.get(alert_id, f"{alert_id}: {{value}}"),
+            min_duration=min_duration,
+        ))
+    return rules
+
+
+class AlertEngine:
+    """Evaluate alert rules incrementally.
+
+    Rules are indexed by data key, so an update only evaluates the rules
+    of keys that changed. A violation must persist for ``min_duration``
+    before the alert is raised (debounce), and it is only cleared once the
+    value leaves the hysteresis band. An active alert is reported once and
+    not re-raised while it stays active (de-duplication).
+    """
+
+    def __init__(self, rules: Optional[Iterable[AlertRule]] = None) -> None:
+        """Index the rules by data key."""
+        self._rules_by_key: Dict[str, List[AlertRule]] = {}
+        self._rules_by_id: Dict[str, AlertRule] = {}
+        for rule in (build_rules() if rules is None else rules):
+            self._rules_by_key.setdefault(rule.key, []).append(rule)
+            self._rules_by_id[rule.alert_id] = rule
+        self._pending: Dict[str, float] = {}  # alert_id -> seit wann verletzt
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: Dict[str, List[Dict[str, Any]]] = {severity: [] for severity in SEVERITIES}
+
+    @property
+    def keys(self) -> Set[str]:
+        """Return the data keys that have rules."""
+        return set(self._rules_by_key)
+
+    @property
+    def alerts(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the active alerts grouped by severity.
+
+        The same object is returned until the set of active alerts changes.
+        """
+        return self._snapshot
+
+    def next_due(self) -> Optional[float]:
+        """Return when the earliest pending alert passes its debounce time."""
+        return min(
+            (since + self._rules_by_id[alert_id].min_duration for alert_id, since in self._pending.items()),
+            default=None,
+        )
+
+    def evaluate(
+        self,
+        data: Mapping[str, Any],
+        now: float,
+        changed: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Evaluate the rules of the changed keys (all keys if None).
+
+        Pending alerts are always re-checked so that a debounce completes
+        even without a new value; a pending alert whose value became
+        non-numeric (sensor unavailable) is dropped. Active alerts stay
+        active until a value clears them. Returns the raised and cleared
+        alerts.
+        """
+        keys = self._rules_by_key.keys() if changed is None else changed
+        rules = [rule for key in keys for rule in self._rules_by_key.get(key, ())]
+        rules.extend(
+            self._rules_by_id[alert_id] for alert_id in self._pending
+            if self._rules_by_id[alert_id].key not in keys
+        )
+
+        raised: List[Dict[str, Any]] = []
+        cleared: List[Dict[str, Any]] = []
+        for rule in rules:
+            value = data.get(rule.key)
+            if not isinstance(value, (int, float)):
+                # Sensor nicht verfügbar: Entprellung beginnt mit dem nächsten Wert neu
+                self._pending.pop(rule.alert_id, None)
+                continue
+
+            if rule.alert_id in self._active:
+                if rule.cleared(value):
+                    cleared.append(self._active.pop(rule.alert_id))
+                continue
+
+            if not rule.violated(value):
+                self._pending.pop(rule.alert_id, None)
+                continue
+
+            since = self._pending.setdefault(rule.alert_id, now)
+            if now - since >= rule.min_duration:
+                del self._pending[rule.alert_id]
+                alert = {
+                    "id": rule.alert_id,
+                    "key": rule.key,
+                    "severity": rule.severity,
+                    "value": value,
+                    "threshold": rule.threshold,
+                    "message": rule.message.format(value=value, threshold=rule.threshold),
+                    "since": datetime.fromtimestamp(since, timezone.utc).isoformat(),
+                }
+                self._active[rule.alert_id] = alert
+                raised.append(alert)
+
+        if raised or cleared:
+            snapshot: Dict[str, List[Dict[str, Any]]] = {severity: [] for severity in SEVERITIES}
+            for alert in sorted(self._active.values(), key=lambda alert: alert["since"]):
+                snapshot.setdefault(alert["severity"], []).append(alert)
+            self._snapshot = snapshot
+        return raised, cleared
@@ -0,0 +1,114 @@
+"""Availability tracking and circuit breaker for ESPHome nodes."""
+import logging
+from typing import Any, Dict, Optional
+
+from .const import (
+    AVAILABILITY_GRACE_PERIOD,
+    AVAILABILITY_BACKOFF_INITIAL,
+    AVAILABILITY_BACKOFF_MAX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"  # Knoten erreichbar, normaler Betrieb
+STATE_OPEN = "open"  # Knoten offline, Updates und Aktoren pausiert
+STATE_HALF_OPEN = "half_open"  # Probe erfolgreich, nächstes Update entscheidet
+
+
+class DeviceAvailability:
+    """Circuit breaker for one ESPHome node.
+
+    Every update reports whether the node delivered any measurement. A node
+    that stays silent for ``grace_period`` seconds opens the breaker: the
+    coordinator stops reading, deriving and switching for it. While open,
+    a cheap probe (one entity state) runs after ``backoff`` seconds, which
+    doubles after every failed probe up to ``max_backoff``. A successful
+    probe half-opens the breaker; the next full update closes it again or
+    reopens it with the doubled backoff.
+
+    Times are monotonic seconds passed in by the caller.
+    """
+
+    def __init__(
+        self,
+        grace_period: float = AVAILABILITY_GRACE_PERIOD,
+        initial_backoff: float = AVAILABILITY_BACKOFF_INITIAL,
+        max_backoff: float = AVAILABILITY_BACKOFF_MAX,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.grace_period = grace_period
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.state = STATE_CLOSED
+        self.offline_since: Optional[float] = None
+        self.backoff = initial_backoff
+        self.next_probe = 0.0
+        self.trips = 0
+        self.failed_probes = 0
+
+    @property
+    def available(self) -> bool:
+        """Return False while the breaker is open."""
+        return self.state != STATE_OPEN
+
+    def record(self, online: bool, now: float) -> Optional[str]:
+        """Record the result of an update; return ``opened``/``closed`` on a transition."""
+        if online:
+            self.offline_since = None
+            if self.state == STATE_CLOSED:
+                return None
+            self.state = STATE_CLOSED
+            self.backoff = self.initial_backoff
+            return "closed"
+
+        if self.state == STATE_HALF_OPEN:
+            # Probe war ein Ausreißer: wieder öffnen, länger warten
+            self._open(now, min(self.backoff * 2, self.max_backoff))
+            return None
+        if self.state == STATE_OPEN:
+            return None
+        if self.offline_since is None:
+            self.offline_since = now
+        if now - self.offline_since < self.grace_period:
+            return None
+        self.trips += 1
+        self._open(now, self.initial_backoff)
+        return "opened"
+
+    def _open(self, now: float, backoff: float) -> None:
+        self.state = STATE_OPEN
+        self.backoff = backoff
+        self.next_probe = now + backoff
+
+    def grace_remaining(self, now: float) -> Optional[float]:
+        """Return the seconds until a silent node trips the breaker."""
+        if self.state != STATE_CLOSED or self.offline_since is None:
+            return None
+        return max(0.0, self.offline_since + self.grace_period - now)
+
+    def probe_due(self, now: float) -> bool:
+        """Return whether the open breaker may probe the node."""
+        return self.state == STATE_OPEN and now >= self.next_probe
+
+    def probe_now(self) -> None:
+        """Make the next probe due immediately (e.g. the node sent a state)."""
+        self.next_probe = 0.0
+
+    def probe_result(self, online: bool, now: float) -> None:
+        """Half-open after a successful probe, back off after a failed one."""
+        if online:
+            self.state = STATE_HALF_OPEN
+            return
+        self.failed_probes += 1
+        self._open(now, min(self.backoff * 2, self.max_backoff))
+
+    def as_dict(self, now: float) -> Dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "offline_for": round(now - self.offline_since, 1) if self.offline_since is not None else None,
+            "backoff": self.backoff,
+            "next_probe_in": round(max(0.0, self.next_probe - now), 1) if self.state == STATE_OPEN else None,
+            "trips": self.trips,
+            "failed_probes": self.failed_probes,
+        }
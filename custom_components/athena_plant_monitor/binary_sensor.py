@@ -1,6 +1,6 @@
 """Binary sensor platform for Athena Plant Monitor."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -10,10 +10,10 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DATA_COORDINATOR
 from .coordinator import AthenaPlantCoordinator
+from .entity import CONTEXT_ATTRIBUTES, AthenaPlantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -77,16 +77,19 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AthenaPlantBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class AthenaPlantBinarySensor(AthenaPlantEntity, BinarySensorEntity):
     """Representation of an Athena Plant Monitor binary sensor."""
 
+    _volatile_attributes = frozenset({"current_value", "deviation", "deviation_percent"})
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {"current_value", "target_value", "deviation", "deviation_percent"}
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_binary_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -128,7 +131,7 @@ class AthenaPlantBinarySensor(CoordinatorEntity, BinarySensorEntity):
                 return abs(ph - target) <= 0.3  # Within 0.3 pH units
         
         elif key == "vpd_in_range":
-            vpd = self.coordinator.data.get("vpd_calculated")
+            vpd = self.coordinator.data.get("vpd_control")
             target = self.coordinator.data.get("vpd_target")
             if vpd is not None and target is not None:
                 return abs(vpd - target) <= 0.2  # Within 0.2 kPa
@@ -136,10 +139,11 @@ class AthenaPlantBinarySensor(CoordinatorEntity, BinarySensorEntity):
         return None
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
         attrs = {}
         key = self.entity_description.key
+        shared = self._shared_attributes("growth_irrigation")
         
         # Add range check details
         if key.endswith("_in_range"):
@@ -156,13 +160,8 @@ class AthenaPlantBinarySensor(CoordinatorEntity, BinarySensorEntity):
                 })
         
         # Add irrigation state context
-        irrigation_state = self.coordinator.data.get("irrigation_state", {})
-        growth_config = self.coordinator.data.get("growth_config", {})
-        
-        attrs.update({
-            "growth_phase": growth_config.get("phase"),
-            "crop_steering": growth_config.get("steering"),
-            "current_irrigation_phase": irrigation_state.get("current_phase"),
-        })
+        if not attrs:
+            return shared
+        attrs.update(shared)
         
         return attrs
@@ -1,15 +1,15 @@
 """Button platform for Athena Plant Monitor."""
 import logging
-from typing import Any, Dict
+from typing import Any, Mapping
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DATA_COORDINATOR
 from .coordinator import AthenaPlantCoordinator
+from .entity import CONTEXT_ATTRIBUTES, AthenaPlantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +44,11 @@ BUTTON_DESCRIPTIONS = [
         name="Max VWC zurücksetzen",
         icon="mdi:restart",
     ),
+    ButtonEntityDescription(
+        key="reset_target_overrides",
+        name="Manuelle Zielwerte zurücksetzen",
+        icon="mdi:target-variant",
+    ),
     ButtonEntityDescription(
         key="calibrate_sensors",
         name="Sensoren kalibrieren",
@@ -72,16 +77,18 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AthenaPlantButton(CoordinatorEntity, ButtonEntity):
+class AthenaPlantButton(AthenaPlantEntity, ButtonEntity):
     """Representation of an Athena Plant Monitor button."""
 
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {"daily_water_total", "current_phase", "water_amount"}
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: ButtonEntityDescription,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_button_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -107,12 +114,13 @@ class AthenaPlantButton(CoordinatorEntity, ButtonEntity):
                 await self.coordinator.trigger_irrigation_shot(shot_size, duration)
                 
             elif key == "reset_daily_water":
-                self.coordinator._irrigation_state["daily_water_total"] = 0.0
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.reset_counters(reset_water=True)
                 
             elif key == "reset_max_vwc":
-                self.coordinator._irrigation_state["max_vwc_today"] = 0.0
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.reset_counters(reset_vwc=True)
+                
+            elif key == "reset_target_overrides":
+                await self.coordinator.clear_target_overrides()
                 
             elif key == "calibrate_sensors":
                 # Trigger sensor calibration (would call ESPHome calibration services)
@@ -121,9 +129,10 @@ class AthenaPlantButton(CoordinatorEntity, ButtonEntity):
                 
             elif key == "emergency_stop":
                 # Emergency stop: turn off all pumps and automation
-                self.coordinator._irrigation_state["automation_enabled"] = False
+                await self.coordinator.set_automation_enabled(False)
                 
-                # Turn off pump
+                # Cancel queued and running shots, then turn off pump
+                await self.coordinator.cancel_irrigation()
                 pump_entity = self.coordinator.get_entity_id("pump")
                 if pump_entity:
                     await self.hass.services.async_call(
@@ -138,7 +147,7 @@ class AthenaPlantButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.error(f"Error executing button action {key}: {err}")
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
         attrs = {}
         key = self.entity_description.key
@@ -165,10 +174,9 @@ class AthenaPlantButton(CoordinatorEntity, ButtonEntity):
                 attrs["water_amount"] = f"{(5.0 / 100) * substrate_size:.1f}L"
         
         # Add growth context
-        growth_config = self.coordinator.data.get("growth_config", {})
-        attrs.update({
-            "growth_phase": growth_config.get("phase"),
-            "crop_steering": growth_config.get("steering"),
-        })
+        shared = self._shared_attributes("growth")
+        if not attrs:
+            return shared
+        attrs.update(shared)
         
         return attrs
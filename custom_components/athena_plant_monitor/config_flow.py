@@ -18,21 +18,34 @@ from .const import (
     CONF_GROWTH_PHASE,
     CONF_CROP_STEERING,
     CONF_SUBSTRATE_SIZE,
-    CONF_VWC_TARGET,
-    CONF_EC_TARGET,
-    CONF_PH_TARGET,
-    CONF_VPD_TARGET,
     CONF_EXTERNAL_LIGHT_ENTITY,
     CONF_LIGHT_SCHEDULE_START,
     CONF_LIGHT_SCHEDULE_END,
+    CONF_EVENT_DRIVEN,
+    CONF_HISTORY_RETENTION,
+    CONF_VPD_REFERENCE,
+    CONF_SENSOR_FILTERING,
+    CONF_WRITE_SUPPRESSION,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_PROFILING,
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_LEAF_TEMPERATURE_ENTITY,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_SUBSTRATE_SIZE,
-    DEFAULT_VWC_TARGET,
-    DEFAULT_EC_TARGET,
-    DEFAULT_PH_TARGET,
-    DEFAULT_VPD_TARGET,
     DEFAULT_LIGHT_SCHEDULE_START,
     DEFAULT_LIGHT_SCHEDULE_END,
+    DEFAULT_EVENT_DRIVEN,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_VPD_REFERENCE,
+    DEFAULT_SENSOR_FILTERING,
+    DEFAULT_WRITE_SUPPRESSION,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_PROFILING,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     GROWTH_PHASES,
     CROP_STEERING_STRATEGIES,
 )
@@ -78,6 +91,7 @@ class AthenaPlantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(CONF_GROWTH_PHASE, default="vegetative"): vol.In(list(GROWTH_PHASES.keys())),
             vol.Optional(CONF_CROP_STEERING, default="vegetative"): vol.In(list(CROP_STEERING_STRATEGIES.keys())),
             vol.Optional(CONF_SUBSTRATE_SIZE, default=DEFAULT_SUBSTRATE_SIZE): vol.Coerce(float),
+            vol.Optional(CONF_EVENT_DRIVEN, default=DEFAULT_EVENT_DRIVEN): bool,
         })
 
         return self.async_show_form(
@@ -89,6 +103,16 @@ class AthenaPlantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def async_step_import(self, import_data: Dict[str, Any]) -> FlowResult:
+        """Create an entry from YAML (e.g. the tent simulator) without asking."""
+        device_id = import_data[CONF_DEVICE_ID]
+        await self.async_set_unique_id(device_id)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=f"Athena Plant Monitor ({device_id})",
+            data=import_data,
+        )
+
     async def async_step_light_control(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle light control configuration."""
         errors = {}
@@ -120,28 +144,6 @@ class AthenaPlantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
-    async def async_step_advanced(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
-        """Handle advanced configuration step."""
-        if user_input is not None:
-            # Merge with existing data
-            data = {**self._device_data, **user_input}
-            return self.async_create_entry(
-                title=f"Athena Plant Monitor ({self._device_id})",
-                data=data,
-            )
-
-        data_schema = vol.Schema({
-            vol.Optional(CONF_VWC_TARGET, default=DEFAULT_VWC_TARGET): vol.Coerce(float),
-            vol.Optional(CONF_EC_TARGET, default=DEFAULT_EC_TARGET): vol.Coerce(float),
-            vol.Optional(CONF_PH_TARGET, default=DEFAULT_PH_TARGET): vol.Coerce(float),
-            vol.Optional(CONF_VPD_TARGET, default=DEFAULT_VPD_TARGET): vol.Coerce(float),
-        })
-
-        return self.async_show_form(
-            step_id="advanced",
-            data_schema=data_schema,
-        )
-
     async def _async_discover_esphome_devices(self) -> Dict[str, str]:
         """Discover ESPHome devices that could be plant monitors."""
         discovered = {}
@@ -223,11 +225,16 @@ class AthenaPlantOptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
 
     async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
-        """Manage the options."""
+        """Manage the options (applied by reloading the entry)."""
         if user_input is not None:
+            # Leeres Feld entfernt einen früher gesetzten Blatttemperatur-Sensor
+            user_input[CONF_LEAF_TEMPERATURE_ENTITY] = user_input.get(CONF_LEAF_TEMPERATURE_ENTITY) or None
             return self.async_create_entry(title="", data=user_input)
 
-        current_config = self.config_entry.data
+        # Optionen überschreiben die Werte aus der Ersteinrichtung. Wachstumsphase,
+        # Crop Steering, Substratgröße und Zielwerte gehören nicht hierher: sie
+        # werden über die Select-/Number-Entitäten gesetzt und gespeichert.
+        current_config = {**self.config_entry.data, **self.config_entry.options}
         
         data_schema = vol.Schema({
             vol.Optional(
@@ -235,33 +242,45 @@ class AthenaPlantOptionsFlow(config_entries.OptionsFlow):
                 default=current_config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
             ): vol.Coerce(int),
             vol.Optional(
-                CONF_GROWTH_PHASE,
-                default=current_config.get(CONF_GROWTH_PHASE, "vegetative")
-            ): vol.In(list(GROWTH_PHASES.keys())),
+                CONF_HISTORY_RETENTION,
+                default=current_config.get(CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=168)),
+            vol.Optional(
+                CONF_VPD_REFERENCE,
+                default=current_config.get(CONF_VPD_REFERENCE, DEFAULT_VPD_REFERENCE)
+            ): vol.In(["air", "leaf"]),
+            vol.Optional(
+                CONF_LEAF_TEMPERATURE_ENTITY,
+                description={"suggested_value": current_config.get(CONF_LEAF_TEMPERATURE_ENTITY)}
+            ): str,
+            vol.Optional(
+                CONF_SENSOR_FILTERING,
+                default=current_config.get(CONF_SENSOR_FILTERING, DEFAULT_SENSOR_FILTERING)
+            ): bool,
             vol.Optional(
-                CONF_CROP_STEERING,
-                default=current_config.get(CONF_CROP_STEERING, "vegetative")
-            ): vol.In(list(CROP_STEERING_STRATEGIES.keys())),
+                CONF_WRITE_SUPPRESSION,
+                default=current_config.get(CONF_WRITE_SUPPRESSION, DEFAULT_WRITE_SUPPRESSION)
+            ): bool,
             vol.Optional(
-                CONF_SUBSTRATE_SIZE,
-                default=current_config.get(CONF_SUBSTRATE_SIZE, DEFAULT_SUBSTRATE_SIZE)
-            ): vol.Coerce(float),
+                CONF_LONG_TERM_STATISTICS,
+                default=current_config.get(CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS)
+            ): bool,
             vol.Optional(
-                CONF_VWC_TARGET,
-                default=current_config.get(CONF_VWC_TARGET, DEFAULT_VWC_TARGET)
-            ): vol.Coerce(float),
+                CONF_PROFILING,
+                default=current_config.get(CONF_PROFILING, DEFAULT_PROFILING)
+            ): bool,
             vol.Optional(
-                CONF_EC_TARGET,
-                default=current_config.get(CONF_EC_TARGET, DEFAULT_EC_TARGET)
-            ): vol.Coerce(float),
+                CONF_ADAPTIVE_INTERVAL,
+                default=current_config.get(CONF_ADAPTIVE_INTERVAL, DEFAULT_ADAPTIVE_INTERVAL)
+            ): bool,
             vol.Optional(
-                CONF_PH_TARGET,
-                default=current_config.get(CONF_PH_TARGET, DEFAULT_PH_TARGET)
-            ): vol.Coerce(float),
+                CONF_MIN_UPDATE_INTERVAL,
+                default=current_config.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
             vol.Optional(
-                CONF_VPD_TARGET,
-                default=current_config.get(CONF_VPD_TARGET, DEFAULT_VPD_TARGET)
-            ): vol.Coerce(float),
+                CONF_MAX_UPDATE_INTERVAL,
+                default=current_config.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL)
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
         })
 
         return self.async_show_form(
@@ -18,29 +18,75 @@ CONF_UPDATE_INTERVAL = "update_interval"
 CONF_GROWTH_PHASE = "growth_phase"
 CONF_CROP_STEERING = "crop_steering"
 CONF_SUBSTRATE_SIZE = "substrate_size"
-CONF_VWC_TARGET = "vwc_target"
-CONF_EC_TARGET = "ec_target"
-CONF_PH_TARGET = "ph_target"
-CONF_VPD_TARGET = "vpd_target"
+CONF_EVENT_DRIVEN = "event_driven"
+CONF_HUB_MODE = "hub_mode"
+CONF_SIMULATOR = "simulator"
+CONF_SIMULATOR_TENTS = "tents"
+CONF_SIMULATOR_TIME_SCALE = "time_scale"
+CONF_HISTORY_RETENTION = "history_retention"
+CONF_VPD_REFERENCE = "vpd_reference"
+CONF_SENSOR_FILTERING = "sensor_filtering"
+CONF_WRITE_SUPPRESSION = "write_suppression"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_PROFILING = "profiling"
+CONF_ADAPTIVE_INTERVAL = "adaptive_interval"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
 
 # Configuration Keys für externe Entitäten
 CONF_EXTERNAL_LIGHT_ENTITY = "external_light_entity"
 CONF_LIGHT_SCHEDULE_START = "light_schedule_start"
 CONF_LIGHT_SCHEDULE_END = "light_schedule_end"
+CONF_LEAF_TEMPERATURE_ENTITY = "leaf_temperature_entity"
 
 # Defaults
 DEFAULT_UPDATE_INTERVAL = 30  # seconds
 DEFAULT_SUBSTRATE_SIZE = 10.0  # liters
-DEFAULT_VWC_TARGET = 75.0  # percent
-DEFAULT_EC_TARGET = 4.0  # ppm
-DEFAULT_PH_TARGET = 6.0
-DEFAULT_VPD_TARGET = 1.0  # kPa
 DEFAULT_LIGHT_SCHEDULE_START = "06:00"
 DEFAULT_LIGHT_SCHEDULE_END = "22:00"
+DEFAULT_EVENT_DRIVEN = True
+DEFAULT_SAFETY_POLL_INTERVAL = 300  # seconds - Sicherheits-Polling im Event-Modus
+DEFAULT_VPD_REFERENCE = "air"  # "air" oder "leaf" - welcher VPD gegen das Ziel geregelt wird
+DEFAULT_LEAF_TEMP_OFFSET = -2.0  # °C
+DEFAULT_HISTORY_RETENTION = 24  # hours - Verlauf im Speicher
+DEFAULT_SENSOR_FILTERING = True
+DEFAULT_WRITE_SUPPRESSION = True
+DEFAULT_LONG_TERM_STATISTICS = True
+DEFAULT_PROFILING = False
+DEFAULT_ADAPTIVE_INTERVAL = True
+DEFAULT_MIN_UPDATE_INTERVAL = 5  # seconds - P1-Sättigung und laufende Schüsse
+DEFAULT_MAX_UPDATE_INTERVAL = 300  # seconds - nächtliche P3-Rücktrocknung
+HISTORY_RESOLUTION = 60  # seconds - ein Messpunkt pro Minute und Sensor
+DRYBACK_FORECAST_WINDOW = 7200  # seconds - Fenster für die Rücktrocknungsprognose
+EVENT_COALESCE_DELAY = 0.1  # seconds - bündelt gleichzeitige Zustandsänderungen
+MAX_PARALLEL_SERVICE_CALLS = 10  # Geräte, die ein Service-Aufruf gleichzeitig bearbeitet
+ACTUATOR_MIN_INTERVAL = 5  # seconds - Mindestabstand der Schaltbatches je Gerät
+
+# Änderungsraten (pro Stunde), ab denen das adaptive Intervall verkürzt wird
+ADAPTIVE_RATE_THRESHOLDS = {
+    "vwc": 6.0,  # %/h
+    "temperature": 3.0,  # °C/h
+}
+ADAPTIVE_RATE_WINDOW = 10  # minutes - Fenster für die Trendberechnung
+
+# Circuit Breaker für offline ESPHome-Knoten
+AVAILABILITY_GRACE_PERIOD = 60  # seconds - ohne Messwerte, bevor der Knoten als offline gilt
+AVAILABILITY_BACKOFF_INITIAL = 30  # seconds - erste Probe nach dem Öffnen
+AVAILABILITY_BACKOFF_MAX = 600  # seconds - längster Abstand zwischen zwei Proben
+AVAILABILITY_PROBE_KEYS = ("vwc", "temperature", "humidity")  # mindestens einer muss einen Wert liefern
 
 # Data storage
 DATA_COORDINATOR = "coordinator"
 DATA_CONFIG = "config"
+DATA_HUB = "hub"
+DATA_SIMULATOR = "simulator"
+DATA_SIMULATOR_STOP = "simulator_stop"
+DATA_REGISTRY = "registry"
+DATA_IRRIGATION = "irrigation"
+
+# Storage
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds - bündelt mehrere Änderungen zu einem Schreibvorgang
 
 # ESPHome Entity IDs
 ESPHOME_ENTITIES = {
@@ -53,6 +99,7 @@ ESPHOME_ENTITIES = {
     "ph_substrate": "sensor.{device_id}_ph_substrate",
     "temp_substrate": "sensor.{device_id}_temp_substrate",
     "co2": "sensor.{device_id}_co2",
+    "leaf_temperature": "sensor.{device_id}_leaf_temperature",  # optional, IR-Blattsensor
     "water_level": "sensor.{device_id}_water_level",
     
     # Actuators (ESPHome)
@@ -74,10 +121,48 @@ ESPHOME_ENTITIES = {
     "co2_outside": "sensor.{device_id}_co2_outside",
 }
 
-# Configuration Keys für externe Entitäten
-CONF_EXTERNAL_LIGHT_ENTITY = "external_light_entity"
-CONF_LIGHT_SCHEDULE_START = "light_schedule_start"
-CONF_LIGHT_SCHEDULE_END = "light_schedule_end"
+# Numerische ESPHome-Werte (werden als float eingelesen)
+NUMERIC_SENSOR_KEYS = frozenset({
+    "temperature", "humidity", "vwc", "ec_substrate", "ph_substrate",
+    "temp_substrate", "co2", "leaf_temperature", "water_level", "pressure",
+    "temperature_outside", "humidity_outside", "pressure_outside", "co2_outside",
+})
+
+# Rauschfilter je Sensorwert (Reihenfolge: Hampel -> Median -> Ratenbegrenzung -> EMA)
+# hampel: Fenster (Samples), min_deviation: kleinste Abweichung, die als Ausreißer gilt
+# median: Fenster (Samples), max_rate: Einheiten pro Minute, ema: Zeitkonstante (Sekunden)
+SENSOR_FILTERS = {
+    # VWC ohne EMA: Peak-Erkennung und P1/P2 brauchen die Sprünge der Bewässerung
+    "vwc": {"hampel": 5, "min_deviation": 2.0, "max_rate": 20.0},
+    "ec_substrate": {"hampel": 5, "min_deviation": 0.3, "median": 3},
+    "ph_substrate": {"hampel": 5, "min_deviation": 0.2, "median": 3},
+    "temp_substrate": {"ema": 120},
+    "temperature": {"hampel": 5, "min_deviation": 1.0, "ema": 60},
+    "humidity": {"hampel": 5, "min_deviation": 3.0, "ema": 60},
+    "leaf_temperature": {"hampel": 5, "min_deviation": 1.0, "ema": 60},
+    "co2": {"median": 3, "ema": 120},
+}
+
+# Mindeständerung, ab der eine Entität ihren Zustand neu schreibt
+# (Zeitstempel-Sensoren: Sekunden); nicht aufgeführte Werte: jede Änderung
+SIGNIFICANCE_THRESHOLDS = {
+    "temperature": 0.1,
+    "humidity": 0.5,
+    "pressure": 0.5,
+    "co2": 10.0,
+    "vwc": 0.1,
+    "ec_substrate": 0.02,
+    "ph_substrate": 0.02,
+    "temp_substrate": 0.1,
+    "water_level": 0.5,
+    "vpd_calculated": 0.01,
+    "vpd_leaf": 0.01,
+    "dryback_percent": 0.1,
+    "dryback_rate": 0.05,
+    "p2_trigger_eta": 300,
+    "dryback_target_eta": 300,
+    "max_vwc_today": 0.1,
+}
 
 # Day/Night Configuration (ohne Lichtsensor)
 DAY_NIGHT_CONFIG = {
@@ -105,6 +190,7 @@ GROWTH_PHASES = {
         "humidity_target_night": 70.0,
         "co2_target_night": 1000,
         "dryback_target": 35.0,
+        "leaf_temp_offset": -1.5,  # °C - Blatt kühler als Luft (LED)
     },
     "flowering_stretch": {
         "name": "Flowering Stretch",
@@ -122,6 +208,7 @@ GROWTH_PHASES = {
         "humidity_target_night": 65.0,
         "co2_target_night": 1200,
         "dryback_target": 40.0,
+        "leaf_temp_offset": -2.0,  # °C - Blatt kühler als Luft (LED)
     },
     "flowering_bulk": {
         "name": "Flowering Bulk",
@@ -139,6 +226,7 @@ GROWTH_PHASES = {
         "humidity_target_night": 60.0,
         "co2_target_night": 1300,
         "dryback_target": 45.0,
+        "leaf_temp_offset": -2.0,  # °C - Blatt kühler als Luft (LED)
     },
     "flowering_finish": {
         "name": "Flowering Finish",
@@ -156,6 +244,7 @@ GROWTH_PHASES = {
         "humidity_target_night": 55.0,
         "co2_target_night": 1000,
         "dryback_target": 50.0,
+        "leaf_temp_offset": -2.5,  # °C - Blatt kühler als Luft (LED)
     },
 }
 
@@ -204,6 +293,7 @@ IRRIGATION_PHASES = {
         "description": "Peak VWC Target halten",
         "trigger_dryback": 5.0,
         "shot_size_percent": 2.5,
+        "min_interval_minutes": 30,
     },
     "P3": {
         "name": "Overnight Dryback",
@@ -229,6 +319,23 @@ SENSOR_UNITS = {
     "dryback_percent": "%",
 }
 
+# Eigene Langzeitstatistiken (stündlich importiert, 5-Minuten-Werte im Speicher)
+# Mittelwert/Min/Max: Schlüssel -> Einheit
+STATISTICS_MEAN_KEYS = {
+    "vwc": "%",
+    "ec_substrate": "ppm",
+    "temperature": "°C",
+    "humidity": "%",
+    "vpd_calculated": "kPa",
+    "vpd_leaf": "kPa",
+    "dryback_percent": "%",
+    "dryback_rate": "%/h",
+}
+# Summen (Tageszähler -> fortlaufende Summe): Schlüssel -> Einheit
+STATISTICS_SUM_KEYS = {
+    "daily_water_total": "L",
+}
+
 # Alert Thresholds
 ALERT_THRESHOLDS = {
     "vwc_critical_low": 50.0,
@@ -243,6 +350,17 @@ ALERT_THRESHOLDS = {
     "vpd_critical_high": 2.0,
 }
 
+# Hysterese je Messgröße: ein Alert endet erst, wenn der Wert um diesen
+# Betrag wieder im gültigen Bereich liegt
+ALERT_HYSTERESIS = {
+    "vwc": 2.0,
+    "ec": 0.3,
+    "ph": 0.1,
+    "temp": 1.0,
+    "vpd": 0.1,
+}
+ALERT_MIN_DURATION = 60  # seconds - Verletzung muss so lange anhalten (Entprellung)
+
 # Device Classes
 DEVICE_CLASSES = {
     "temperature": "temperature",
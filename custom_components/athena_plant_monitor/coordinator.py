@@ -1,17 +1,57 @@
 """Data update coordinator for Athena Plant Monitor."""
-import asyncio
 import logging
+import time
+from collections import ChainMap
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Mapping, Optional, Set
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     ESPHOME_ENTITIES,
+    NUMERIC_SENSOR_KEYS,
+    CONF_EVENT_DRIVEN,
+    DEFAULT_EVENT_DRIVEN,
+    DEFAULT_SAFETY_POLL_INTERVAL,
+    EVENT_COALESCE_DELAY,
+    CONF_HISTORY_RETENTION,
+    DEFAULT_HISTORY_RETENTION,
+    HISTORY_RESOLUTION,
+    DRYBACK_FORECAST_WINDOW,
+    CONF_LEAF_TEMPERATURE_ENTITY,
+    CONF_VPD_REFERENCE,
+    DEFAULT_LEAF_TEMP_OFFSET,
+    DEFAULT_VPD_REFERENCE,
+    CONF_SENSOR_FILTERING,
+    DEFAULT_SENSOR_FILTERING,
+    SENSOR_FILTERS,
+    CONF_WRITE_SUPPRESSION,
+    DEFAULT_WRITE_SUPPRESSION,
+    CONF_LONG_TERM_STATISTICS,
+    DEFAULT_LONG_TERM_STATISTICS,
+    CONF_PROFILING,
+    DEFAULT_PROFILING,
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    ADAPTIVE_RATE_THRESHOLDS,
+    ADAPTIVE_RATE_WINDOW,
+    AVAILABILITY_PROBE_KEYS,
     GROWTH_PHASES,
     CROP_STEERING_STRATEGIES,
     IRRIGATION_PHASES,
@@ -20,29 +60,89 @@ from .const import (
     VENTILATION_MODES,
     DAY_NIGHT_CONFIG,
 )
+from .actuators import ActuatorDispatcher
+from .alerts import AlertEngine
+from .availability import DeviceAvailability
+from .dependency_graph import DerivationGraph
+from .filters import SensorFilters
+from .forecast import DrybackEstimator
+from .history import SensorHistory
+from .profiling import NO_PROFILING, UpdateProfiler
+from .statistics import StatisticsAggregator, async_import_statistics
+from .store import AthenaPlantStore
+from .irrigation import IrrigationExecutor, IrrigationJob, async_get_executor, shot_duration
+from .photoperiod import Photoperiod
+from .polling import AdaptiveInterval
+from . import psychrometrics
+from .scheduler import IrrigationScheduler
+from .targets import (
+    DEFAULT_TARGET_TABLE,
+    TARGET_OVERRIDE_FIELDS,
+    TargetProfile,
+    build_target_table,
+    lookup_targets,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+EXTERNAL_LIGHT_KEY = "external_light"
+LIGHT_KEYS = frozenset({"led_panel", "grow_light_switch", EXTERNAL_LIGHT_KEY})
+
+# Pseudo-Schlüssel für Konfigurationseingaben des Abhängigkeitsgraphen
+INPUT_GROWTH_CONFIG = "config:growth"
+INPUT_IRRIGATION_STATE = "config:irrigation"
+
 
 class AthenaPlantCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from ESPHome entities."""
 
-    def __init__(self, hass: HomeAssistant, device_id: str, update_interval: int, config_data: dict = None) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_id: str,
+        update_interval: int,
+        config_data: dict = None,
+        hub_mode: bool = False,
+    ) -> None:
+        """Initialize the coordinator.
+
+        In hub mode the coordinator has no timer of its own; the
+        AthenaPlantHub refreshes all devices together.
+        """
+        config_data = config_data or {}
+        base_interval = update_interval
+        event_driven = config_data.get(CONF_EVENT_DRIVEN, DEFAULT_EVENT_DRIVEN)
+        if event_driven:
+            # Im Event-Modus ist Polling nur noch ein langsames Sicherheitsnetz
+            update_interval = max(update_interval, DEFAULT_SAFETY_POLL_INTERVAL)
+        
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=None if hub_mode else timedelta(seconds=update_interval),
         )
         self.device_id = device_id
+        self.hub_mode = hub_mode
         self._entity_ids = {}
-        self._config_data = config_data or {}
+        self._key_by_entity_id: Dict[str, str] = {}
+        self._config_data = config_data
+        self._event_driven = event_driven
+        self._pending_keys: Set[str] = set()
+        self._unsub_flush: Optional[Callable[[], None]] = None
+        self._dirty_inputs: Set[str] = set()
+        self._unsub_irrigation: Optional[Callable[[], None]] = None
+        self._unsub_alert_check: Optional[Callable[[], None]] = None
+        self._unsub_availability_check: Optional[Callable[[], None]] = None
         self._external_light_entity = self._config_data.get("external_light_entity")
         self._light_schedule_start = self._config_data.get("light_schedule_start", "06:00")
         self._light_schedule_end = self._config_data.get("light_schedule_end", "22:00")
+        self._photoperiod = Photoperiod(self._light_schedule_start, self._light_schedule_end)
+        self._leaf_temperature_entity = self._config_data.get(CONF_LEAF_TEMPERATURE_ENTITY)
+        self._vpd_reference = self._config_data.get(CONF_VPD_REFERENCE, DEFAULT_VPD_REFERENCE)
         self._irrigation_state = {
             "current_phase": "P3",
+            "phase_started": None,
             "last_irrigation": None,
             "daily_water_total": 0.0,
             "max_vwc_today": 0.0,
@@ -55,6 +155,19 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
             "substrate_size": 10.0,
         }
         
+        # P0-P3 Zustandsautomat (weckt nur zum nächsten eigenen Ereignis)
+        self._scheduler = IrrigationScheduler(
+            hass,
+            self._irrigation_state,
+            self._async_fire_scheduled_shot,
+            self._async_irrigation_changed,
+            self._async_scheduler_refresh,
+        )
+        
+        # Vorberechnete Zielwerte je (Phase, Steering, Tag/Nacht)
+        self._target_overrides: Dict[str, float] = {}
+        self._target_table = DEFAULT_TARGET_TABLE
+        
         # Climate control state
         self._climate_control = {
             "auto_enabled": False,
@@ -64,274 +177,900 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
             "last_ventilation_mode": "normal",
         }
         
+        # Verlauf der Sensorwerte im Speicher (für Trends ohne Recorder-Abfragen)
+        self.history = SensorHistory(
+            config_data.get(CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION) * 3600,
+            HISTORY_RESOLUTION,
+        )
+        
+        # Rauschfilter zwischen Einlesen und Ableitung (Rohwerte bleiben erhalten)
+        self._filters: Optional[SensorFilters] = None
+        if config_data.get(CONF_SENSOR_FILTERING, DEFAULT_SENSOR_FILTERING):
+            self._filters = SensorFilters(SENSOR_FILTERS)
+        
+        # Entitäten schreiben ihren Zustand nur bei signifikanter Änderung
+        self.suppress_redundant_writes = config_data.get(CONF_WRITE_SUPPRESSION, DEFAULT_WRITE_SUPPRESSION)
+        self.write_stats = {"written": 0, "suppressed": 0}
+        
+        # Aktoren: Soll-/Ist-Vergleich, ein paralleler Batch je Änderung
+        self._actuators = ActuatorDispatcher(hass)
+        
+        # Alerts: Regeln je Datenschlüssel indiziert, mit Hysterese und Entprellung
+        self._alerts = AlertEngine()
+        
+        # Eigene 5-Minuten-/Stundenaggregate als Langzeitstatistik
+        self.statistics: Optional[StatisticsAggregator] = None
+        if config_data.get(CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS):
+            self.statistics = StatisticsAggregator()
+        
+        # Abfrageintervall nach Phase, Tag/Nacht und Trends; Zustandsereignisse
+        # werden immer nach EVENT_COALESCE_DELAY verarbeitet, im Event-Modus
+        # bleibt das Polling ein festes Sicherheitsnetz, im Hub-Modus gilt der
+        # gemeinsame Takt
+        self._adaptive_interval: Optional[AdaptiveInterval] = None
+        if (
+            config_data.get(CONF_ADAPTIVE_INTERVAL, DEFAULT_ADAPTIVE_INTERVAL)
+            and not event_driven
+            and not hub_mode
+        ):
+            self._adaptive_interval = AdaptiveInterval(
+                base_interval,
+                config_data.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL),
+                config_data.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL),
+            )
+        
+        # Circuit Breaker: ein stummer Knoten pausiert Updates und Aktoren
+        self.availability = DeviceAvailability()
+        self._configured_interval = self.update_interval
+        
+        # Optionale Laufzeitmessung je Stufe (ohne Profiler keine Zusatzkosten)
+        self.profiler: Optional[UpdateProfiler] = None
+        if config_data.get(CONF_PROFILING, DEFAULT_PROFILING):
+            self.profiler = UpdateProfiler()
+        
+        # Prognose der Rücktrocknung (Rate, Zeitpunkt P2-Trigger / Dryback-Ziel)
+        self._dryback_estimator = DrybackEstimator(DRYBACK_FORECAST_WINDOW)
+        
+        # Persistenter Zustand (Tageswasser, Max VWC, Konfiguration)
+        self._store = AthenaPlantStore(hass, device_id)
+        
         # Build entity ID mapping
         self._build_entity_mapping()
+        
+        # Abhängigkeitsgraph der abgeleiteten Werte
+        self._derivations = self._build_derivation_graph()
+        
+        # Verlaufsschlüssel ohne Quelle würden nie befüllt
+        unknown = set(self.history.keys) - set(self._entity_ids) - self._derivations.outputs
+        if unknown:
+            _LOGGER.error(f"History keys without a source on {self.device_id}: {', '.join(sorted(unknown))}")
+
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information shared by all entities of this device."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.device_id)},
+            name=f"Athena Plant Monitor ({self.device_id})",
+            manufacturer="Athena",
+            model="Plant Monitor",
+        )
+
+    @property
+    def tracked_entity_ids(self) -> List[str]:
+        """Return the entity IDs of all mapped ESPHome entities."""
+        return list(self._entity_ids.values())
 
     def _build_entity_mapping(self) -> None:
         """Build mapping of logical names to actual entity IDs."""
         for key, pattern in ESPHOME_ENTITIES.items():
             entity_id = pattern.format(device_id=self.device_id)
             self._entity_ids[key] = entity_id
+            self._key_by_entity_id[entity_id] = key
+        
+        if self._external_light_entity:
+            self._key_by_entity_id[self._external_light_entity] = EXTERNAL_LIGHT_KEY
+        
+        # Externer IR-Blattsensor statt des ESPHome-Sensors
+        if self._leaf_temperature_entity:
+            self._key_by_entity_id.pop(self._entity_ids["leaf_temperature"], None)
+            self._entity_ids["leaf_temperature"] = self._leaf_temperature_entity
+            self._key_by_entity_id[self._leaf_temperature_entity] = "leaf_temperature"
+
+    def _build_derivation_graph(self) -> DerivationGraph:
+        """Declare which inputs every derived value depends on."""
+        graph = DerivationGraph()
+        graph.add(
+            "day_cycle",
+            ("led_panel", "grow_light_switch", EXTERNAL_LIGHT_KEY),
+            ("is_day_cycle",),
+            self._derive_day_cycle,
+            volatile=True,  # Zeitplan-Fallback hängt von der Uhrzeit ab
+        )
+        graph.add(
+            "vpd_inside",
+            ("temperature", "humidity", "leaf_temperature", INPUT_GROWTH_CONFIG),
+            ("vpd_calculated", "vpd_leaf", "vpd_control"),
+            self._derive_vpd_inside,
+        )
+        graph.add(
+            "vpd_outside",
+            ("temperature_outside", "humidity_outside"),
+            ("vpd_outside",),
+            self._derive_vpd_outside,
+        )
+        graph.add(
+            "temperature_differential",
+            ("temperature", "temperature_outside"),
+            ("temperature_differential",),
+            self._derive_temperature_differential,
+        )
+        graph.add(
+            "humidity_differential",
+            ("humidity", "humidity_outside"),
+            ("humidity_differential",),
+            self._derive_humidity_differential,
+        )
+        graph.add(
+            "climate_targets",
+            (INPUT_GROWTH_CONFIG, "is_day_cycle"),
+            ("vpd_target", "temperature_target", "humidity_target", "co2_target"),
+            self._derive_climate_targets,
+        )
+        graph.add(
+            "climate_strategy",
+            (
+                "temperature", "humidity", "vpd_control",
+                "temperature_outside", "humidity_outside", "vpd_outside",
+                "vpd_target", "temperature_target", "humidity_target",
+            ),
+            ("climate_strategy", "ventilation_recommendation"),
+            self._derive_climate_strategy,
+        )
+        graph.add(
+            "dryback",
+            ("vwc", INPUT_IRRIGATION_STATE),
+            ("dryback_percent",),
+            self._derive_dryback,
+        )
+        graph.add(
+            "dryback_forecast",
+            ("vwc", "dryback_target", INPUT_IRRIGATION_STATE),
+            ("dryback_rate", "p2_trigger_eta", "dryback_target_eta"),
+            self._derive_dryback_forecast,
+        )
+        graph.add(
+            "substrate_targets",
+            (INPUT_GROWTH_CONFIG,),
+            ("vwc_target", "ec_target", "ph_target", "dryback_target"),
+            self._derive_substrate_targets,
+        )
+        return graph
+
+    def _mark_dirty(self, *inputs: str) -> None:
+        """Flag configuration inputs whose dependents must be recomputed."""
+        self._dirty_inputs.update(inputs)
+
+    @staticmethod
+    def _parse_state(key: str, state: Optional[State]) -> Any:
+        """Convert a Home Assistant state into the coordinator value for a key."""
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        
+        if key in NUMERIC_SENSOR_KEYS:
+            try:
+                return float(state.state)
+            except (ValueError, TypeError):
+                return state.state
+        
+        return state.state
+
+    @callback
+    def async_start_listeners(self) -> Callable[[], None]:
+        """Subscribe to state changes of all mapped entities.
+
+        Returns a callback that removes the subscription again.
+        """
+        if not self._event_driven:
+            return lambda: None
+        
+        unsub_state = async_track_state_change_event(
+            self.hass, list(self._key_by_entity_id), self._handle_state_event
+        )
+        
+        @callback
+        def _async_stop() -> None:
+            unsub_state()
+            if self._unsub_flush:
+                self._unsub_flush()
+                self._unsub_flush = None
+            self._pending_keys.clear()
+        
+        return _async_stop
+
+    @callback
+    def async_start_day_rollover(self) -> Callable[[], None]:
+        """Reset the daily counters at midnight.
+
+        Returns a callback that removes the timer again.
+        """
+        return async_track_time_change(self.hass, self._async_day_rollover, hour=0, minute=0, second=0)
+
+    async def _async_day_rollover(self, _now: datetime) -> None:
+        """Start a new day: the same reset as loading a state of a previous day."""
+        _LOGGER.debug(f"Day rollover on {self.device_id}")
+        await self.reset_counters(reset_water=True, reset_vwc=True)
+
+    @callback
+    def _handle_state_event(self, event: Event) -> None:
+        """Collect a changed entity and schedule a coalesced update."""
+        key = self._key_by_entity_id.get(event.data["entity_id"])
+        if key is None:
+            return
+        
+        if not self.availability.available:
+            # Offline: nur ein wieder gemeldeter Messwert löst eine Probe aus
+            new_state = event.data.get("new_state")
+            if key in AVAILABILITY_PROBE_KEYS and self._parse_state(key, new_state) is not None:
+                self.availability.probe_now()
+                self.hass.async_create_task(self.async_request_refresh())
+            return
+        
+        if key in LIGHT_KEYS:
+            self._photoperiod.invalidate()
+        
+        self._pending_keys.add(key)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, EVENT_COALESCE_DELAY, self._async_flush_pending
+            )
+
+    @callback
+    def _async_flush_pending(self, _now: datetime) -> None:
+        """Apply all collected state changes and push them to the entities."""
+        self._unsub_flush = None
+        changed = self._pending_keys
+        self._pending_keys = set()
+        
+        profiler = self.profiler
+        if self.data is None or not changed:
+            if profiler is not None:
+                profiler.skipped += 1
+            return
+        if profiler is not None:
+            profiler.coalesced += len(changed) - 1
+        
+        with self._profile("event", update=True):
+            try:
+                data = dict(self.data)
+                for key in changed:
+                    if key == EXTERNAL_LIGHT_KEY:
+                        continue
+                    data[key] = self._parse_state(key, self.hass.states.get(self._entity_ids[key]))
+                if not self._record_availability(data):
+                    self.async_set_update_error(UpdateFailed(f"{self.device_id} is offline"))
+                    return
+                with self._profile("filter"):
+                    self._filter_values(data, list(changed))
+                
+                with self._profile("derive"):
+                    derived = self._calculate_derived_values(data, changed)
+                self._finalize_data(data, changed | derived)
+            except Exception as err:
+                _LOGGER.error("Error processing state change for %s: %s", self.device_id, err)
+                return
+            
+            # Setzt auch den Sicherheits-Polling-Timer zurück
+            self.async_set_updated_data(data)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from ESPHome entities."""
+        if not self.refresh_allowed():
+            raise UpdateFailed(f"{self.device_id} is offline, next probe in {self.availability.backoff:.0f}s")
         try:
-            data = {}
-            
-            # Fetch all sensor states
-            for key, entity_id in self._entity_ids.items():
-                state = self.hass.states.get(entity_id)
-                if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                    try:
-                        # Try to convert to float for sensors
-                        if key in ["temperature", "humidity", "vwc", "ec_substrate", "ph_substrate", 
-                                  "temp_substrate", "co2", "water_level", "pressure",
-                                  "temperature_outside", "humidity_outside", "pressure_outside", "co2_outside"]:
-                            data[key] = float(state.state)
-                        else:
-                            data[key] = state.state
-                    except (ValueError, TypeError):
-                        data[key] = state.state
-                else:
-                    data[key] = None
-                    
-            # Calculate derived values
-            data.update(self._calculate_derived_values(data))
-            
-            # Update irrigation state
-            self._update_irrigation_state(data)
-            
-            # Check for alerts
-            alerts = self._check_alerts(data)
-            data["alerts"] = alerts
-            
-            # Add configuration
-            data["growth_config"] = self._growth_config.copy()
-            data["irrigation_state"] = self._irrigation_state.copy()
-            data["climate_control"] = self._climate_control.copy()
-            
-            return data
-            
+            return self.process_states(self.read_states())
+        except UpdateFailed:
+            raise
         except Exception as err:
             _LOGGER.error("Error fetching data: %s", err)
             raise UpdateFailed(f"Error communicating with ESPHome devices: {err}")
 
-    def _calculate_derived_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate VPD, dryback, and other derived values."""
-        derived = {}
+    def read_states(self) -> Dict[str, Any]:
+        """Read the current values of all mapped ESPHome entities."""
+        states_get = self.hass.states.get
+        parse = self._parse_state
+        with self._profile("read"):
+            return {
+                key: parse(key, states_get(entity_id))
+                for key, entity_id in self._entity_ids.items()
+            }
+
+    def refresh_allowed(self) -> bool:
+        """Return whether a full refresh should run.
+
+        While the breaker is open only a due probe of a single entity runs;
+        a successful probe half-opens the breaker and allows the refresh.
+        """
+        availability = self.availability
+        if availability.available:
+            return True
+        now = time.monotonic()
+        if not availability.probe_due(now):
+            return False
+        states_get = self.hass.states.get
+        online = any(
+            self._parse_state(key, states_get(self._entity_ids[key])) is not None
+            for key in AVAILABILITY_PROBE_KEYS
+        )
+        availability.probe_result(online, now)
+        if not online:
+            self._set_backoff_interval()
+        return online
+
+    def _record_availability(self, data: Dict[str, Any]) -> bool:
+        """Track whether the node delivered any measurement; False while offline."""
+        online = any(data.get(key) is not None for key in AVAILABILITY_PROBE_KEYS)
+        now = time.monotonic()
+        transition = self.availability.record(online, now)
         
-        # Basic VPD calculation (inside)
-        temp = data.get("temperature")
-        humidity = data.get("humidity")
-        if temp is not None and humidity is not None:
-            svp = 0.6108 * (2.71828 ** (17.27 * temp / (temp + 237.3)))
-            derived["vpd_calculated"] = round((svp * (100 - humidity)) / 100, 2)
+        if transition == "opened":
+            _LOGGER.warning(
+                f"{self.device_id} delivered no measurements for {self.availability.grace_period:.0f}s - "
+                "pausing updates and actuator commands"
+            )
+            self.hass.bus.async_fire(f"{DOMAIN}_availability", {"device_id": self.device_id, "state": "offline"})
+            self.hass.async_create_task(self.cancel_irrigation())
+        elif transition == "closed":
+            _LOGGER.info(f"{self.device_id} is reachable again - resuming")
+            self.hass.bus.async_fire(f"{DOMAIN}_availability", {"device_id": self.device_id, "state": "online"})
+            self._photoperiod.invalidate()
+            self._mark_dirty(INPUT_GROWTH_CONFIG, INPUT_IRRIGATION_STATE)
+            if self._configured_interval is not None:
+                self.update_interval = self._configured_interval
         
-        # Outside VPD calculation
-        temp_outside = data.get("temperature_outside")
-        humidity_outside = data.get("humidity_outside")
-        if temp_outside is not None and humidity_outside is not None:
-            svp_outside = 0.6108 * (2.71828 ** (17.27 * temp_outside / (temp_outside + 237.3)))
-            derived["vpd_outside"] = round((svp_outside * (100 - humidity_outside)) / 100, 2)
+        if not self.availability.available:
+            self._set_backoff_interval()
+            return False
+        
+        # Noch in der Kulanzzeit: erneut prüfen, auch wenn kein Update mehr kommt
+        remaining = self.availability.grace_remaining(now)
+        if remaining is not None and self._unsub_availability_check is None:
+            self._unsub_availability_check = async_call_later(
+                self.hass, remaining + 1, self._async_availability_check
+            )
+        return True
+
+    @callback
+    def _async_availability_check(self, _now: datetime) -> None:
+        """Trip the breaker if a silent node sent nothing during the grace period."""
+        self._unsub_availability_check = None
+        if self.data is None or not self.availability.available:
+            return
+        data = {key: self._parse_state(key, self.hass.states.get(self._entity_ids[key])) for key in AVAILABILITY_PROBE_KEYS}
+        if not self._record_availability(data):
+            self.async_set_update_error(UpdateFailed(f"{self.device_id} is offline"))
+
+    def _set_backoff_interval(self) -> None:
+        """Poll an offline node only at its probe interval."""
+        if self._configured_interval is not None:
+            self.update_interval = timedelta(seconds=self.availability.backoff)
+
+    def process_states(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive all values for a fresh full read and return the update data."""
+        with self._profile("refresh", update=True):
+            return self._process_states(data)
+
+    def _process_states(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._record_availability(data):
+            raise UpdateFailed(f"{self.device_id} is offline, next probe in {self.availability.backoff:.0f}s")
         
-        # Climate differentials
-        if temp is not None and temp_outside is not None:
-            derived["temperature_differential"] = round(temp - temp_outside, 1)
+        with self._profile("filter"):
+            self._filter_values(data)
         
-        if humidity is not None and humidity_outside is not None:
-            derived["humidity_differential"] = round(humidity - humidity_outside, 1)
+        # Nur geänderte Rohwerte lösen Neuberechnungen aus
+        changed = None
+        if self.data is not None and self.last_update_success:
+            previous = self.data
+            changed = {key for key, value in data.items() if previous.get(key) != value}
         
-        # VPD Target based on growth phase and day/night cycle
-        vpd_target = self._calculate_vpd_target()
-        derived["vpd_target"] = vpd_target
+        # Ohne Event-Abo kann sich die externe Lichtentität unbemerkt geändert haben
+        if changed is None or not self._event_driven or not changed.isdisjoint(LIGHT_KEYS):
+            self._photoperiod.invalidate()
+                
+        # Calculate derived values
+        with self._profile("derive"):
+            derived = self._calculate_derived_values(data, changed)
+        
+        self._finalize_data(data, None if changed is None else changed | derived)
+        return data
+
+    def _profile(self, stage: str, update: bool = False) -> ContextManager[None]:
+        """Return the timer of a pipeline stage (a shared no-op without profiler)."""
+        if self.profiler is None:
+            return NO_PROFILING
+        return self.profiler.stage(stage, update)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Push the data to the entities (timed as ``fanout`` when profiling)."""
+        profiler = self.profiler
+        if profiler is None:
+            super().async_update_listeners()
+            return
+        written = self.write_stats["written"]
+        with profiler.stage("fanout"):
+            super().async_update_listeners()
+        if self.write_stats["written"] == written:
+            profiler.skipped += 1
+
+    def _filter_values(self, data: Dict[str, Any], keys: Optional[List[str]] = None) -> None:
+        """Replace raw sensor values by their filtered values in place.
+
+        The raw values are kept in ``data["raw_values"]``.
+        """
+        if self._filters is None:
+            return
+        raw = dict(self.data.get("raw_values", {})) if self.data else {}
+        self._filters.apply(data, raw, dt_util.utcnow().timestamp(), keys)
+        data["raw_values"] = raw
+
+    def _finalize_data(self, data: Dict[str, Any], changed: Optional[Set[str]] = None) -> None:
+        """Update irrigation state, alerts and configuration snapshots in place.
+
+        ``changed`` holds the raw and derived keys that changed (None: all).
+        """
+        with self._profile("statistics"):
+            self.history.record_snapshot(data)
+            self._record_statistics(data)
+        
+        # Update irrigation state
+        with self._profile("irrigation"):
+            self._update_irrigation_state(data)
+
+        # Check for alerts
+        with self._profile("alerts"):
+            alerts = self._check_alerts(data, changed)
+        data["alerts"] = alerts
+
+        # Add configuration (unveränderte Snapshots werden wiederverwendet)
+        with self._profile("snapshots"):
+            data["growth_config"] = self._frozen("growth_config", self._growth_config)
+            data["irrigation_state"] = self._frozen("irrigation_state", self._irrigation_state)
+            data["climate_control"] = self._frozen("climate_control", self._climate_control)
+            data["irrigation_queue"] = self.irrigation_status
+            data["attribute_snapshots"] = self._attribute_snapshots(data)
+        self._adapt_update_interval(data)
+
+    def _adapt_update_interval(self, data: Dict[str, Any]) -> None:
+        """Adapt the polling interval to phase, photoperiod, trends and shots."""
+        adaptive = self._adaptive_interval
+        if adaptive is None:
+            return
+        queue = data.get("irrigation_queue") or {}
+        interval = adaptive.update(
+            self._irrigation_state.get("current_phase"),
+            bool(self._irrigation_state.get("lights_on")),
+            bool(queue.get("queue_depth")) or queue.get("in_flight") is not None,
+            {key: self.history.slope(key, ADAPTIVE_RATE_WINDOW) for key in ADAPTIVE_RATE_THRESHOLDS},
+        )
+        # Gilt ab dem nächsten geplanten Abruf
+        self.update_interval = timedelta(seconds=interval)
+
+    def _record_statistics(self, data: Dict[str, Any]) -> None:
+        """Aggregate the update and import completed hours."""
+        if self.statistics is None:
+            return
+        values = ChainMap(data, {"daily_water_total": self._irrigation_state.get("daily_water_total")})
+        completed = self.statistics.add(values, dt_util.utcnow().timestamp())
+        if completed:
+            async_import_statistics(self.hass, self.device_id, self.device_info["name"], completed)
+            # Fortlaufende Wassersumme sichern
+            self._schedule_save()
+
+    def _frozen(self, name: str, source: Dict[str, Any]) -> Mapping[str, Any]:
+        """Return a read-only copy of ``source``, reusing the last one if unchanged."""
+        previous = self.data.get(name) if self.data else None
+        if isinstance(previous, MappingProxyType) and previous == source:
+            return previous
+        return MappingProxyType(dict(source))
+
+    def _attribute_snapshots(self, data: Dict[str, Any]) -> Mapping[str, Mapping[str, Any]]:
+        """Return the context attributes shared by all entities of this device.
+
+        They are rebuilt only when the growth config or irrigation state
+        snapshot changed; entities return or merge them instead of building
+        their own dicts on every state write.
+        """
+        growth_config = data["growth_config"]
+        irrigation_state = data["irrigation_state"]
+        previous = self.data.get("attribute_snapshots") if self.data else None
+        if (
+            previous is not None
+            and self.data.get("growth_config") is growth_config
+            and self.data.get("irrigation_state") is irrigation_state
+        ):
+            return previous
+        
+        growth = {
+            "growth_phase": growth_config.get("phase"),
+            "crop_steering": growth_config.get("steering"),
+        }
+        irrigation = {
+            "current_irrigation_phase": irrigation_state.get("current_phase"),
+            "lights_on": irrigation_state.get("lights_on"),
+            "automation_enabled": irrigation_state.get("automation_enabled"),
+        }
+        return MappingProxyType({
+            "growth": MappingProxyType(growth),
+            "growth_substrate": MappingProxyType({**growth, "substrate_size": growth_config.get("substrate_size")}),
+            "growth_irrigation": MappingProxyType({
+                **growth, "current_irrigation_phase": irrigation["current_irrigation_phase"],
+            }),
+            "irrigation": MappingProxyType(irrigation),
+        })
+
+    def _check_alerts(self, data: Dict[str, Any], changed: Optional[Set[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Evaluate the alert rules of the changed keys and return the active alerts."""
+        raised, cleared = self._alerts.evaluate(data, dt_util.utcnow().timestamp(), changed)
         
-        # Temperature, Humidity, and CO2 targets
-        derived["temperature_target"] = self._calculate_temperature_target()
-        derived["humidity_target"] = self._calculate_humidity_target()
-        derived["co2_target"] = self._calculate_co2_target()
+        for alert in raised:
+            log = _LOGGER.warning if alert["severity"] == "critical" else _LOGGER.info
+            log(f"Alert {alert['id']} on {self.device_id}: {alert['message']}")
+            self.hass.bus.async_fire(
+                f"{DOMAIN}_alert", {"device_id": self.device_id, "state": "raised", **alert}
+            )
+        for alert in cleared:
+            _LOGGER.info(f"Alert {alert['id']} on {self.device_id} cleared")
+            self.hass.bus.async_fire(
+                f"{DOMAIN}_alert", {"device_id": self.device_id, "state": "cleared", **alert}
+            )
         
-        # Day/Night status
-        derived["is_day_cycle"] = self._is_day_cycle()
+        self._schedule_alert_check()
+        return self._alerts.alerts
+
+    @callback
+    def _schedule_alert_check(self) -> None:
+        """Re-check pending alerts when their debounce time has passed.
+
+        Without this a violation would only be raised with the next changed
+        value, which may never come for a stuck sensor.
+        """
+        if self._unsub_alert_check is not None:
+            self._unsub_alert_check()
+            self._unsub_alert_check = None
+        due = self._alerts.next_due()
+        if due is not None:
+            delay = max(due - dt_util.utcnow().timestamp(), 0) + 1
+            self._unsub_alert_check = async_call_later(self.hass, delay, self._async_alert_check)
+
+    @callback
+    def _async_alert_check(self, _now: datetime) -> None:
+        """Raise alerts whose debounce time has passed."""
+        self._unsub_alert_check = None
+        if self.data is None:
+            return
+        alerts = self._check_alerts(self.data, set())
+        if alerts is not self.data.get("alerts"):
+            self.async_set_updated_data({**self.data, "alerts": alerts})
+
+    def _calculate_derived_values(self, data: Dict[str, Any], changed: Optional[Set[str]] = None) -> Set[str]:
+        """Calculate VPD, dryback, and other derived values in place.
+
+        Only derivations depending on ``changed`` keys or dirty configuration
+        inputs are recomputed; ``changed=None`` recomputes everything.
+        Returns the derived keys whose value changed.
+        """
+        self._track_peak_vwc(data, changed)
         
-        # Climate strategy recommendation
-        climate_strategy = self._determine_climate_strategy(data, derived)
-        derived["climate_strategy"] = climate_strategy["strategy"]
-        derived["ventilation_recommendation"] = climate_strategy["ventilation"]
+        if changed is not None:
+            changed = changed | self._dirty_inputs
+        self._dirty_inputs.clear()
         
-        # Dryback calculation
+        return self._derivations.evaluate(data, changed)
+
+    def _track_peak_vwc(self, data: Dict[str, Any], changed: Optional[Set[str]] = None) -> None:
+        """Raise max_vwc_today and feed the dryback estimator before the derivations run.
+
+        The estimator only gets a sample when the VWC was read anew
+        (``changed`` contains it or everything was read), so re-running the
+        forecast after a configuration change does not add duplicates.
+        """
         current_vwc = data.get("vwc")
-        max_vwc = self._irrigation_state.get("max_vwc_today", 0)
-        if current_vwc is not None and max_vwc > 0:
-            derived["dryback_percent"] = round(((max_vwc - current_vwc) / max_vwc) * 100, 1)
-        else:
-            derived["dryback_percent"] = 0
-            
-        # VWC Target
-        derived["vwc_target"] = self._calculate_vwc_target()
+        if current_vwc is not None and (changed is None or "vwc" in changed):
+            self._dryback_estimator.add(dt_util.now().timestamp(), current_vwc)
+        if current_vwc is not None and current_vwc > self._irrigation_state["max_vwc_today"]:
+            self._irrigation_state["max_vwc_today"] = current_vwc
+            self._mark_dirty(INPUT_IRRIGATION_STATE)
+            self._schedule_save()
+
+    def _update_irrigation_state(self, data: Dict[str, Any]) -> None:
+        """Track the photoperiod and advance the P0-P3 state machine."""
+        lights_on = bool(data.get("is_day_cycle"))
+        self._irrigation_state["lights_on"] = lights_on
         
-        # EC and pH targets
-        derived["ec_target"] = self._calculate_ec_target()
-        derived["ph_target"] = self._calculate_ph_target()
+        if self._scheduler.async_update(
+            lights_on,
+            data.get("vwc"),
+            data.get("vwc_target"),
+            self._photoperiod.next_transition,
+        ):
+            # Phasenwechsel (P1 setzt z.B. den Peak-VWC zurück)
+            self._mark_dirty(INPUT_IRRIGATION_STATE)
+            self._schedule_save()
         
-        return derived
+        data["irrigation_schedule"] = self._scheduler.as_dict()
 
-    def _calculate_vpd_target(self) -> float:
-        """Calculate VPD target based on growth phase and day/night cycle."""
-        phase = self._growth_config["phase"]
-        steering = self._growth_config["steering"]
+    def _derive_day_cycle(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Day/Night status."""
+        return {"is_day_cycle": self._is_day_cycle()}
+
+    def _derive_vpd_inside(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Air and leaf VPD (inside) in one pass, plus the VPD used for control."""
+        temp = data.get("temperature")
+        humidity = data.get("humidity")
+        if temp is None or humidity is None:
+            return {}
+        
+        # Blatttemperatur: IR-Sensor, sonst Lufttemperatur + Offset der Wachstumsphase
+        phase_config = GROWTH_PHASES.get(self._growth_config["phase"], {})
+        vpd_air = round(psychrometrics.vpd(temp, humidity), 2)
+        vpd_leaf = round(
+            psychrometrics.leaf_vpd(
+                temp,
+                humidity,
+                data.get("leaf_temperature"),
+                phase_config.get("leaf_temp_offset", DEFAULT_LEAF_TEMP_OFFSET),
+            ),
+            2,
+        )
+        return {
+            "vpd_calculated": vpd_air,
+            "vpd_leaf": vpd_leaf,
+            "vpd_control": vpd_leaf if self._vpd_reference == "leaf" else vpd_air,
+        }
+
+    def _derive_vpd_outside(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Outside VPD calculation."""
+        temp_outside = data.get("temperature_outside")
+        humidity_outside = data.get("humidity_outside")
+        if temp_outside is None or humidity_outside is None:
+            return {}
         
-        # Check if it's day or night (based on lights)
-        is_day = self._is_day_cycle()
+        return {"vpd_outside": round(psychrometrics.vpd(temp_outside, humidity_outside), 2)}
+
+    def _derive_temperature_differential(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Temperature differential inside/outside."""
+        temp = data.get("temperature")
+        temp_outside = data.get("temperature_outside")
+        if temp is None or temp_outside is None:
+            return {}
+        return {"temperature_differential": round(temp - temp_outside, 1)}
+
+    def _derive_humidity_differential(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Humidity differential inside/outside."""
+        humidity = data.get("humidity")
+        humidity_outside = data.get("humidity_outside")
+        if humidity is None or humidity_outside is None:
+            return {}
+        return {"humidity_differential": round(humidity - humidity_outside, 1)}
+
+    def _derive_climate_targets(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """VPD, temperature, humidity and CO2 targets based on phase and day/night cycle."""
+        targets = self._current_targets(data.get("is_day_cycle"))
+        return {
+            "vpd_target": targets.vpd_target,
+            "temperature_target": targets.temperature_target,
+            "humidity_target": targets.humidity_target,
+            "co2_target": targets.co2_target,
+        }
+
+    def _derive_climate_strategy(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Climate strategy recommendation."""
+        climate_strategy = self._determine_climate_strategy(data, data)
+        return {
+            "climate_strategy": climate_strategy["strategy"],
+            "ventilation_recommendation": climate_strategy["ventilation"],
+        }
+
+    def _derive_dryback(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Dryback calculation."""
+        current_vwc = data.get("vwc")
+        max_vwc = self._irrigation_state.get("max_vwc_today", 0)
+        if current_vwc is not None and max_vwc > 0:
+            return {"dryback_percent": round(((max_vwc - current_vwc) / max_vwc) * 100, 1)}
+        return {"dryback_percent": 0}
+
+    def _derive_dryback_forecast(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Dryback rate and when the P2 trigger / dryback target will be reached."""
+        now = dt_util.now()
+        max_vwc = self._irrigation_state.get("max_vwc_today", 0)
+        rate = self._dryback_estimator.dryback_rate(max_vwc)
         
-        # Get VPD target from growth phase configuration
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
+        def _eta(dryback_percent: Optional[float]) -> Optional[datetime]:
+            if dryback_percent is None:
+                return None
+            hours = self._dryback_estimator.hours_to_dryback(dryback_percent, max_vwc)
+            if hours is None:
+                return None
+            return (now + timedelta(hours=hours)).replace(microsecond=0)
         
-        if is_day:
-            base_vpd = phase_config.get("vpd_target_day", 1.0)
-        else:
-            base_vpd = phase_config.get("vpd_target_night", 0.8)
+        return {
+            "dryback_rate": round(rate, 2) if rate is not None else None,
+            "p2_trigger_eta": _eta(IRRIGATION_PHASES["P2"]["trigger_dryback"]),
+            "dryback_target_eta": _eta(data.get("dryback_target")),
+        }
+
+    def _derive_substrate_targets(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """VWC, EC, pH and dryback targets (unabhängig vom Tag/Nacht-Zyklus)."""
+        targets = self._current_targets(True)
+        return {
+            "vwc_target": targets.vwc_target,
+            "ec_target": targets.ec_target,
+            "ph_target": targets.ph_target,
+            "dryback_target": targets.dryback_target,
+        }
+
+    def _current_targets(self, is_day: Optional[bool] = None) -> TargetProfile:
+        """Look up the target profile for the current phase, steering and photoperiod."""
+        if is_day is None:
+            is_day = self._is_day_cycle()
+        return lookup_targets(
+            self._target_table,
+            self._growth_config["phase"],
+            self._growth_config["steering"],
+            is_day,
+        )
+
+    def get_auto_target(self, key: str) -> Optional[float]:
+        """Return the calculated target for a key without manual overrides."""
+        profile = lookup_targets(
+            DEFAULT_TARGET_TABLE,
+            self._growth_config["phase"],
+            self._growth_config["steering"],
+            self._is_day_cycle(),
+        )
+        return getattr(profile, key, None)
+
+    @property
+    def target_overrides(self) -> Dict[str, float]:
+        """Return the manual target overrides set via the number platform."""
+        return self._target_overrides
+
+    async def async_restore_state(self) -> None:
+        """Restore the persisted irrigation state before the first refresh."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
             
-        # Adjust for crop steering
-        if steering == "generative":
-            base_vpd += 0.2
-        elif steering == "vegetative":
-            base_vpd -= 0.1
+        self._irrigation_state.update(
+            {key: value for key, value in stored["irrigation_state"].items() if key in self._irrigation_state}
+        )
+        self._growth_config.update(
+            {key: value for key, value in stored["growth_config"].items() if key in self._growth_config}
+        )
+        self._target_overrides = {
+            key: value for key, value in stored["target_overrides"].items() if key in TARGET_OVERRIDE_FIELDS
+        }
+        if self._target_overrides:
+            self._target_table = build_target_table(self._target_overrides)
+        if self.statistics is not None:
+            self.statistics.restore(stored["statistics"])
             
-        return round(max(0.5, min(2.0, base_vpd)), 2)
+        self._mark_dirty(INPUT_GROWTH_CONFIG, INPUT_IRRIGATION_STATE)
+        _LOGGER.debug(f"Restored state for {self.device_id}: {self._irrigation_state}")
+
+    def _stored_state(self) -> Dict[str, Any]:
+        """Return the state that is persisted."""
+        return {
+            "irrigation_state": self._irrigation_state,
+            "growth_config": self._growth_config,
+            "target_overrides": self._target_overrides,
+            "statistics": self.statistics.totals if self.statistics else {},
+        }
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Persist the state after a short delay (coalesces bursts of changes)."""
+        self._store.async_schedule_save(self._stored_state)
+
+    async def set_target_override(self, key: str, value: Optional[float]) -> None:
+        """Set (or clear with None) a manual target and rebuild the target table."""
+        if key not in TARGET_OVERRIDE_FIELDS:
+            _LOGGER.error(f"Unknown target override: {key}")
+            return
+        
+        if value is None:
+            self._target_overrides.pop(key, None)
+        else:
+            self._target_overrides[key] = value
+        
+        self._rebuild_target_table()
+        await self.async_request_refresh()
+
+    async def clear_target_overrides(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Clear the given manual targets (all if None); the automatic targets apply again."""
+        cleared = [
+            key for key in (TARGET_OVERRIDE_FIELDS if keys is None else keys)
+            if self._target_overrides.pop(key, None) is not None
+        ]
+        if not cleared:
+            return
+        _LOGGER.info(f"Manual targets cleared on {self.device_id}: {', '.join(cleared)}")
+        self._rebuild_target_table()
+        await self.async_request_refresh()
+
+    def _rebuild_target_table(self) -> None:
+        """Fold the current overrides into the target table and persist them."""
+        self._target_table = (
+            build_target_table(self._target_overrides) if self._target_overrides else DEFAULT_TARGET_TABLE
+        )
+        self._mark_dirty(INPUT_GROWTH_CONFIG)
+        self._schedule_save()
+
+    def _calculate_vpd_target(self) -> float:
+        """Calculate VPD target based on growth phase and day/night cycle.
+
+        The target applies to ``vpd_control``, i.e. air or leaf VPD
+        depending on the configured VPD reference.
+        """
+        return self._current_targets().vpd_target
 
     def _is_day_cycle(self) -> bool:
         """Determine if it's currently day cycle based on lights and/or schedule."""
+        return self._photoperiod.is_day(dt_util.now(), self._light_entity_day_state)
+
+    def _light_entity_day_state(self) -> Optional[bool]:
+        """Return the day/night state decided by light entities, None for schedule."""
         
         # 1. Prüfe externe Lichtentität (z.B. WLAN-Steckdose) - Höchste Priorität
         if self._external_light_entity:
             external_light_state = self.hass.states.get(self._external_light_entity)
             if external_light_state:
-                is_on = external_light_state.state in ["on", "true", "1"]
-                _LOGGER.debug(f"External light {self._external_light_entity}: {external_light_state.state} -> {'Day' if is_on else 'Night'}")
-                return is_on
+                return external_light_state.state in ["on", "true", "1"]
         
         # 2. Prüfe ESPHome Light-Entität
         led_panel = self.hass.states.get(self._entity_ids.get("led_panel"))
         if led_panel and led_panel.state == "on":
-            _LOGGER.debug("ESPHome LED panel is on -> Day")
             return True
         
         # 3. Prüfe ESPHome Switch für Growlight
         grow_light_switch = self.hass.states.get(self._entity_ids.get("grow_light_switch"))
         if grow_light_switch and grow_light_switch.state == "on":
-            _LOGGER.debug("ESPHome grow light switch is on -> Day")
             return True
         
         # 4. Fallback: Zeitbasierte Erkennung mit konfigurierbaren Zeiten
-        from datetime import datetime, time
-        current_time = datetime.now().time()
-        
-        try:
-            start_time = time.fromisoformat(self._light_schedule_start)
-            end_time = time.fromisoformat(self._light_schedule_end)
-            
-            if start_time <= end_time:  # Normal case (e.g., 06:00 - 22:00)
-                is_day = start_time <= current_time <= end_time
-            else:  # Overnight case (e.g., 22:00 - 06:00)
-                is_day = current_time >= start_time or current_time <= end_time
-                
-            _LOGGER.debug(f"Time-based: {current_time} ({self._light_schedule_start}-{self._light_schedule_end}) -> {'Day' if is_day else 'Night'}")
-            return is_day
-            
-        except ValueError:
-            # Fallback auf hardcoded Zeiten bei ungültigen Zeitformaten
-            current_hour = datetime.now().hour
-            is_day = 6 <= current_hour < 22
-            _LOGGER.debug(f"Hardcoded time fallback: hour {current_hour} -> {'Day' if is_day else 'Night'}")
-            return is_day
+        return None
 
     def _calculate_temperature_target(self) -> float:
         """Calculate temperature target based on growth phase and day/night cycle."""
-        phase = self._growth_config["phase"]
-        is_day = self._is_day_cycle()
-        
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
-        
-        if is_day:
-            return phase_config.get("temp_target_day", 25.0)
-        else:
-            return phase_config.get("temp_target_night", 22.0)
+        return self._current_targets().temperature_target
 
     def _calculate_humidity_target(self) -> float:
         """Calculate humidity target based on growth phase and day/night cycle."""
-        phase = self._growth_config["phase"]
-        is_day = self._is_day_cycle()
-        
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
-        
-        if is_day:
-            return phase_config.get("humidity_target_day", 65.0)
-        else:
-            return phase_config.get("humidity_target_night", 70.0)
+        return self._current_targets().humidity_target
 
     def _calculate_co2_target(self) -> int:
         """Calculate CO2 target based on growth phase and day/night cycle."""
-        phase = self._growth_config["phase"]
-        is_day = self._is_day_cycle()
-        
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
-        
-        if is_day:
-            return phase_config.get("co2_target_day", 1200)
-        else:
-            return phase_config.get("co2_target_night", 1000)
+        return self._current_targets().co2_target
 
     def _calculate_vwc_target(self) -> float:
         """Calculate VWC target based on growth phase and crop steering."""
-        phase = self._growth_config["phase"]
-        steering = self._growth_config["steering"]
-        
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
-        base_vwc = phase_config.get("vwc_target", 75.0)
-        
-        # Adjust for crop steering
-        steering_config = CROP_STEERING_STRATEGIES.get(steering, CROP_STEERING_STRATEGIES["balanced"])
-        
-        if "shot_multiplier" in steering_config:
-            # Higher multiplier means more water retention
-            if steering_config["shot_multiplier"] > 1.0:
-                base_vwc += 5.0  # Vegetative steering - more water
-            elif steering_config["shot_multiplier"] < 1.0:
-                base_vwc -= 5.0  # Generative steering - less water
-        
-        return round(max(50.0, min(95.0, base_vwc)), 1)
+        return self._current_targets(True).vwc_target
 
     def _calculate_ec_target(self) -> float:
         """Calculate EC target based on growth phase and crop steering."""
-        phase = self._growth_config["phase"]
-        steering = self._growth_config["steering"]
-        
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
-        base_ec = phase_config.get("ec_target", 4.0)
-        
-        # Adjust for crop steering
-        steering_config = CROP_STEERING_STRATEGIES.get(steering, CROP_STEERING_STRATEGIES["balanced"])
-        
-        if "ec_target_increase" in steering_config:
-            base_ec += steering_config["ec_target_increase"]
-        elif "ec_target_reduction" in steering_config:
-            base_ec -= steering_config["ec_target_reduction"]
-        
-        return round(max(1.5, min(10.0, base_ec)), 1)
+        return self._current_targets(True).ec_target
 
     def _calculate_ph_target(self) -> float:
         """Calculate pH target based on growth phase."""
-        phase = self._growth_config["phase"]
-        
-        phase_config = GROWTH_PHASES.get(phase, GROWTH_PHASES["vegetative"])
-        return phase_config.get("ph_target", 6.0)
+        return self._current_targets(True).ph_target
 
     def _determine_climate_strategy(self, data: Dict[str, Any], derived: Dict[str, Any]) -> Dict[str, str]:
         """Determine optimal climate strategy based on inside/outside conditions and targets."""
         
         temp_in = data.get("temperature")
         humidity_in = data.get("humidity")
-        vpd_in = derived.get("vpd_calculated")
+        vpd_in = derived.get("vpd_control")
         
         temp_out = data.get("temperature_outside")
         humidity_out = data.get("humidity_outside")
@@ -395,44 +1134,142 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
             "ventilation": ventilation
         }
 
-    async def trigger_irrigation_shot(self, shot_size: float, duration: int) -> None:
-        """Trigger a manual irrigation shot."""
+    def _irrigation_executor(self) -> Optional[IrrigationExecutor]:
+        """Return the shared executor of this device's pump, if it has one."""
         pump_entity = self._entity_ids.get("pump")
-        if pump_entity:
-            try:
-                # Turn on pump
-                await self.hass.services.async_call(
-                    "switch", "turn_on",
-                    {"entity_id": pump_entity}
-                )
-                
-                # Wait for duration
-                await asyncio.sleep(duration)
-                
-                # Turn off pump
-                await self.hass.services.async_call(
-                    "switch", "turn_off", 
-                    {"entity_id": pump_entity}
-                )
-                
-                # Update irrigation tracking
-                self._irrigation_state["last_irrigation"] = datetime.now()
-                water_amount = (shot_size / 100) * self._growth_config["substrate_size"]
-                self._irrigation_state["daily_water_total"] += water_amount
-                
-                _LOGGER.info(f"Manual irrigation shot: {shot_size}% for {duration}s ({water_amount:.1f}L)")
-                
-                # Request data update
-                await self.async_request_refresh()
-                
-            except Exception as err:
-                _LOGGER.error(f"Error during irrigation shot: {err}")
-                raise
+        if not pump_entity:
+            return None
+        executor = async_get_executor(self.hass, pump_entity)
+        if self._unsub_irrigation is None:
+            self._unsub_irrigation = executor.async_add_listener(self._async_irrigation_changed)
+        return executor
+
+    @property
+    def irrigation_status(self) -> Dict[str, Any]:
+        """Return queued and running irrigation shots of this device."""
+        executor = self._irrigation_executor()
+        if executor is None:
+            return {"queue_depth": 0, "in_flight": None, "queued": [], "scheduled": []}
+        return executor.status(self.device_id)
+
+    @callback
+    def _async_irrigation_changed(self) -> None:
+        """Push the new queue and phase state to the entities."""
+        if self.data is None:
+            return
+        data = dict(self.data)
+        data["irrigation_state"] = self._frozen("irrigation_state", self._irrigation_state)
+        data["irrigation_schedule"] = self._scheduler.as_dict()
+        data["irrigation_queue"] = self.irrigation_status
+        if data["irrigation_state"] is not self.data.get("irrigation_state"):
+            self._mark_dirty(INPUT_IRRIGATION_STATE)
+            self._schedule_save()
+        data["attribute_snapshots"] = self._attribute_snapshots(data)
+        self.async_set_updated_data(data)
+
+    @callback
+    def _async_scheduler_refresh(self) -> None:
+        """Re-read the sensors, e.g. at a light schedule transition."""
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_fire_scheduled_shot(self, shot_size: float, source: str) -> None:
+        """Queue a shot of the state machine, scaled by the crop steering strategy."""
+        steering = CROP_STEERING_STRATEGIES.get(self._growth_config["steering"], {})
+        shot_size = round(shot_size * steering.get("shot_multiplier", 1.0), 1)
+        await self.trigger_irrigation_shot(shot_size, shot_duration(shot_size), source=source)
+
+    @callback
+    def _async_irrigation_complete(self, job: IrrigationJob) -> None:
+        """Book a finished shot."""
+        self._irrigation_state["last_irrigation"] = datetime.now()
+        water_amount = (job.shot_size / 100) * self._growth_config["substrate_size"]
+        self._irrigation_state["daily_water_total"] += water_amount
+        self._schedule_save()
+        
+        _LOGGER.info(f"Irrigation shot ({job.source}): {job.shot_size}% for {job.duration}s ({water_amount:.1f}L)")
+        
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def trigger_irrigation_shot(
+        self, shot_size: float, duration: int, delay: float = 0, source: str = "manual"
+    ) -> Optional[IrrigationJob]:
+        """Queue an irrigation shot and return without waiting for it."""
+        executor = self._irrigation_executor()
+        if executor is None:
+            _LOGGER.warning(f"No pump configured for {self.device_id}, irrigation shot skipped")
+            return None
+        if not self.availability.available:
+            _LOGGER.warning(f"{self.device_id} is offline, irrigation shot ({source}) skipped")
+            return None
+            
+        return executor.async_enqueue(
+            IrrigationJob(
+                owner=self.device_id,
+                shot_size=shot_size,
+                duration=duration,
+                source=source,
+                on_complete=self._async_irrigation_complete,
+            ),
+            delay=delay,
+        )
+
+    async def start_p1_saturation(self, shot_count: int, shot_size: float, interval_minutes: int) -> int:
+        """Schedule a P1 saturation sequence of timed shots; return how many were queued."""
+        duration = shot_duration(shot_size)
+        queued = 0
+        for i in range(shot_count):
+            job = await self.trigger_irrigation_shot(
+                shot_size, duration, delay=i * interval_minutes * 60, source=f"p1_{i + 1}/{shot_count}"
+            )
+            if job is not None:
+                queued += 1
+        if queued:
+            _LOGGER.info(f"P1 saturation scheduled: {queued} shots of {shot_size}% every {interval_minutes} minutes")
+        return queued
+
+    async def cancel_irrigation(self) -> int:
+        """Cancel all queued, scheduled and running shots of this device."""
+        executor = self._irrigation_executor()
+        if executor is None:
+            return 0
+        cancelled = await executor.async_cancel(self.device_id)
+        if cancelled:
+            _LOGGER.warning(f"{cancelled} irrigation shot(s) on {self.device_id} cancelled")
+        return cancelled
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending shots, stop listening to the executor and persist the state."""
+        await super().async_shutdown()
+        self._scheduler.async_stop()
+        self._actuators.async_stop()
+        if self._unsub_alert_check is not None:
+            self._unsub_alert_check()
+            self._unsub_alert_check = None
+        if self._unsub_availability_check is not None:
+            self._unsub_availability_check()
+            self._unsub_availability_check = None
+        await self.cancel_irrigation()
+        if self._unsub_irrigation is not None:
+            self._unsub_irrigation()
+            self._unsub_irrigation = None
+        
+        # Ausstehende verzögerte Speicherung sofort schreiben (Neuladen nach Optionsänderung)
+        await self._store.async_save(self._stored_state())
 
     async def set_growth_phase(self, phase: str) -> None:
-        """Set the growth phase."""
+        """Set the growth phase.
+
+        Manual targets hold across irrigation phases and day/night but were
+        chosen for one growth phase; a change of the growth phase clears them.
+        """
         if phase in GROWTH_PHASES:
+            if phase != self._growth_config["phase"] and self._target_overrides:
+                _LOGGER.info(f"Growth phase changed on {self.device_id}, clearing manual targets")
+                self._target_overrides.clear()
+                self._rebuild_target_table()
             self._growth_config["phase"] = phase
+            self._mark_dirty(INPUT_GROWTH_CONFIG)
+            self._schedule_save()
             _LOGGER.info(f"Growth phase set to: {phase}")
             await self.async_request_refresh()
 
@@ -440,89 +1277,107 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
         """Set the crop steering strategy."""
         if strategy in CROP_STEERING_STRATEGIES:
             self._growth_config["steering"] = strategy
+            self._mark_dirty(INPUT_GROWTH_CONFIG)
+            self._schedule_save()
             _LOGGER.info(f"Crop steering set to: {strategy}")
             await self.async_request_refresh()
 
+    async def set_substrate_size(self, substrate_size: float) -> None:
+        """Set the substrate volume in liters."""
+        self._growth_config["substrate_size"] = substrate_size
+        self._schedule_save()
+        await self.async_request_refresh()
+
+    async def set_automation_enabled(self, enabled: bool) -> None:
+        """Enable or disable automatic irrigation."""
+        self._irrigation_state["automation_enabled"] = enabled
+        self._schedule_save()
+        await self.async_request_refresh()
+
+    async def reset_counters(self, reset_water: bool = False, reset_vwc: bool = False) -> None:
+        """Reset the daily water total and/or the max VWC of today."""
+        if reset_water:
+            self._irrigation_state["daily_water_total"] = 0.0
+            _LOGGER.info("Daily water counter reset")
+            
+        if reset_vwc:
+            self._irrigation_state["max_vwc_today"] = 0.0
+            self._mark_dirty(INPUT_IRRIGATION_STATE)
+            _LOGGER.info("Max VWC counter reset")
+            
+        self._schedule_save()
+        await self.async_request_refresh()
+
     async def apply_climate_strategy(self, strategy: str = None) -> None:
         """Apply climate control strategy based on current conditions."""
         if strategy is None:
-            # Auto-determine strategy
+            # Auto-determine strategy (bereits im letzten Update berechnet)
             data = self.data or {}
-            derived = self._calculate_derived_values(data)
-            climate_strategy = self._determine_climate_strategy(data, derived)
-            strategy = climate_strategy["strategy"]
+            strategy = data.get("climate_strategy")
+            if strategy is None:
+                strategy = self._determine_climate_strategy(data, data)["strategy"]
         
         if strategy not in CLIMATE_STRATEGIES:
             _LOGGER.error(f"Unknown climate strategy: {strategy}")
             return
+        if not self.availability.available:
+            _LOGGER.warning(f"{self.device_id} is offline, climate strategy {strategy} not applied")
+            return
             
         strategy_config = CLIMATE_STRATEGIES[strategy]
         actions = strategy_config["actions"]
         
         _LOGGER.info(f"Applying climate strategy: {strategy} - {strategy_config['description']}")
         
-        # Apply actions based on strategy
+        # Alle Aktionen sammeln und als ein Batch schalten
+        desired: Dict[str, bool] = {}
         for action in actions:
-            await self._execute_climate_action(action)
+            self._collect_climate_action(action, desired)
+        await self._actuators.async_apply(desired)
     
-    async def _execute_climate_action(self, action: str) -> None:
-        """Execute a specific climate control action."""
+    def _collect_climate_action(self, action: str, desired: Dict[str, bool]) -> None:
+        """Add the actuator states of a climate control action to ``desired``."""
         try:
             if action == "increase_intake":
-                await self._set_fan_speed("intake", 80)
+                self._set_fan_speed("intake", 80, desired)
             elif action == "reduce_intake":
-                await self._set_fan_speed("intake", 30)
+                self._set_fan_speed("intake", 30, desired)
             elif action == "increase_exhaust":
-                await self._set_fan_speed("exhaust", 80)
+                self._set_fan_speed("exhaust", 80, desired)
             elif action == "reduce_exhaust":
-                await self._set_fan_speed("exhaust", 40)
+                self._set_fan_speed("exhaust", 40, desired)
             elif action == "maximum_intake":
-                await self._set_fan_speed("intake", 100)
+                self._set_fan_speed("intake", 100, desired)
             elif action == "increase_heating":
                 # Could control heater if available
                 _LOGGER.info("Heating increase recommended")
             elif action == "increase_dehumidifier":
                 if self._entity_ids.get("dehumidifier"):
-                    await self.hass.services.async_call(
-                        "switch", "turn_on",
-                        {"entity_id": self._entity_ids["dehumidifier"]}
-                    )
+                    desired[self._entity_ids["dehumidifier"]] = True
             elif action == "increase_humidifier":
                 if self._entity_ids.get("humidifier"):
-                    await self.hass.services.async_call(
-                        "switch", "turn_on", 
-                        {"entity_id": self._entity_ids["humidifier"]}
-                    )
+                    desired[self._entity_ids["humidifier"]] = True
             elif action == "increase_circulation":
-                await self._set_fan_speed("circulation", 100)
+                self._set_fan_speed("circulation", 100, desired)
             elif action == "monitor":
                 _LOGGER.info("Monitoring - optimal conditions")
             elif action == "fine_tune":
-                await self._fine_tune_climate()
+                self._fine_tune_climate(desired)
         except Exception as err:
             _LOGGER.error(f"Error executing climate action {action}: {err}")
     
-    async def _set_fan_speed(self, fan_type: str, speed: int) -> None:
-        """Set fan speed (if variable speed control available)."""
+    def _set_fan_speed(self, fan_type: str, speed: int, desired: Dict[str, bool]) -> None:
+        """Add the desired fan state (if variable speed control available)."""
         fan_entity = self._entity_ids.get(f"fan_{fan_type}")
         if fan_entity:
             # For simple on/off fans
-            if speed > 50:
-                await self.hass.services.async_call(
-                    "switch", "turn_on",
-                    {"entity_id": fan_entity}
-                )
-            else:
-                await self.hass.services.async_call(
-                    "switch", "turn_off",
-                    {"entity_id": fan_entity}
-                )
+            desired[fan_entity] = speed > 50
             _LOGGER.info(f"Set {fan_type} fan to {speed}%")
     
-    async def _fine_tune_climate(self) -> None:
+    def _fine_tune_climate(self, desired: Dict[str, bool]) -> None:
         """Fine-tune climate when in optimal range."""
         data = self.data or {}
-        vpd_current = data.get("vpd_calculated")
+        vpd_current = data.get("vpd_control")
         vpd_target = self._calculate_vpd_target()
         
         if vpd_current and vpd_target:
@@ -530,37 +1385,30 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
             if abs(diff) > 0.1:  # Only adjust if significant difference
                 if diff > 0:  # VPD too high, need more humidity
                     if self._entity_ids.get("humidifier"):
-                        await self.hass.services.async_call(
-                            "switch", "turn_on",
-                            {"entity_id": self._entity_ids["humidifier"]}
-                        )
+                        desired[self._entity_ids["humidifier"]] = True
                 else:  # VPD too low, need less humidity
                     if self._entity_ids.get("dehumidifier"):
-                        await self.hass.services.async_call(
-                            "switch", "turn_on", 
-                            {"entity_id": self._entity_ids["dehumidifier"]}
-                        )
+                        desired[self._entity_ids["dehumidifier"]] = True
 
     async def set_ventilation_mode(self, mode: str) -> None:
         """Set ventilation mode according to VENTILATION_MODES."""
         if mode not in VENTILATION_MODES:
             _LOGGER.error(f"Unknown ventilation mode: {mode}")
             return
+        if not self.availability.available:
+            _LOGGER.warning(f"{self.device_id} is offline, ventilation mode {mode} not applied")
+            return
             
         ventilation_config = VENTILATION_MODES[mode]
         _LOGGER.info(f"Setting ventilation mode: {mode} - {ventilation_config['description']}")
         
-        # Set intake fan
-        if "intake_fan" in ventilation_config:
-            await self._set_fan_speed("intake", ventilation_config["intake_fan"])
+        desired: Dict[str, bool] = {}
+        for fan_type in ("intake", "exhaust", "circulation"):
+            if f"{fan_type}_fan" in ventilation_config:
+                self._set_fan_speed(fan_type, ventilation_config[f"{fan_type}_fan"], desired)
         
-        # Set exhaust fan  
-        if "exhaust_fan" in ventilation_config:
-            await self._set_fan_speed("exhaust", ventilation_config["exhaust_fan"])
-            
-        # Set circulation fan
-        if "circulation_fan" in ventilation_config:
-            await self._set_fan_speed("circulation", ventilation_config["circulation_fan"])
+        # Notfall-Belüftung wartet nicht auf das Mindestintervall
+        await self._actuators.async_apply(desired, force=mode == "maximum_intake")
 
     async def optimize_vpd(self, target_vpd: float = None) -> None:
         """Optimize VPD using inside/outside climate conditions."""
@@ -568,7 +1416,7 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
             target_vpd = self._calculate_vpd_target()
             
         data = self.data or {}
-        vpd_current = data.get("vpd_calculated")
+        vpd_current = data.get("vpd_control")
         vpd_outside = data.get("vpd_outside") 
         temp_in = data.get("temperature")
         temp_out = data.get("temperature_outside")
@@ -603,6 +1451,31 @@ class AthenaPlantCoordinator(DataUpdateCoordinator):
             else:
                 await self.apply_climate_strategy("cool_humidify")
 
+    @property
+    def profiling_diagnostics(self) -> Optional[Dict[str, Any]]:
+        """Return the per-stage update timings (None if profiling is off)."""
+        return self.profiler.as_dict() if self.profiler is not None else None
+
+    @property
+    def statistics_diagnostics(self) -> Optional[Dict[str, Any]]:
+        """Return the 5-minute aggregates of the last 24 h (None if disabled)."""
+        return self.statistics.as_dict() if self.statistics is not None else None
+
+    @property
+    def interval_diagnostics(self) -> Optional[Dict[str, Any]]:
+        """Return the adaptive update interval (None if disabled)."""
+        return self._adaptive_interval.as_dict() if self._adaptive_interval is not None else None
+
+    @property
+    def availability_diagnostics(self) -> Dict[str, Any]:
+        """Return the circuit breaker state."""
+        return self.availability.as_dict(time.monotonic())
+
+    @property
+    def actuator_diagnostics(self) -> Dict[str, Any]:
+        """Return command counts and latencies of the actuator dispatcher."""
+        return self._actuators.diagnostics()
+
     def get_entity_id(self, key: str) -> Optional[str]:
         """Get entity ID for a given key."""
         return self._entity_ids.get(key)
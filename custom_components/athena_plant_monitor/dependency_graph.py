@@ -0,0 +1,130 @@
+"""Dependency graph for incremental recomputation of derived values."""
+import logging
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class Derivation:
+    """A single derivation node with declared inputs and outputs."""
+
+    __slots__ = ("name", "inputs", "outputs", "func", "volatile")
+
+    def __init__(
+        self,
+        name: str,
+        inputs: Iterable[str],
+        outputs: Iterable[str],
+        func: Callable[[Dict[str, Any]], Dict[str, Any]],
+        volatile: bool = False,
+    ) -> None:
+        """Initialize the derivation."""
+        self.name = name
+        self.inputs: FrozenSet[str] = frozenset(inputs)
+        self.outputs: Tuple[str, ...] = tuple(outputs)
+        self.func = func
+        # Volatile nodes hängen von der Uhrzeit ab und werden bei jedem Durchlauf
+        # ausgewertet; Änderungen propagieren trotzdem nur bei neuem Ergebnis.
+        self.volatile = volatile
+
+
+class DerivationGraph:
+    """Evaluate only the derivations affected by a set of changed keys.
+
+    Inputs are raw data keys (``temperature``, ``vwc`` ...) or pseudo keys for
+    configuration state (``config:growth`` ...). Outputs of one derivation can
+    be inputs of another; evaluation always follows topological order and a
+    derivation whose result did not change does not dirty its dependents.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._nodes: List[Derivation] = []
+        self._order: Optional[List[Derivation]] = None
+        self._cache: Dict[str, Any] = {}
+
+    def add(
+        self,
+        name: str,
+        inputs: Iterable[str],
+        outputs: Iterable[str],
+        func: Callable[[Dict[str, Any]], Dict[str, Any]],
+        volatile: bool = False,
+    ) -> None:
+        """Register a derivation."""
+        self._nodes.append(Derivation(name, inputs, outputs, func, volatile))
+        self._order = None
+
+    @property
+    def outputs(self) -> Set[str]:
+        """Return all keys produced by the graph."""
+        return {output for node in self._nodes for output in node.outputs}
+
+    def _topological_order(self) -> List[Derivation]:
+        """Sort nodes so that producers are evaluated before consumers."""
+        if self._order is not None:
+            return self._order
+
+        producer = {output: node for node in self._nodes for output in node.outputs}
+        order: List[Derivation] = []
+        state: Dict[str, int] = {}
+
+        def visit(node: Derivation) -> None:
+            mark = state.get(node.name)
+            if mark == 2:
+                return
+            if mark == 1:
+                raise ValueError(f"Cyclic dependency at derivation {node.name}")
+            state[node.name] = 1
+            for key in node.inputs:
+                dependency = producer.get(key)
+                if dependency is not None:
+                    visit(dependency)
+            state[node.name] = 2
+            order.append(node)
+
+        for node in self._nodes:
+            visit(node)
+
+        self._order = order
+        return order
+
+    def invalidate(self) -> None:
+        """Drop all cached results so the next evaluation recomputes everything."""
+        self._cache.clear()
+
+    def evaluate(self, data: Dict[str, Any], changed: Optional[Iterable[str]] = None) -> Set[str]:
+        """Recompute derivations affected by ``changed`` and write them into ``data``.
+
+        With ``changed=None`` every derivation is evaluated. Cached results of
+        untouched derivations are copied into ``data`` as well. Returns the set
+        of output keys whose value changed.
+        """
+        dirty: Optional[Set[str]] = None if changed is None else set(changed)
+        updated: Set[str] = set()
+        cache = self._cache
+
+        for node in self._topological_order():
+            if (
+                dirty is not None
+                and not node.volatile
+                and dirty.isdisjoint(node.inputs)
+                and all(output in cache for output in node.outputs)
+            ):
+                for output in node.outputs:
+                    data[output] = cache[output]
+                continue
+
+            result = node.func(data)
+            for output in node.outputs:
+                value = result.get(output)
+                data[output] = value
+                if cache.get(output, _MISSING) != value:
+                    cache[output] = value
+                    updated.add(output)
+                    if dirty is not None:
+                        dirty.add(output)
+
+        return updated
@@ -0,0 +1,24 @@
+"""Diagnostics support for Athena Plant Monitor."""
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_COORDINATOR
+from .coordinator import AthenaPlantCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AthenaPlantCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    return {
+        "device_id": coordinator.device_id,
+        "config": dict(entry.data),
+        "options": dict(entry.options),
+        "availability": coordinator.availability_diagnostics,
+        "actuators": coordinator.actuator_diagnostics,
+        "entity_writes": dict(coordinator.write_stats),
+        "profiling": coordinator.profiling_diagnostics,
+        "update_interval": coordinator.interval_diagnostics,
+        "statistics": coordinator.statistics_diagnostics,
+    }
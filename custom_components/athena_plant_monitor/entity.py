@@ -0,0 +1,105 @@
+"""Base entity for Athena Plant Monitor."""
+import logging
+from datetime import datetime
+from typing import Any, FrozenSet, Mapping, Optional, Tuple
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import SIGNIFICANCE_THRESHOLDS
+from .coordinator import AthenaPlantCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# (verfügbar, Zustand, Attribute ohne flüchtige Werte)
+WrittenState = Tuple[bool, Any, Mapping[str, Any]]
+
+# Kontext-Attribute aus den gemeinsamen Snapshots des Coordinators; sie
+# stehen in eigenen Sensoren und werden nicht im Recorder gespeichert
+CONTEXT_ATTRIBUTES = frozenset({
+    "growth_phase",
+    "crop_steering",
+    "substrate_size",
+    "current_irrigation_phase",
+    "lights_on",
+    "automation_enabled",
+})
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class AthenaPlantEntity(CoordinatorEntity):
+    """Coordinator entity that only writes its state when it changed.
+
+    After a coordinator update the entity compares its availability, value
+    and attributes with what it wrote last. Numeric values (and timestamps,
+    in seconds) must move by at least the significance threshold of the
+    entity key from SIGNIFICANCE_THRESHOLDS. Attributes listed in
+    ``_volatile_attributes`` follow the value (e.g. the deviation from the
+    target) and are not compared on their own.
+    """
+
+    _volatile_attributes: FrozenSet[str] = frozenset()
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES
+
+    def __init__(self, coordinator: AthenaPlantCoordinator, key: Optional[str] = None) -> None:
+        """Initialize with the key that selects the significance threshold."""
+        super().__init__(coordinator)
+        self._significance = SIGNIFICANCE_THRESHOLDS.get(key, 0.0) if key else 0.0
+        self._last_written: Optional[WrittenState] = None
+
+    def _shared_attributes(self, name: str) -> Mapping[str, Any]:
+        """Return a read-only context attribute snapshot of the coordinator.
+
+        ``growth``, ``growth_substrate``, ``growth_irrigation`` or
+        ``irrigation``; return it unchanged or merge it into own attributes.
+        """
+        return self.coordinator.data.get("attribute_snapshots", {}).get(name, {})
+
+    @property
+    def _tracked_value(self) -> Any:
+        """Return the value compared against the significance threshold."""
+        return self.state
+
+    def _current_state(self) -> WrittenState:
+        attrs = self.extra_state_attributes or {}
+        if not self._volatile_attributes.isdisjoint(attrs):
+            attrs = {key: value for key, value in attrs.items() if key not in self._volatile_attributes}
+        return self.available, self._tracked_value, attrs
+
+    def _significant(self, old: Any, new: Any) -> bool:
+        if old == new:
+            return False
+        if not self._significance or old is None or new is None:
+            return True
+        if _is_number(old) and _is_number(new):
+            return abs(new - old) >= self._significance
+        if isinstance(old, datetime) and isinstance(new, datetime):
+            return abs((new - old).total_seconds()) >= self._significance
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if it changed significantly."""
+        stats = self.coordinator.write_stats
+        if not self.coordinator.suppress_redundant_writes:
+            stats["written"] += 1
+            self.async_write_ha_state()
+            return
+
+        current = self._current_state()
+        last = self._last_written
+        if (
+            last is not None
+            and last[0] == current[0]
+            and (last[2] is current[2] or last[2] == current[2])
+            and not self._significant(last[1], current[1])
+        ):
+            stats["suppressed"] += 1
+            return
+
+        self._last_written = current
+        stats["written"] += 1
+        self.async_write_ha_state()
@@ -0,0 +1,206 @@
+"""Streaming noise filters for Athena Plant Monitor sensor values."""
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+class SampleFilter(ABC):
+    """Base class of a streaming filter stage.
+
+    ``update`` takes one sample and returns the filtered value. All stages
+    keep a fixed amount of state, so the work per sample is constant.
+    """
+
+    @abstractmethod
+    def update(self, value: float, timestamp: float) -> float:
+        """Filter one sample (timestamp in seconds)."""
+
+    def reset(self) -> None:
+        """Forget all state, e.g. after the sensor was unavailable."""
+
+
+class RollingMedian(SampleFilter):
+    """Median of the last ``window`` samples."""
+
+    def __init__(self, window: int) -> None:
+        self._window: Deque[float] = deque(maxlen=window)
+
+    def update(self, value: float, timestamp: float) -> float:
+        self._window.append(value)
+        return _median(list(self._window))
+
+    def reset(self) -> None:
+        self._window.clear()
+
+
+class ExponentialMovingAverage(SampleFilter):
+    """EMA with a time constant in seconds.
+
+    The smoothing factor follows from the time since the previous sample,
+    so the result does not depend on how often the sensor reports.
+    """
+
+    def __init__(self, time_constant: float) -> None:
+        self.time_constant = time_constant
+        self._value: Optional[float] = None
+        self._timestamp: Optional[float] = None
+
+    def update(self, value: float, timestamp: float) -> float:
+        if self._value is None or self._timestamp is None:
+            self._value = value
+        else:
+            alpha = 1 - math.exp(-max(timestamp - self._timestamp, 0) / self.time_constant)
+            self._value += alpha * (value - self._value)
+        self._timestamp = timestamp
+        return self._value
+
+    def reset(self) -> None:
+        self._value = None
+        self._timestamp = None
+
+
+class HampelFilter(SampleFilter):
+    """Outlier rejection against the median of the last ``window`` samples.
+
+    A sample deviating from the median by more than ``n_sigmas`` scaled
+    MADs (and at least ``min_deviation``) is replaced by the median. The
+    raw sample still enters the window, so a real step change passes
+    after about half a window.
+    """
+
+    MAD_SCALE = 1.4826  # MAD -> Standardabweichung bei Normalverteilung
+
+    def __init__(self, window: int, n_sigmas: float = 3.0, min_deviation: float = 0.0) -> None:
+        self.n_sigmas = n_sigmas
+        self.min_deviation = min_deviation
+        self._window: Deque[float] = deque(maxlen=window)
+        self.rejected = 0
+
+    def update(self, value: float, timestamp: float) -> float:
+        self._window.append(value)
+        if len(self._window) < 3:
+            return value
+        samples = list(self._window)
+        median = _median(samples)
+        mad = _median([abs(sample - median) for sample in samples])
+        limit = max(self.n_sigmas * self.MAD_SCALE * mad, self.min_deviation)
+        if abs(value - median) > limit:
+            self.rejected += 1
+            return median
+        return value
+
+    def reset(self) -> None:
+        self._window.clear()
+
+
+class RateLimiter(SampleFilter):
+    """Limit the change of the output to ``max_rate`` units per minute."""
+
+    def __init__(self, max_rate: float) -> None:
+        self.max_rate = max_rate
+        self._value: Optional[float] = None
+        self._timestamp: Optional[float] = None
+
+    def update(self, value: float, timestamp: float) -> float:
+        if self._value is None or self._timestamp is None:
+            self._value = value
+        else:
+            max_step = self.max_rate * max(timestamp - self._timestamp, 0) / 60
+            self._value += max(-max_step, min(max_step, value - self._value))
+        self._timestamp = timestamp
+        return self._value
+
+    def reset(self) -> None:
+        self._value = None
+        self._timestamp = None
+
+
+class FilterChain(SampleFilter):
+    """Run the stages of one sensor key in order."""
+
+    def __init__(self, stages: List[SampleFilter]) -> None:
+        self.stages = stages
+
+    def update(self, value: float, timestamp: float) -> float:
+        for stage in self.stages:
+            value = stage.update(value, timestamp)
+        return value
+
+    def reset(self) -> None:
+        for stage in self.stages:
+            stage.reset()
+
+    @property
+    def rejected(self) -> int:
+        """Return the number of samples rejected as outliers."""
+        return sum(getattr(stage, "rejected", 0) for stage in self.stages)
+
+
+def build_filter(config: Mapping[str, Any]) -> FilterChain:
+    """Create a filter chain from a SENSOR_FILTERS entry.
+
+    Stages run in a fixed order: outlier rejection, median, rate limit, EMA.
+    """
+    stages: List[SampleFilter] = []
+    if "hampel" in config:
+        stages.append(HampelFilter(
+            config["hampel"],
+            config.get("hampel_sigmas", 3.0),
+            config.get("min_deviation", 0.0),
+        ))
+    if "median" in config:
+        stages.append(RollingMedian(config["median"]))
+    if "max_rate" in config:
+        stages.append(RateLimiter(config["max_rate"]))
+    if "ema" in config:
+        stages.append(ExponentialMovingAverage(config["ema"]))
+    return FilterChain(stages)
+
+
+class SensorFilters:
+    """Filter chains for all configured sensor keys of one device."""
+
+    def __init__(self, config: Mapping[str, Mapping[str, Any]]) -> None:
+        """Create one chain per key of ``config``."""
+        self._chains: Dict[str, FilterChain] = {
+            key: build_filter(key_config) for key, key_config in config.items()
+        }
+
+    @property
+    def keys(self) -> List[str]:
+        """Return the filtered keys."""
+        return list(self._chains)
+
+    @property
+    def rejected(self) -> Dict[str, int]:
+        """Return the rejected outliers per key."""
+        return {key: chain.rejected for key, chain in self._chains.items()}
+
+    def apply(self, data: Dict[str, Any], raw: Dict[str, Any], timestamp: float, keys: Optional[List[str]] = None) -> None:
+        """Filter the values of ``keys`` (all if None) in place.
+
+        The unfiltered values are stored in ``raw``. Non-numeric values
+        (None while unavailable) pass through and reset the chain.
+        """
+        for key in (self._chains if keys is None else keys):
+            chain = self._chains.get(key)
+            if chain is None or key not in data:
+                continue
+            value = data[key]
+            raw[key] = value
+            if isinstance(value, float):
+                data[key] = round(chain.update(value, timestamp), 3)
+            else:
+                chain.reset()
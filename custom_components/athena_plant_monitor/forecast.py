@@ -0,0 +1,100 @@
+"""Dryback rate and time-to-threshold forecasting for Athena Plant Monitor."""
+import math
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+class DrybackEstimator:
+    """Streaming fit of the VWC decay curve.
+
+    Between irrigations the substrate dries back roughly exponentially,
+    ``vwc(t) = vwc0 * exp(-k * t)``. The estimator keeps the samples of a
+    rolling window and running least-squares sums of ``ln(vwc)`` over time,
+    so adding a sample and reading the fit are O(1) (amortized). A rise of
+    the VWC by more than ``reset_rise`` points (an irrigation shot) starts
+    a new curve.
+    """
+
+    def __init__(self, window: float, min_samples: int = 3, reset_rise: float = 1.0) -> None:
+        """Initialize with the window length in seconds."""
+        self.window = window
+        self.min_samples = min_samples
+        self.reset_rise = reset_rise
+        self._samples: Deque[Tuple[float, float, float]] = deque()  # (t, ln_vwc, vwc)
+        self._origin: Optional[float] = None
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+
+    def reset(self) -> None:
+        """Forget the current curve."""
+        self._samples.clear()
+        self._origin = None
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+
+    def _add_sums(self, t: float, y: float, sign: float) -> None:
+        self._sum_t += sign * t
+        self._sum_y += sign * y
+        self._sum_tt += sign * t * t
+        self._sum_ty += sign * t * y
+
+    def add(self, timestamp: float, vwc: float) -> None:
+        """Add a VWC sample (timestamp in seconds)."""
+        if vwc is None or vwc <= 0:
+            return
+        if self._samples and vwc - self._samples[-1][2] > self.reset_rise:
+            # Bewässerung erkannt: neue Rücktrocknungskurve
+            self.reset()
+        if self._origin is None:
+            self._origin = timestamp
+
+        t = (timestamp - self._origin) / 3600  # Stunden seit Kurvenbeginn
+        y = math.log(vwc)
+        self._samples.append((t, y, vwc))
+        self._add_sums(t, y, 1.0)
+
+        # Werte außerhalb des Fensters entfernen
+        oldest = t - self.window / 3600
+        while len(self._samples) > self.min_samples and self._samples[0][0] < oldest:
+            old_t, old_y, _ = self._samples.popleft()
+            self._add_sums(old_t, old_y, -1.0)
+
+    @property
+    def decay_constant(self) -> Optional[float]:
+        """Return k in 1/h (positive while drying back), None without a fit."""
+        n = len(self._samples)
+        if n < self.min_samples:
+            return None
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-12:
+            return None
+        slope = (n * self._sum_ty - self._sum_t * self._sum_y) / denominator
+        return -slope
+
+    @property
+    def latest_vwc(self) -> Optional[float]:
+        """Return the newest sample."""
+        return self._samples[-1][2] if self._samples else None
+
+    def dryback_rate(self, max_vwc: float) -> Optional[float]:
+        """Return the current dryback rate in percent (of max VWC) per hour."""
+        k = self.decay_constant
+        vwc = self.latest_vwc
+        if k is None or vwc is None or max_vwc <= 0:
+            return None
+        return vwc * k / max_vwc * 100
+
+    def hours_to_dryback(self, dryback_percent: float, max_vwc: float) -> Optional[float]:
+        """Return hours until the dryback reaches ``dryback_percent``.
+
+        0 if it is already reached, None if the substrate is not drying or
+        there is no fit yet.
+        """
+        vwc = self.latest_vwc
+        if vwc is None or max_vwc <= 0:
+            return None
+        threshold = max_vwc * (1 - dryback_percent / 100)
+        if vwc <= threshold:
+            return 0.0
+        k = self.decay_constant
+        if k is None or k <= 0 or threshold <= 0:
+            return None
+        return math.log(vwc / threshold) / k
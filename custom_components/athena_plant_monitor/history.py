@@ -0,0 +1,197 @@
+"""In-memory sensor history for Athena Plant Monitor."""
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+# Sensorwerte, deren Verlauf gespeichert wird
+HISTORY_KEYS = (
+    "vwc",
+    "ec_substrate",
+    "ph_substrate",
+    "temp_substrate",
+    "temperature",
+    "humidity",
+    "co2",
+    "vpd_calculated",
+    "dryback_percent",
+)
+
+
+class RingBuffer:
+    """Fixed-capacity circular buffer of (timestamp, value) samples.
+
+    Timestamps and values live in two preallocated ``array('d')`` blocks,
+    so memory does not grow and appending is O(1). Aggregations walk the
+    buffer backwards from the newest sample and stop at the window start.
+    """
+
+    __slots__ = ("capacity", "_times", "_values", "_head", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate a buffer for ``capacity`` samples."""
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0  # nächster Schreibindex
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        self._times[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def replace_latest(self, timestamp: float, value: float) -> None:
+        """Overwrite the newest sample (or append to an empty buffer)."""
+        if not self._size:
+            self.append(timestamp, value)
+            return
+        index = (self._head - 1) % self.capacity
+        self._times[index] = timestamp
+        self._values[index] = value
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """Return the newest sample."""
+        if not self._size:
+            return None
+        index = (self._head - 1) % self.capacity
+        return self._times[index], self._values[index]
+
+    def iter_window(self, seconds: Optional[float] = None, now: Optional[float] = None) -> Iterator[Tuple[float, float]]:
+        """Yield samples newest first, limited to the last ``seconds``."""
+        start = None
+        if seconds is not None:
+            start = (time.time() if now is None else now) - seconds
+        index = self._head
+        for _ in range(self._size):
+            index = (index - 1) % self.capacity
+            timestamp = self._times[index]
+            if start is not None and timestamp < start:
+                return
+            yield timestamp, self._values[index]
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._head = 0
+        self._size = 0
+
+
+def _slope_per_hour(samples: Iterable[Tuple[float, float]]) -> Optional[float]:
+    """Least-squares slope of the samples in units per hour."""
+    n = 0
+    sum_t = sum_v = sum_tt = sum_tv = 0.0
+    origin = None
+    for timestamp, value in samples:
+        if origin is None:
+            origin = timestamp
+        t = timestamp - origin  # numerisch stabil: relativ zum neuesten Wert
+        n += 1
+        sum_t += t
+        sum_v += value
+        sum_tt += t * t
+        sum_tv += t * value
+    if n < 2:
+        return None
+    denominator = n * sum_tt - sum_t * sum_t
+    if denominator == 0:
+        return None
+    return (n * sum_tv - sum_t * sum_v) / denominator * 3600
+
+
+class SensorHistory:
+    """Ring buffers for all tracked sensor keys of one device.
+
+    Samples closer together than ``resolution`` seconds replace the newest
+    sample instead of adding one, so event-driven bursts cannot push older
+    history out of the buffer. Memory per key is fixed at
+    ``retention / resolution`` samples.
+    """
+
+    def __init__(
+        self,
+        retention: float,
+        resolution: float,
+        keys: Iterable[str] = HISTORY_KEYS,
+    ) -> None:
+        """Create the buffers (retention and resolution in seconds)."""
+        self.retention = retention
+        self.resolution = resolution
+        capacity = max(2, int(retention // resolution) + 1)
+        self._buffers: Dict[str, RingBuffer] = {key: RingBuffer(capacity) for key in keys}
+
+    @property
+    def keys(self) -> List[str]:
+        """Return the tracked keys."""
+        return list(self._buffers)
+
+    def record(self, key: str, value: Optional[float], timestamp: Optional[float] = None) -> None:
+        """Record a value of a tracked key (ignores None and unknown keys)."""
+        buffer = self._buffers.get(key)
+        if buffer is None or value is None:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        latest = buffer.latest()
+        if latest is not None and timestamp - latest[0] < self.resolution:
+            # Zeitstempel der Slot-Startzeit behalten, nur den Wert erneuern
+            buffer.replace_latest(latest[0], float(value))
+        else:
+            buffer.append(timestamp, float(value))
+
+    def record_snapshot(self, data: Mapping[str, object], keys: Optional[Iterable[str]] = None, timestamp: Optional[float] = None) -> None:
+        """Record the tracked values of a coordinator snapshot."""
+        if timestamp is None:
+            timestamp = time.time()
+        for key in (self._buffers if keys is None else keys):
+            value = data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.record(key, value, timestamp)
+
+    def samples(self, key: str, minutes: Optional[float] = None) -> List[Tuple[float, float]]:
+        """Return the samples of the last ``minutes``, oldest first."""
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return []
+        samples = list(buffer.iter_window(None if minutes is None else minutes * 60))
+        samples.reverse()
+        return samples
+
+    def _window(self, key: str, minutes: float) -> Iterator[Tuple[float, float]]:
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return iter(())
+        return buffer.iter_window(minutes * 60)
+
+    def minimum(self, key: str, minutes: float) -> Optional[float]:
+        """Return the minimum over the last ``minutes``."""
+        return min((value for _, value in self._window(key, minutes)), default=None)
+
+    def maximum(self, key: str, minutes: float) -> Optional[float]:
+        """Return the maximum over the last ``minutes``."""
+        return max((value for _, value in self._window(key, minutes)), default=None)
+
+    def mean(self, key: str, minutes: float) -> Optional[float]:
+        """Return the arithmetic mean over the last ``minutes``."""
+        total = 0.0
+        n = 0
+        for _, value in self._window(key, minutes):
+            total += value
+            n += 1
+        return total / n if n else None
+
+    def slope(self, key: str, minutes: float) -> Optional[float]:
+        """Return the trend over the last ``minutes`` in units per hour."""
+        return _slope_per_hour(self._window(key, minutes))
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        for buffer in self._buffers.values():
+            buffer.clear()
@@ -0,0 +1,83 @@
+"""Hub scheduler that refreshes all Athena Plant Monitor devices together."""
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+if TYPE_CHECKING:
+    from .coordinator import AthenaPlantCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AthenaPlantHub:
+    """Own one timer for all device coordinators.
+
+    Every tick reads the states of all registered devices in one pass,
+    computes their derived values as a batch and then pushes all updates
+    to the entities together. The per-device coordinators have no timer
+    of their own in hub mode.
+    """
+
+    def __init__(self, hass: HomeAssistant, update_interval: int) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.update_interval = timedelta(seconds=update_interval)
+        self._coordinators: Dict[str, "AthenaPlantCoordinator"] = {}
+        self._unsub_timer: Optional[Callable[[], None]] = None
+
+    @property
+    def coordinators(self) -> List["AthenaPlantCoordinator"]:
+        """Return all registered coordinators."""
+        return list(self._coordinators.values())
+
+    @callback
+    def async_register(self, coordinator: "AthenaPlantCoordinator") -> Callable[[], None]:
+        """Add a device to the batch and return a callback to remove it."""
+        self._coordinators[coordinator.device_id] = coordinator
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass, self._async_tick, self.update_interval
+            )
+            _LOGGER.debug("Hub scheduler started (%s)", self.update_interval)
+
+        @callback
+        def _async_unregister() -> None:
+            self._coordinators.pop(coordinator.device_id, None)
+            if not self._coordinators and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+                _LOGGER.debug("Hub scheduler stopped")
+
+        return _async_unregister
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Refresh all devices in one batch."""
+        coordinators = self.coordinators
+
+        # 1. Alle Zustände in einem Durchgang lesen (Offline-Knoten nur bei fälliger Probe)
+        reads: List[Tuple["AthenaPlantCoordinator", Dict[str, Any]]] = [
+            (coordinator, coordinator.read_states())
+            for coordinator in coordinators
+            if coordinator.refresh_allowed()
+        ]
+
+        # 2. Abgeleitete Werte für alle Zelte berechnen
+        results: List[Tuple["AthenaPlantCoordinator", Dict[str, Any]]] = []
+        for coordinator, raw in reads:
+            try:
+                results.append((coordinator, coordinator.process_states(raw)))
+            except UpdateFailed as err:
+                # Knoten offline (Circuit Breaker), bereits vom Coordinator protokolliert
+                coordinator.async_set_update_error(err)
+            except Exception as err:
+                _LOGGER.error("Error updating %s in hub batch: %s", coordinator.device_id, err)
+                coordinator.async_set_update_error(err)
+
+        # 3. Alle Entitäten gemeinsam aktualisieren
+        for coordinator, data in results:
+            coordinator.async_set_updated_data(data)
@@ -0,0 +1,223 @@
+"""Irrigation shot executor for Athena Plant Monitor."""
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DATA_IRRIGATION
+
+_LOGGER = logging.getLogger(__name__)
+
+_JOB_IDS = count(1)
+
+
+def shot_duration(shot_size: float) -> int:
+    """Return the pump run time for a shot (30 s per 3 % substrate volume)."""
+    return int(30 * (shot_size / 3.0))
+
+
+@dataclass
+class IrrigationJob:
+    """One queued irrigation shot."""
+
+    owner: str
+    shot_size: float
+    duration: int
+    source: str = "manual"
+    on_complete: Optional[Callable[["IrrigationJob"], None]] = field(default=None, repr=False, compare=False)
+    job_id: int = field(default_factory=lambda: next(_JOB_IDS))
+    queued_at: datetime = field(default_factory=dt_util.now)
+    started_at: Optional[datetime] = None
+
+    def same_shot(self, other: "IrrigationJob") -> bool:
+        """Return whether both jobs would run the identical shot."""
+        return (
+            self.owner == other.owner
+            and self.shot_size == other.shot_size
+            and self.duration == other.duration
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the job as state attributes."""
+        return {
+            "job_id": self.job_id,
+            "device_id": self.owner,
+            "shot_size": self.shot_size,
+            "duration": self.duration,
+            "source": self.source,
+            "queued_at": self.queued_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+        }
+
+
+class IrrigationExecutor:
+    """Serialize irrigation shots on one pump.
+
+    Shots are queued and run one after another in a background task, so
+    callers return immediately. An identical shot that is still waiting in
+    the queue is not queued twice. Delayed shots (P1 sequences) are held as
+    timers until they are due. The pump is always switched off when a shot
+    ends, also when it is cancelled.
+    """
+
+    def __init__(self, hass: HomeAssistant, pump_entity_id: str) -> None:
+        """Initialize the executor for a pump switch."""
+        self.hass = hass
+        self.pump_entity_id = pump_entity_id
+        self._queue: Deque[IrrigationJob] = deque()
+        self._current: Optional[IrrigationJob] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._scheduled: Dict[int, tuple] = {}  # job_id -> (job, cancel timer)
+        self._listeners: Set[Callable[[], None]] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of shots waiting (queued or scheduled)."""
+        return len(self._queue) + len(self._scheduled)
+
+    @property
+    def in_flight(self) -> Optional[IrrigationJob]:
+        """Return the shot that is currently running."""
+        return self._current
+
+    def status(self, owner: Optional[str] = None) -> Dict[str, Any]:
+        """Return the queue state, optionally limited to one device."""
+        def _mine(job: IrrigationJob) -> bool:
+            return owner is None or job.owner == owner
+
+        queued = [job.as_dict() for job in self._queue if _mine(job)]
+        scheduled = [job.as_dict() for job, _ in self._scheduled.values() if _mine(job)]
+        current = self._current if self._current is not None and _mine(self._current) else None
+        return {
+            "queue_depth": len(queued) + len(scheduled),
+            "in_flight": current.as_dict() if current else None,
+            "queued": queued,
+            "scheduled": scheduled,
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for queue changes."""
+        self._listeners.add(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.discard(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_enqueue(self, job: IrrigationJob, delay: float = 0) -> IrrigationJob:
+        """Queue a shot (after ``delay`` seconds) and return the effective job."""
+        if delay > 0:
+            @callback
+            def _due(_now: datetime) -> None:
+                self._scheduled.pop(job.job_id, None)
+                self.async_enqueue(job)
+
+            self._scheduled[job.job_id] = (job, async_call_later(self.hass, delay, _due))
+            self._async_notify()
+            return job
+
+        for pending in self._queue:
+            if pending.same_shot(job):
+                _LOGGER.debug(f"Irrigation shot on {self.pump_entity_id} already queued (job {pending.job_id})")
+                return pending
+
+        self._queue.append(job)
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} irrigation {self.pump_entity_id}"
+            )
+        self._async_notify()
+        return job
+
+    async def _async_run(self) -> None:
+        """Work through the queue one shot at a time."""
+        while self._queue:
+            job = self._current = self._queue.popleft()
+            job.started_at = dt_util.now()
+            self._async_notify()
+            completed = False
+            try:
+                await self.hass.services.async_call(
+                    "switch", "turn_on", {"entity_id": self.pump_entity_id}, blocking=True
+                )
+                await asyncio.sleep(job.duration)
+                completed = True
+            except asyncio.CancelledError:
+                _LOGGER.warning(f"Irrigation shot {job.job_id} on {self.pump_entity_id} cancelled")
+                raise
+            except Exception as err:
+                _LOGGER.error(f"Error during irrigation shot on {self.pump_entity_id}: {err}")
+            finally:
+                # Pumpe immer ausschalten, auch bei Abbruch
+                try:
+                    await self.hass.services.async_call(
+                        "switch", "turn_off", {"entity_id": self.pump_entity_id}, blocking=True
+                    )
+                except Exception as err:
+                    _LOGGER.error(f"Could not turn off pump {self.pump_entity_id}: {err}")
+                self._current = None
+                self._async_notify()
+
+            if completed and job.on_complete is not None:
+                job.on_complete(job)
+
+    async def async_cancel(self, owner: Optional[str] = None) -> int:
+        """Cancel queued, scheduled and running shots (of one device or all).
+
+        Returns the number of cancelled jobs.
+        """
+        def _mine(job: IrrigationJob) -> bool:
+            return owner is None or job.owner == owner
+
+        cancelled = 0
+        for job_id, (job, cancel_timer) in list(self._scheduled.items()):
+            if _mine(job):
+                cancel_timer()
+                del self._scheduled[job_id]
+                cancelled += 1
+
+        kept = [job for job in self._queue if not _mine(job)]
+        cancelled += len(self._queue) - len(kept)
+        self._queue = deque(kept)
+
+        if self._current is not None and _mine(self._current) and self._worker is not None:
+            cancelled += 1
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            # Schüsse anderer Geräte auf derselben Pumpe weiter abarbeiten
+            if self._queue:
+                self._worker = self.hass.async_create_background_task(
+                    self._async_run(), f"{DOMAIN} irrigation {self.pump_entity_id}"
+                )
+
+        self._async_notify()
+        return cancelled
+
+
+@callback
+def async_get_executor(hass: HomeAssistant, pump_entity_id: str) -> IrrigationExecutor:
+    """Return the shared executor for a pump, creating it on first use."""
+    executors: Dict[str, IrrigationExecutor] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_IRRIGATION, {})
+    executor = executors.get(pump_entity_id)
+    if executor is None:
+        executor = executors[pump_entity_id] = IrrigationExecutor(hass, pump_entity_id)
+    return executor
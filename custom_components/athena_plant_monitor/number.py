@@ -1,15 +1,15 @@
 """Number platform for Athena Plant Monitor."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DATA_COORDINATOR
 from .coordinator import AthenaPlantCoordinator
+from .entity import CONTEXT_ATTRIBUTES, AthenaPlantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,16 +101,21 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AthenaPlantNumber(CoordinatorEntity, NumberEntity):
+class AthenaPlantNumber(AthenaPlantEntity, NumberEntity):
     """Representation of an Athena Plant Monitor number entity."""
 
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {
+        "auto_calculated_target", "deviation_from_auto", "manual_override", "daily_water_percent",
+        "water_amount_liters",
+    }
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: NumberEntityDescription,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_number_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -133,6 +138,14 @@ class AthenaPlantNumber(CoordinatorEntity, NumberEntity):
         
         if key == "substrate_size":
             return self.coordinator._growth_config.get("substrate_size", 10.0)
+        elif key in self.coordinator.target_overrides:
+            return self.coordinator.target_overrides[key]
+        elif key.endswith("_target_manual"):
+            # Ohne Override zeigt der Regler den automatischen Zielwert
+            auto_target = self.coordinator.get_auto_target(key.replace("_target_manual", "_target"))
+            if auto_target is not None:
+                return auto_target
+            return self._values.get(key, self.entity_description.native_min_value)
         else:
             return self._values.get(key, self.entity_description.native_min_value)
 
@@ -141,8 +154,11 @@ class AthenaPlantNumber(CoordinatorEntity, NumberEntity):
         key = self.entity_description.key
         
         if key == "substrate_size":
-            self.coordinator._growth_config["substrate_size"] = value
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.set_substrate_size(value)
+        elif key.endswith("_target_manual"):
+            # Manuelle Zielwerte werden einmalig in die Zielwert-Tabelle übernommen und
+            # gelten bis zum Zurücksetzen (Button/Service) oder Wechsel der Wachstumsphase
+            await self.coordinator.set_target_override(key, value)
         else:
             self._values[key] = value
         
@@ -150,7 +166,7 @@ class AthenaPlantNumber(CoordinatorEntity, NumberEntity):
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
         attrs = {}
         key = self.entity_description.key
@@ -159,7 +175,8 @@ class AthenaPlantNumber(CoordinatorEntity, NumberEntity):
         if key.endswith("_target_manual"):
             # For manual targets, show auto-calculated target for comparison
             base_key = key.replace("_target_manual", "_target")
-            auto_target = self.coordinator.data.get(base_key)
+            auto_target = self.coordinator.get_auto_target(base_key)
+            attrs["manual_override"] = key in self.coordinator.target_overrides
             if auto_target is not None:
                 attrs["auto_calculated_target"] = auto_target
                 attrs["deviation_from_auto"] = round(self.native_value - auto_target, 2) if self.native_value else 0
@@ -178,10 +195,9 @@ class AthenaPlantNumber(CoordinatorEntity, NumberEntity):
                 attrs["water_amount_liters"] = round(water_amount, 2)
         
         # Add growth context
-        growth_config = self.coordinator.data.get("growth_config", {})
-        attrs.update({
-            "growth_phase": growth_config.get("phase"),
-            "crop_steering": growth_config.get("steering"),
-        })
+        shared = self._shared_attributes("growth")
+        if not attrs:
+            return shared
+        attrs.update(shared)
         
         return attrs
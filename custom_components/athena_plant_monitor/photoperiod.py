@@ -0,0 +1,105 @@
+"""Photoperiod (day/night) detection for Athena Plant Monitor."""
+import logging
+from datetime import datetime, time, timedelta
+from typing import Callable, Optional, Tuple
+
+from .const import DEFAULT_LIGHT_SCHEDULE_START, DEFAULT_LIGHT_SCHEDULE_END
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_schedule(start: str, end: str) -> Tuple[time, time]:
+    """Parse the light schedule once, falling back to the default times."""
+    try:
+        return time.fromisoformat(start), time.fromisoformat(end)
+    except (TypeError, ValueError):
+        _LOGGER.warning(
+            "Invalid light schedule %s-%s, using %s-%s",
+            start, end, DEFAULT_LIGHT_SCHEDULE_START, DEFAULT_LIGHT_SCHEDULE_END,
+        )
+        return (
+            time.fromisoformat(DEFAULT_LIGHT_SCHEDULE_START),
+            time.fromisoformat(DEFAULT_LIGHT_SCHEDULE_END),
+        )
+
+
+def _next_occurrence(now: datetime, at: time) -> datetime:
+    """Return the first datetime strictly after ``now`` with the given wall time."""
+    candidate = now.replace(hour=at.hour, minute=at.minute, second=at.second, microsecond=0)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+class Photoperiod:
+    """Cached day/night decision.
+
+    The result is memoized until either a light entity changes state
+    (``invalidate``) or the schedule crosses its next transition.
+    """
+
+    def __init__(self, schedule_start: str, schedule_end: str) -> None:
+        """Initialize with the configured light schedule."""
+        self.schedule_start, self.schedule_end = _parse_schedule(schedule_start, schedule_end)
+        self._is_day: Optional[bool] = None
+        self._source: Optional[str] = None
+        self._valid_until: Optional[datetime] = None
+
+    @property
+    def source(self) -> Optional[str]:
+        """Return what decided the current state ("entity" or "schedule")."""
+        return self._source
+
+    @property
+    def next_transition(self) -> Optional[datetime]:
+        """Return when the schedule-based result expires (None if entity-based)."""
+        return self._valid_until
+
+    def invalidate(self) -> None:
+        """Forget the cached result, e.g. after a light entity changed."""
+        self._is_day = None
+        self._valid_until = None
+
+    def is_scheduled_day(self, at: time) -> bool:
+        """Return whether the schedule marks ``at`` as day.
+
+        The end time is exclusive: at exactly ``schedule_end`` it is already
+        night, so the result flips at the same instant the cache expires.
+        """
+        start, end = self.schedule_start, self.schedule_end
+        if start <= end:  # Normal case (e.g., 06:00 - 22:00)
+            return start <= at < end
+        # Overnight case (e.g., 22:00 - 06:00)
+        return at >= start or at < end
+
+    def next_schedule_transition(self, now: datetime) -> datetime:
+        """Return the next time the schedule switches between day and night."""
+        return min(
+            _next_occurrence(now, self.schedule_start),
+            _next_occurrence(now, self.schedule_end),
+        )
+
+    def is_day(self, now: datetime, entity_state: Callable[[], Optional[bool]]) -> bool:
+        """Return whether it is day, re-evaluating only when the cache expired.
+
+        ``entity_state`` returns True/False when a light entity decides the
+        photoperiod and None when the schedule should be used.
+        """
+        if self._is_day is not None and (self._valid_until is None or now < self._valid_until):
+            return self._is_day
+
+        by_entity = entity_state()
+        if by_entity is not None:
+            self._is_day = by_entity
+            self._source = "entity"
+            self._valid_until = None
+        else:
+            self._is_day = self.is_scheduled_day(now.time())
+            self._source = "schedule"
+            self._valid_until = self.next_schedule_transition(now)
+
+        _LOGGER.debug(
+            "Photoperiod: %s (%s, valid until %s)",
+            "Day" if self._is_day else "Night", self._source, self._valid_until,
+        )
+        return self._is_day
@@ -0,0 +1,91 @@
+"""Adaptive update interval for Athena Plant Monitor."""
+import logging
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .const import ADAPTIVE_RATE_THRESHOLDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptiveInterval:
+    """Choose the update interval from irrigation phase, photoperiod and trends.
+
+    - shots in flight or queued and P1 saturation: the minimum (second-level
+      VWC resolution while water goes in)
+    - P0/P2 with lights on: the configured base interval
+    - lights off (P3 overnight dryback): the maximum
+
+    The phase interval is divided by how far the fastest trend (units per
+    hour) exceeds its threshold from ADAPTIVE_RATE_THRESHOLDS. Shorter
+    intervals apply at once; longer ones at most double per update, so a
+    short calm period does not jump straight to the maximum.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        minimum: float,
+        maximum: float,
+        thresholds: Mapping[str, float] = ADAPTIVE_RATE_THRESHOLDS,
+    ) -> None:
+        """Initialize with the user bounds (seconds)."""
+        self.minimum = max(1.0, float(minimum))
+        self.maximum = max(self.minimum, float(maximum))
+        self.base = min(max(float(base), self.minimum), self.maximum)
+        self.thresholds = thresholds
+        self.current = self.base
+        self.reason = "base"
+
+    def target(
+        self,
+        phase: Optional[str],
+        lights_on: bool,
+        shots_active: bool,
+        rates: Mapping[str, Optional[float]],
+    ) -> Tuple[float, str]:
+        """Return the interval the current situation asks for and why."""
+        if shots_active:
+            return self.minimum, "irrigation"
+        if phase == "P1":
+            return self.minimum, "P1"
+        if lights_on:
+            interval, reason = self.base, phase or "day"
+        else:
+            interval, reason = self.maximum, "night"
+
+        # Schnelle Änderungen verkürzen das Intervall proportional
+        factor = 1.0
+        for key, threshold in self.thresholds.items():
+            rate = rates.get(key)
+            if rate is not None and threshold > 0 and abs(rate) / threshold > factor:
+                factor = abs(rate) / threshold
+                reason = f"{key}_trend"
+        return max(self.minimum, interval / factor), reason
+
+    def update(
+        self,
+        phase: Optional[str],
+        lights_on: bool,
+        shots_active: bool,
+        rates: Mapping[str, Optional[float]],
+    ) -> float:
+        """Adapt and return the current interval (seconds)."""
+        interval, reason = self.target(phase, lights_on, shots_active, rates)
+        if interval > self.current:
+            interval = min(interval, self.current * 2)
+        interval = round(interval, 1)
+        if interval != self.current:
+            _LOGGER.debug(f"Update interval {self.current}s -> {interval}s ({reason})")
+        self.current = interval
+        self.reason = reason
+        return interval
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the interval and its bounds for diagnostics."""
+        return {
+            "current": self.current,
+            "reason": self.reason,
+            "base": self.base,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+        }
@@ -0,0 +1,135 @@
+"""Per-stage profiling of the coordinator update pipeline."""
+import logging
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, ContextManager, Deque, Dict, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+RATE_WINDOW = 60  # seconds - Fenster für Updates pro Minute
+
+# Gemeinsamer Kontext ohne Profiler: keine Messung, keine Allokation
+NO_PROFILING: ContextManager[None] = nullcontext()
+
+
+class StageTimer:
+    """Call count and durations of one stage."""
+
+    __slots__ = ("count", "total", "last", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.maximum = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the durations in milliseconds."""
+        return {
+            "count": self.count,
+            "last_ms": round(self.last * 1000, 3),
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else None,
+            "max_ms": round(self.maximum * 1000, 3),
+        }
+
+
+class UpdateProfiler:
+    """Time the stages of a coordinator's updates.
+
+    The coordinator times its stages explicitly with ``stage``; without a
+    profiler it uses NO_PROFILING instead, so nothing is measured or
+    patched.
+
+    Stages: ``read``, ``filter``, ``derive``, ``statistics`` (history and
+    long-term aggregates), ``irrigation``, ``alerts``, ``snapshots`` (the
+    read-only copies of the configuration and the shared attributes),
+    ``fanout`` (entity listeners) and the totals ``refresh`` (full
+    refresh without read and fan-out) and ``event`` (coalesced state
+    events including their fan-out). ``coalesced`` counts state changes
+    that were merged into another change's refresh; ``skipped`` counts
+    refreshes that had nothing to process or wrote no entity state.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._stages: Dict[str, StageTimer] = {}
+        self._update_times: Deque[float] = deque()
+        self.updates = 0
+        self.coalesced = 0
+        self.skipped = 0
+        self.last_update: Optional[float] = None
+
+    def _stage(self, name: str) -> StageTimer:
+        timer = self._stages.get(name)
+        if timer is None:
+            timer = self._stages[name] = StageTimer()
+        return timer
+
+    def _count_update(self, seconds: float) -> None:
+        now = time.monotonic()
+        self.updates += 1
+        self.last_update = seconds
+        self._update_times.append(now)
+        while self._update_times[0] < now - RATE_WINDOW:
+            self._update_times.popleft()
+
+    @property
+    def updates_per_minute(self) -> int:
+        """Return the updates of the last minute."""
+        cutoff = time.monotonic() - RATE_WINDOW
+        return sum(1 for when in self._update_times if when >= cutoff)
+
+    def stages(self) -> Dict[str, Dict[str, Any]]:
+        """Return last/avg/max duration per stage."""
+        return {name: timer.as_dict() for name, timer in self._stages.items()}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return all counters for diagnostics."""
+        return {
+            "updates": self.updates,
+            "updates_per_minute": self.updates_per_minute,
+            "last_update_ms": round(self.last_update * 1000, 3) if self.last_update is not None else None,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "stages": self.stages(),
+        }
+
+    def stage(self, name: str, update: bool = False) -> "StageTiming":
+        """Return a context manager that times one run of a stage.
+
+        With ``update`` the stage is a full update: it only counts when the
+        block completes without an exception and also feeds the update
+        counters.
+        """
+        return StageTiming(self, self._stage(name), update)
+
+
+class StageTiming:
+    """Time one block of a stage (``with profiler.stage("derive"): ...``)."""
+
+    __slots__ = ("_profiler", "_timer", "_update", "_start")
+
+    def __init__(self, profiler: UpdateProfiler, timer: StageTimer, update: bool) -> None:
+        self._profiler = profiler
+        self._timer = timer
+        self._update = update
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        elapsed = time.perf_counter() - self._start
+        if not self._update:
+            self._timer.add(elapsed)
+        elif exc_type is None:
+            self._timer.add(elapsed)
+            self._profiler._count_update(elapsed)
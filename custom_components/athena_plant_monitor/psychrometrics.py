@@ -0,0 +1,194 @@
+"""Psychrometric calculations (VPD, dew point, ...) for Athena Plant Monitor.
+
+All functions accept scalars or (nested) sequences of equal shape, e.g. one
+row per tent and one column per history sample. With NumPy installed,
+sequences are evaluated as vectorized arrays and NumPy arrays are returned;
+without it the same formulas run element by element and return lists.
+Scalar inputs always return floats (or None if an input is None).
+
+Saturation vapor pressure uses the Tetens/Magnus equation over water:
+``es = 0.6108 * exp(17.27 * T / (T + 237.3))`` in kPa, T in °C.
+"""
+import math
+from typing import Any, Callable, Dict
+
+try:
+    import numpy as np
+except ImportError:  # optional
+    np = None
+
+TETENS_A = 0.6108  # kPa
+TETENS_B = 17.27
+TETENS_C = 237.3  # °C
+
+STANDARD_PRESSURE = 101.325  # kPa
+WATER_VAPOR_GAS_CONSTANT = 461.5  # J/(kg·K)
+MIN_HUMIDITY = 0.01  # % - verhindert log(0) beim Taupunkt
+
+# Ergebnisschlüssel von psychrometrics()
+QUANTITIES = (
+    "saturation_vapor_pressure",
+    "actual_vapor_pressure",
+    "vpd",
+    "leaf_vpd",
+    "dew_point",
+    "absolute_humidity",
+    "enthalpy",
+)
+
+
+class _PurePython:
+    """Math namespace with the NumPy function names used by the kernels."""
+
+    exp = staticmethod(math.exp)
+    log = staticmethod(math.log)
+
+    @staticmethod
+    def maximum(a: float, b: float) -> float:
+        return max(a, b)
+
+    @staticmethod
+    def minimum(a: float, b: float) -> float:
+        return min(a, b)
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (int, float))
+
+
+def _broadcast(kernel: Callable[..., Any], args: tuple) -> Any:
+    """Apply a kernel element-wise over nested sequences (pure Python)."""
+    if all(_is_scalar(arg) for arg in args):
+        if any(arg is None for arg in args):
+            return None
+        return kernel(_PurePython, *(float(arg) for arg in args))
+
+    length = next(len(arg) for arg in args if not _is_scalar(arg))
+    return [
+        _broadcast(kernel, tuple(arg if _is_scalar(arg) else arg[i] for arg in args))
+        for i in range(length)
+    ]
+
+
+def _apply(kernel: Callable[..., Any], *args: Any) -> Any:
+    """Evaluate a kernel on scalars, lists or arrays."""
+    if np is not None and not all(_is_scalar(arg) for arg in args):
+        return kernel(np, *(np.asarray(arg, dtype=float) for arg in args))
+    return _broadcast(kernel, args)
+
+
+# Kernels: ``m`` is either numpy or _PurePython
+
+def _svp(m: Any, t: Any) -> Any:
+    return TETENS_A * m.exp(TETENS_B * t / (t + TETENS_C))
+
+
+def _avp(m: Any, t: Any, rh: Any) -> Any:
+    return _svp(m, t) * rh / 100
+
+
+def _vpd(m: Any, t: Any, rh: Any) -> Any:
+    return _svp(m, t) * (100 - rh) / 100
+
+
+def _leaf_vpd(m: Any, t: Any, rh: Any, leaf_t: Any) -> Any:
+    return _svp(m, leaf_t) - _avp(m, t, rh)
+
+
+def _dew_point(m: Any, t: Any, rh: Any) -> Any:
+    gamma = m.log(m.maximum(rh, MIN_HUMIDITY) / 100) + TETENS_B * t / (t + TETENS_C)
+    return TETENS_C * gamma / (TETENS_B - gamma)
+
+
+def _absolute_humidity(m: Any, t: Any, rh: Any) -> Any:
+    # g/m³ aus Dampfdruck (Pa) und idealem Gasgesetz
+    return _avp(m, t, rh) * 1000 / (WATER_VAPOR_GAS_CONSTANT * (t + 273.15)) * 1000
+
+
+def _enthalpy(m: Any, t: Any, rh: Any, pressure: Any) -> Any:
+    # kJ/kg trockene Luft
+    e = _avp(m, t, rh)
+    mixing_ratio = 0.622 * e / (pressure - e)
+    return 1.006 * t + mixing_ratio * (2501 + 1.86 * t)
+
+
+def saturation_vapor_pressure(temperature: Any) -> Any:
+    """Return the saturation vapor pressure in kPa."""
+    return _apply(_svp, temperature)
+
+
+def actual_vapor_pressure(temperature: Any, humidity: Any) -> Any:
+    """Return the actual vapor pressure in kPa."""
+    return _apply(_avp, temperature, humidity)
+
+
+def vpd(temperature: Any, humidity: Any) -> Any:
+    """Return the air vapor pressure deficit in kPa."""
+    return _apply(_vpd, temperature, humidity)
+
+
+def leaf_vpd(temperature: Any, humidity: Any, leaf_temperature: Any = None, leaf_offset: Any = 0.0) -> Any:
+    """Return the leaf VPD in kPa.
+
+    The leaf temperature is either measured (``leaf_temperature``) or
+    estimated as air temperature plus ``leaf_offset`` (usually negative).
+    """
+    if leaf_temperature is None:
+        return _apply(lambda m, t, rh, off: _leaf_vpd(m, t, rh, t + off), temperature, humidity, leaf_offset)
+    return _apply(_leaf_vpd, temperature, humidity, leaf_temperature)
+
+
+def dew_point(temperature: Any, humidity: Any) -> Any:
+    """Return the dew point in °C."""
+    return _apply(_dew_point, temperature, humidity)
+
+
+def absolute_humidity(temperature: Any, humidity: Any) -> Any:
+    """Return the absolute humidity in g/m³."""
+    return _apply(_absolute_humidity, temperature, humidity)
+
+
+def enthalpy(temperature: Any, humidity: Any, pressure: Any = STANDARD_PRESSURE) -> Any:
+    """Return the specific enthalpy of moist air in kJ/kg dry air."""
+    return _apply(_enthalpy, temperature, humidity, pressure)
+
+
+def psychrometrics(
+    temperature: Any,
+    humidity: Any,
+    leaf_offset: Any = 0.0,
+    pressure: Any = STANDARD_PRESSURE,
+) -> Dict[str, Any]:
+    """Compute all quantities in one batched call.
+
+    Returns a dict keyed by QUANTITIES, each value shaped like the inputs.
+    Example: ``psychrometrics(temps, rhs)`` with ``temps``/``rhs`` shaped
+    (tents, samples) backfills a whole history at once. Elements with a
+    None input are None in every quantity (NaN on the NumPy path).
+    """
+    def _kernel(m: Any, t: Any, rh: Any, off: Any, p: Any) -> Dict[str, Any]:
+        return {
+            "saturation_vapor_pressure": _svp(m, t),
+            "actual_vapor_pressure": _avp(m, t, rh),
+            "vpd": _vpd(m, t, rh),
+            "leaf_vpd": _leaf_vpd(m, t, rh, t + off),
+            "dew_point": _dew_point(m, t, rh),
+            "absolute_humidity": _absolute_humidity(m, t, rh),
+            "enthalpy": _enthalpy(m, t, rh, p),
+        }
+
+    result = _apply(_kernel, temperature, humidity, leaf_offset, pressure)
+    if not isinstance(result, dict):
+        # Reiner Python-Pfad: (verschachtelte) Liste von Dicts -> Dict von Listen
+        return _transpose(result)
+    return result
+
+
+def _transpose(rows: Any) -> Dict[str, Any]:
+    """Turn a result dict, None or nested lists of them into a dict of nested lists."""
+    if isinstance(rows, dict):
+        return rows
+    if rows is None:
+        return dict.fromkeys(QUANTITIES)
+    items = [_transpose(row) for row in rows]
+    return {key: [item[key] for item in items] for key in QUANTITIES}
@@ -0,0 +1,183 @@
+"""Coordinator registry for Athena Plant Monitor."""
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, DATA_REGISTRY
+
+if TYPE_CHECKING:
+    from .coordinator import AthenaPlantCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _as_list(value: Any) -> List[str]:
+    """Normalize a single id or a list of ids."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+class CoordinatorRegistry:
+    """Constant-time lookup of coordinators for service calls.
+
+    Coordinators are indexed by ESPHome device ID, by config entry and by
+    the entity IDs of their mapped ESPHome entities, so service targets
+    can be resolved without scanning ``hass.data``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._by_device: Dict[str, "AthenaPlantCoordinator"] = {}
+        self._by_entry: Dict[str, "AthenaPlantCoordinator"] = {}
+        self._by_entity_id: Dict[str, "AthenaPlantCoordinator"] = {}
+
+    @property
+    def coordinators(self) -> List["AthenaPlantCoordinator"]:
+        """Return all registered coordinators."""
+        return list(self._by_entry.values())
+
+    @callback
+    def async_register(self, entry_id: str, coordinator: "AthenaPlantCoordinator") -> Callable[[], None]:
+        """Register a coordinator and return a callback that removes it."""
+        self._by_device[coordinator.device_id] = coordinator
+        self._by_entry[entry_id] = coordinator
+        for entity_id in coordinator.tracked_entity_ids:
+            self._by_entity_id[entity_id] = coordinator
+
+        @callback
+        def _async_unregister() -> None:
+            self._by_entry.pop(entry_id, None)
+            if self._by_device.get(coordinator.device_id) is coordinator:
+                self._by_device.pop(coordinator.device_id)
+            for entity_id in coordinator.tracked_entity_ids:
+                if self._by_entity_id.get(entity_id) is coordinator:
+                    self._by_entity_id.pop(entity_id)
+
+        return _async_unregister
+
+    def get(self, device_id: str) -> Optional["AthenaPlantCoordinator"]:
+        """Return the coordinator for an ESPHome device ID."""
+        return self._by_device.get(device_id)
+
+    def get_by_entry(self, entry_id: str) -> Optional["AthenaPlantCoordinator"]:
+        """Return the coordinator for a config entry."""
+        return self._by_entry.get(entry_id)
+
+    def _from_config_entries(self, entry_ids: Iterable[str]) -> List["AthenaPlantCoordinator"]:
+        """Return coordinators belonging to any of the given config entries."""
+        return [self._by_entry[entry_id] for entry_id in entry_ids if entry_id in self._by_entry]
+
+    @callback
+    def async_resolve_device(self, hass: HomeAssistant, device_id: str) -> List["AthenaPlantCoordinator"]:
+        """Resolve an ESPHome device ID or a Home Assistant device registry ID."""
+        coordinator = self._by_device.get(device_id)
+        if coordinator is not None:
+            return [coordinator]
+
+        device = dr.async_get(hass).async_get(device_id)
+        if device is None:
+            return []
+
+        # Unser eigenes Gerät
+        coordinators = self._from_config_entries(device.config_entries)
+        if coordinators:
+            return coordinators
+
+        # ESPHome-Gerät: über dessen Entitäten zuordnen
+        entity_registry = er.async_get(hass)
+        for entity in er.async_entries_for_device(entity_registry, device_id):
+            coordinator = self._by_entity_id.get(entity.entity_id)
+            if coordinator is not None:
+                return [coordinator]
+        return []
+
+    @callback
+    def async_resolve_entity(self, hass: HomeAssistant, entity_id: str) -> List["AthenaPlantCoordinator"]:
+        """Resolve one of our entities or a mapped ESPHome entity."""
+        coordinator = self._by_entity_id.get(entity_id)
+        if coordinator is not None:
+            return [coordinator]
+
+        entity = er.async_get(hass).async_get(entity_id)
+        if entity is None or entity.config_entry_id is None:
+            return []
+        return self._from_config_entries([entity.config_entry_id])
+
+    @callback
+    def async_resolve_area(self, hass: HomeAssistant, area_id: str) -> List["AthenaPlantCoordinator"]:
+        """Resolve all devices and entities assigned to an area."""
+        resolved: Dict[str, "AthenaPlantCoordinator"] = {}
+        for device in dr.async_entries_for_area(dr.async_get(hass), area_id):
+            for coordinator in self.async_resolve_device(hass, device.id):
+                resolved[coordinator.device_id] = coordinator
+
+        for entity in er.async_entries_for_area(er.async_get(hass), area_id):
+            for coordinator in self.async_resolve_entity(hass, entity.entity_id):
+                resolved[coordinator.device_id] = coordinator
+        return list(resolved.values())
+
+    @callback
+    def async_resolve(self, hass: HomeAssistant, call_data: Mapping[str, Any]) -> List["AthenaPlantCoordinator"]:
+        """Resolve the targets of a service call to coordinators.
+
+        Targets may be device IDs, entity IDs, area IDs or "all". Without
+        any target the call is only unambiguous if exactly one device is
+        configured.
+        """
+        device_ids = _as_list(call_data.get(ATTR_DEVICE_ID))
+        entity_ids = _as_list(call_data.get(ATTR_ENTITY_ID))
+        area_ids = _as_list(call_data.get(ATTR_AREA_ID))
+
+        if ENTITY_MATCH_ALL in device_ids or ENTITY_MATCH_ALL in entity_ids:
+            return self.coordinators
+
+        if not device_ids and not entity_ids and not area_ids:
+            if len(self._by_entry) == 1:
+                return self.coordinators
+            if self._by_entry:
+                _LOGGER.error(
+                    "Multiple devices configured (%s), please specify a device_id",
+                    ", ".join(sorted(self._by_device)),
+                )
+            return []
+
+        resolved: Dict[str, "AthenaPlantCoordinator"] = {}
+        for device_id in device_ids:
+            coordinators = self.async_resolve_device(hass, device_id)
+            if not coordinators:
+                _LOGGER.warning(f"Unknown device: {device_id}")
+            for coordinator in coordinators:
+                resolved[coordinator.device_id] = coordinator
+
+        for entity_id in entity_ids:
+            coordinators = self.async_resolve_entity(hass, entity_id)
+            if not coordinators:
+                _LOGGER.warning(f"Entity {entity_id} does not belong to an Athena Plant Monitor device")
+            for coordinator in coordinators:
+                resolved[coordinator.device_id] = coordinator
+
+        for area_id in area_ids:
+            coordinators = self.async_resolve_area(hass, area_id)
+            if not coordinators:
+                _LOGGER.warning(f"No Athena Plant Monitor device in area {area_id}")
+            for coordinator in coordinators:
+                resolved[coordinator.device_id] = coordinator
+
+        return list(resolved.values())
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> CoordinatorRegistry:
+    """Return the registry, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_REGISTRY)
+    if registry is None:
+        registry = domain_data[DATA_REGISTRY] = CoordinatorRegistry()
+    return registry
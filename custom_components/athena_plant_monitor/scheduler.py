@@ -0,0 +1,236 @@
+"""P0-P3 irrigation state machine for Athena Plant Monitor."""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import IRRIGATION_PHASES
+
+_LOGGER = logging.getLogger(__name__)
+
+ShotCallback = Callable[[float, str], Awaitable[Any]]
+
+# Ältere gespeicherte Phasenstarts stammen von einem früheren Lichttag
+RESTORE_MAX_AGE = timedelta(hours=24)
+
+
+class IrrigationScheduler:
+    """Drive the Athena irrigation phases from the photoperiod and VWC.
+
+    - Lights on: P0, additional dryback for ``duration_hours`` without shots.
+    - P1: saturation shots every ``interval_minutes`` until the VWC target
+      is reached or ``max_shots`` were fired.
+    - P2: maintenance shot whenever the dryback from the peak exceeds
+      ``trigger_dryback``.
+    - Lights off: P3, overnight dryback without shots.
+
+    The scheduler has no polling loop. It is woken by ``async_update``
+    (new sensor data) and by a single timer for its next own event (end of
+    P0, next P1 shot or the next light schedule transition).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        state: Dict[str, Any],
+        fire_shot: ShotCallback,
+        on_change: Callable[[], None],
+        request_refresh: Callable[[], None],
+    ) -> None:
+        """Initialize with the coordinator's irrigation state dict (mutated in place).
+
+        ``on_change`` publishes state changed by a timer (changes made in
+        ``async_update`` are picked up by the running update itself),
+        ``request_refresh`` asks for fresh sensor data at light schedule
+        transitions.
+        """
+        self.hass = hass
+        self._state = state
+        self._fire_shot = fire_shot
+        self._on_change = on_change
+        self._request_refresh = request_refresh
+        self._initialized = False
+        self._phase_started: Optional[datetime] = None
+        self._p1_shots = 0
+        self._last_shot: Optional[datetime] = None
+        self._vwc: Optional[float] = None
+        self._vwc_target: Optional[float] = None
+        self._next_event: Optional[datetime] = None
+        self._next_light_change: Optional[datetime] = None
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+
+    @property
+    def phase(self) -> str:
+        """Return the current phase."""
+        return self._state["current_phase"]
+
+    @property
+    def next_event(self) -> Optional[datetime]:
+        """Return when the scheduler wakes up next."""
+        return self._next_event
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return scheduler details for state attributes."""
+        return {
+            "phase_started": self._phase_started.isoformat() if self._phase_started else None,
+            "p1_shots": self._p1_shots,
+            "next_event": self._next_event.isoformat() if self._next_event else None,
+        }
+
+    @callback
+    def async_update(
+        self,
+        lights_on: bool,
+        vwc: Optional[float],
+        vwc_target: Optional[float],
+        next_light_change: Optional[datetime] = None,
+    ) -> bool:
+        """Feed new sensor data; return True if the phase changed."""
+        self._vwc = vwc
+        self._vwc_target = vwc_target
+        self._next_light_change = next_light_change
+        now = dt_util.now()
+        phase = self.phase
+
+        if not self._initialized:
+            self._initialized = True
+            self._restore_phase(lights_on, now)
+        elif not lights_on and phase != "P3":
+            self._enter("P3", now)
+        elif lights_on and phase == "P3":
+            self._enter("P0", now)
+        elif phase == "P0" and self._p0_end() <= now:
+            self._enter("P1", now)
+        elif phase == "P1" and self._target_reached():
+            self._enter("P2", now)
+        elif phase == "P2":
+            self._check_maintenance(now)
+
+        self._schedule_wakeup(now)
+        return self.phase != phase
+
+    def _restore_phase(self, lights_on: bool, now: datetime) -> None:
+        """Pick a safe phase after a restart (timers are not persisted).
+
+        The phase and its start are persisted with the irrigation state, so
+        a restart during P0 continues the running dryback instead of
+        starting another full P0.
+        """
+        phase = self.phase
+        started = self._state.get("phase_started")
+        if not isinstance(started, datetime) or not timedelta(0) <= now - started < RESTORE_MAX_AGE:
+            started = None  # unbekannt oder von einem früheren Tag
+
+        if not lights_on:
+            self._enter("P3", now)
+        elif phase == "P3":
+            self._enter("P0", now)
+        elif phase in ("P1", "P2"):
+            # Anzahl der P1-Schüsse ist unbekannt: nicht erneut sättigen
+            self._enter("P2", now)
+        elif started is not None:
+            self._phase_started = started
+            if self._p0_end() <= now:
+                self._enter("P1", now)
+        else:
+            self._enter("P0", now)
+
+    def _enter(self, phase: str, now: datetime) -> None:
+        """Switch to ``phase`` and run its entry actions."""
+        if self._state["current_phase"] != phase:
+            _LOGGER.info(f"Irrigation phase {self._state['current_phase']} -> {phase}")
+        self._state["current_phase"] = phase
+        self._state["phase_started"] = self._phase_started = now
+
+        if phase == "P1":
+            self._p1_shots = 0
+            # Neuer Bewässerungstag: Peak-VWC ab jetzt neu bestimmen
+            if self._vwc is not None:
+                self._state["max_vwc_today"] = self._vwc
+            if self._target_reached():
+                self._enter("P2", now)
+            else:
+                self._shoot("P1", IRRIGATION_PHASES["P1"]["shot_size_percent"], now)
+                self._p1_shots += 1
+
+    def _p0_end(self) -> datetime:
+        return self._phase_started + timedelta(hours=IRRIGATION_PHASES["P0"]["duration_hours"])
+
+    def _next_p1_shot(self) -> datetime:
+        return self._last_shot + timedelta(minutes=IRRIGATION_PHASES["P1"]["interval_minutes"])
+
+    def _target_reached(self) -> bool:
+        return self._vwc is not None and self._vwc_target is not None and self._vwc >= self._vwc_target
+
+    def _check_maintenance(self, now: datetime) -> None:
+        """Fire a P2 shot when the dryback from the peak exceeds the trigger."""
+        max_vwc = self._state.get("max_vwc_today") or 0
+        if self._vwc is None or max_vwc <= 0:
+            return
+        dryback = (max_vwc - self._vwc) / max_vwc * 100
+        config = IRRIGATION_PHASES["P2"]
+        if dryback < config["trigger_dryback"]:
+            return
+        if self._last_shot and now - self._last_shot < timedelta(minutes=config["min_interval_minutes"]):
+            return  # der letzte Schuss wirkt noch nicht im Sensorwert
+        self._shoot("P2", config["shot_size_percent"], now)
+
+    def _shoot(self, source: str, shot_size: float, now: datetime) -> None:
+        """Queue a shot if automation is enabled."""
+        self._last_shot = now
+        if not self._state.get("automation_enabled", True):
+            _LOGGER.debug(f"{source} shot skipped, automation disabled")
+            return
+        self.hass.async_create_task(self._fire_shot(shot_size, source))
+
+    @callback
+    def _schedule_wakeup(self, now: datetime) -> None:
+        """Arm the timer for the next own event of the current phase."""
+        candidates = [self._next_light_change]
+        if self.phase == "P0":
+            candidates.append(self._p0_end())
+        elif self.phase == "P1" and self._last_shot is not None:
+            candidates.append(self._next_p1_shot())
+        wakeup = min((at for at in candidates if at is not None), default=None)
+
+        if wakeup == self._next_event and self._unsub_timer is not None:
+            return
+        self._cancel_timer()
+        self._next_event = wakeup
+        if wakeup is not None:
+            self._unsub_timer = async_track_point_in_time(self.hass, self._async_wakeup, max(wakeup, now))
+
+    @callback
+    def _async_wakeup(self, now: datetime) -> None:
+        """Handle the timer of the next scheduled event."""
+        self._unsub_timer = None
+        self._next_event = None
+        if self._next_light_change is not None and self._next_light_change <= now:
+            # Lichtwechsel laut Zeitplan: über ein normales Update auswerten
+            self._next_light_change = None
+            self._request_refresh()
+        elif self.phase == "P1" and self._last_shot is not None and self._next_p1_shot() <= now:
+            if self._target_reached() or self._p1_shots >= IRRIGATION_PHASES["P1"]["max_shots"]:
+                self._enter("P2", now)
+            else:
+                self._shoot("P1", IRRIGATION_PHASES["P1"]["shot_size_percent"], now)
+                self._p1_shots += 1
+            self._on_change()
+        elif self.phase == "P0" and self._p0_end() <= now:
+            self._enter("P1", now)
+            self._on_change()
+        self._schedule_wakeup(now)
+
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel pending timers."""
+        self._cancel_timer()
+        self._next_event = None
@@ -1,12 +1,11 @@
 """Select platform for Athena Plant Monitor."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -15,6 +14,7 @@ from .const import (
     CROP_STEERING_STRATEGIES,
 )
 from .coordinator import AthenaPlantCoordinator
+from .entity import CONTEXT_ATTRIBUTES, AthenaPlantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,16 +49,23 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AthenaPlantSelect(CoordinatorEntity, SelectEntity):
+class AthenaPlantSelect(AthenaPlantEntity, SelectEntity):
     """Representation of an Athena Plant Monitor select entity."""
 
+    # Empfehlungen der gewählten Option sind statisch
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {
+        "phase_name", "recommended_vwc", "recommended_ec", "recommended_ph", "recommended_vpd",
+        "recommended_temp", "recommended_humidity", "recommended_dryback",
+        "strategy_name", "description", "shot_multiplier", "dryback_adjustment", "ec_adjustment",
+    }
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: SelectEntityDescription,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_select_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -85,7 +92,7 @@ class AthenaPlantSelect(CoordinatorEntity, SelectEntity):
             await self.coordinator.set_crop_steering(option)
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
         attrs = {}
         key = self.entity_description.key
@@ -128,11 +135,6 @@ class AthenaPlantSelect(CoordinatorEntity, SelectEntity):
                 attrs["ec_adjustment"] = "0 ppm"
         
         # Add current irrigation state
-        irrigation_state = self.coordinator.data.get("irrigation_state", {})
-        attrs.update({
-            "current_irrigation_phase": irrigation_state.get("current_phase"),
-            "lights_on": irrigation_state.get("lights_on"),
-            "automation_enabled": irrigation_state.get("automation_enabled"),
-        })
+        attrs.update(self._shared_attributes("irrigation"))
         
         return attrs
@@ -1,6 +1,6 @@
 """Sensor platform for Athena Plant Monitor."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -14,11 +14,11 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfPressure,
     CONCENTRATION_PARTS_PER_MILLION,
-    UnitOfIlluminance,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -27,6 +27,7 @@ from .const import (
     DEVICE_CLASSES,
 )
 from .coordinator import AthenaPlantCoordinator
+from .entity import CONTEXT_ATTRIBUTES, AthenaPlantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,7 +61,7 @@ SENSOR_DESCRIPTIONS = [
     SensorEntityDescription(
         key="co2",
         name="CO₂ Konzentration",
-        device_class=SensorDeviceClass.CARBON_DIOXIDE,
+        device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         icon="mdi:molecule-co2",
@@ -111,6 +112,13 @@ SENSOR_DESCRIPTIONS = [
         native_unit_of_measurement="kPa",
         icon="mdi:air-filter",
     ),
+    SensorEntityDescription(
+        key="vpd_leaf",
+        name="Blatt-VPD",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="kPa",
+        icon="mdi:leaf",
+    ),
     SensorEntityDescription(
         key="dryback_percent",
         name="Dryback Prozent",
@@ -118,6 +126,25 @@ SENSOR_DESCRIPTIONS = [
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:trending-down",
     ),
+    SensorEntityDescription(
+        key="dryback_rate",
+        name="Dryback Rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="%/h",
+        icon="mdi:speedometer-slow",
+    ),
+    SensorEntityDescription(
+        key="p2_trigger_eta",
+        name="P2 Trigger Prognose",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:clock-end",
+    ),
+    SensorEntityDescription(
+        key="dryback_target_eta",
+        name="Dryback-Ziel Prognose",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:clock-end",
+    ),
     
     # Target sensors
     SensorEntityDescription(
@@ -166,7 +193,7 @@ SENSOR_DESCRIPTIONS = [
     SensorEntityDescription(
         key="co2_target",
         name="CO₂ Zielwert",
-        device_class=SensorDeviceClass.CARBON_DIOXIDE,
+        device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         icon="mdi:bullseye-arrow",
@@ -227,6 +254,12 @@ STATUS_SENSOR_DESCRIPTIONS = [
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:trending-up",
     ),
+    SensorEntityDescription(
+        key="irrigation_queue",
+        name="Bewässerungswarteschlange",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:tray-full",
+    ),
     SensorEntityDescription(
         key="is_day_cycle",
         name="Tag/Nacht Zyklus",
@@ -235,6 +268,42 @@ STATUS_SENSOR_DESCRIPTIONS = [
 ]
 
 
+# Laufzeitmessung des Update-Pipelines (nur mit aktivierter Profilierung)
+PROFILING_SENSOR_DESCRIPTIONS = [
+    SensorEntityDescription(
+        key="update_duration",
+        name="Update-Dauer",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:timer-outline",
+    ),
+    SensorEntityDescription(
+        key="updates_per_minute",
+        name="Updates pro Minute",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="1/min",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:update",
+    ),
+    SensorEntityDescription(
+        key="coalesced_refreshes",
+        name="Zusammengefasste Aktualisierungen",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:call-merge",
+    ),
+    SensorEntityDescription(
+        key="skipped_refreshes",
+        name="Übersprungene Aktualisierungen",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:debug-step-over",
+    ),
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -253,6 +322,11 @@ async def async_setup_entry(
     for description in STATUS_SENSOR_DESCRIPTIONS:
         entities.append(AthenaPlantStatusSensor(coordinator, description))
 
+    # Diagnosesensoren der Laufzeitmessung
+    if coordinator.profiler is not None:
+        for description in PROFILING_SENSOR_DESCRIPTIONS:
+            entities.append(AthenaPlantProfilingSensor(coordinator, description))
+
     # Add alert sensors
     entities.extend([
         AthenaPlantAlertSensor(coordinator, "critical", "Kritische Alerts"),
@@ -263,16 +337,19 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AthenaPlantSensor(CoordinatorEntity, SensorEntity):
+class AthenaPlantSensor(AthenaPlantEntity, SensorEntity):
     """Representation of an Athena Plant Monitor sensor."""
 
+    _volatile_attributes = frozenset({"deviation", "deviation_percent", "raw_value"})
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {"target", "deviation", "deviation_percent", "raw_value"}
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -283,7 +360,11 @@ class AthenaPlantSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.data.get(self.entity_description.key)
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _tracked_value(self) -> Any:
+        return self.native_value
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
         attrs = {}
         
@@ -300,26 +381,34 @@ class AthenaPlantSensor(CoordinatorEntity, SensorEntity):
                 attrs["deviation"] = round(current_value - target_value, 2)
                 attrs["deviation_percent"] = round(((current_value - target_value) / target_value) * 100, 1) if target_value != 0 else 0
         
+        # Ungefilterter Sensorwert
+        raw_values = self.coordinator.data.get("raw_values", {})
+        if key in raw_values:
+            attrs["raw_value"] = raw_values[key]
+        
         # Add growth phase context
-        growth_config = self.coordinator.data.get("growth_config", {})
-        attrs.update({
-            "growth_phase": growth_config.get("phase"),
-            "crop_steering": growth_config.get("steering"),
-        })
+        shared = self._shared_attributes("growth")
+        if not attrs:
+            return shared
+        attrs.update(shared)
         
         return attrs
 
 
-class AthenaPlantStatusSensor(CoordinatorEntity, SensorEntity):
+class AthenaPlantStatusSensor(AthenaPlantEntity, SensorEntity):
     """Representation of an Athena Plant Monitor status sensor."""
 
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {
+        "last_irrigation", "phase_started", "p1_shots", "next_event", "in_flight", "queued", "scheduled",
+    }
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the status sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_status_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -339,6 +428,8 @@ class AthenaPlantStatusSensor(CoordinatorEntity, SensorEntity):
             return self.coordinator.data.get("irrigation_state", {}).get("daily_water_total", 0)
         elif key == "max_vwc_today":
             return self.coordinator.data.get("irrigation_state", {}).get("max_vwc_today", 0)
+        elif key == "irrigation_queue":
+            return self.coordinator.data.get("irrigation_queue", {}).get("queue_depth", 0)
         elif key == "is_day_cycle":
             is_day = self.coordinator.data.get("is_day_cycle", False)
             return "Tag" if is_day else "Nacht"
@@ -346,32 +437,40 @@ class AthenaPlantStatusSensor(CoordinatorEntity, SensorEntity):
         return None
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        attrs = {}
+        shared = self._shared_attributes("growth_substrate")
+        if self.entity_description.key not in ("current_phase", "irrigation_queue"):
+            return shared
         
+        attrs = {}
         irrigation_state = self.coordinator.data.get("irrigation_state", {})
-        growth_config = self.coordinator.data.get("growth_config", {})
         
         if self.entity_description.key == "current_phase":
             attrs.update({
                 "lights_on": irrigation_state.get("lights_on"),
                 "automation_enabled": irrigation_state.get("automation_enabled"),
                 "last_irrigation": irrigation_state.get("last_irrigation"),
+                **self.coordinator.data.get("irrigation_schedule", {}),
+            })
+        elif self.entity_description.key == "irrigation_queue":
+            irrigation_queue = self.coordinator.data.get("irrigation_queue", {})
+            attrs.update({
+                "in_flight": irrigation_queue.get("in_flight"),
+                "queued": irrigation_queue.get("queued", []),
+                "scheduled": irrigation_queue.get("scheduled", []),
             })
         
-        attrs.update({
-            "growth_phase": growth_config.get("phase"),
-            "crop_steering": growth_config.get("steering"),
-            "substrate_size": growth_config.get("substrate_size"),
-        })
+        attrs.update(shared)
         
         return attrs
 
 
-class AthenaPlantAlertSensor(CoordinatorEntity, SensorEntity):
+class AthenaPlantAlertSensor(AthenaPlantEntity, SensorEntity):
     """Representation of an Athena Plant Monitor alert sensor."""
 
+    _unrecorded_attributes = frozenset({"alerts", "latest_alert", "messages"})
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
@@ -412,3 +511,51 @@ class AthenaPlantAlertSensor(CoordinatorEntity, SensorEntity):
             attrs["messages"] = [alert["message"] for alert in alert_list]
         
         return attrs
+
+
+class AthenaPlantProfilingSensor(AthenaPlantEntity, SensorEntity):
+    """Diagnostic sensor with the update pipeline timings."""
+
+    _unrecorded_attributes = frozenset({"stages", "updates"})
+
+    def __init__(
+        self,
+        coordinator: AthenaPlantCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the profiling sensor."""
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.device_id}_profiling_{description.key}"
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the measured value."""
+        profiler = self.coordinator.profiler
+        key = self.entity_description.key
+        
+        if key == "update_duration":
+            return round(profiler.last_update * 1000, 3) if profiler.last_update is not None else None
+        elif key == "updates_per_minute":
+            return profiler.updates_per_minute
+        elif key == "coalesced_refreshes":
+            return profiler.coalesced
+        elif key == "skipped_refreshes":
+            return profiler.skipped
+        
+        return None
+
+    @property
+    def _tracked_value(self) -> Any:
+        return self.native_value
+
+    @property
+    def extra_state_attributes(self) -> Optional[Mapping[str, Any]]:
+        """Return last/avg/max duration per stage on the duration sensor."""
+        if self.entity_description.key != "update_duration":
+            return None
+        return {
+            "updates": self.coordinator.profiler.updates,
+            "stages": self.coordinator.profiler.stages(),
+        }
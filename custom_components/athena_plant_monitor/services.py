@@ -1,359 +1,275 @@
 """Services for Athena Plant Monitor."""
+import asyncio
 import logging
+from typing import Any, Awaitable, Callable, Dict, List
+
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, GROWTH_PHASES, CROP_STEERING_STRATEGIES, VENTILATION_MODES
+from .const import (
+    DOMAIN,
+    GROWTH_PHASES,
+    CROP_STEERING_STRATEGIES,
+    VENTILATION_MODES,
+    CLIMATE_STRATEGIES,
+    MAX_PARALLEL_SERVICE_CALLS,
+)
+from .registry import async_get_registry
+from .targets import TARGET_OVERRIDE_FIELDS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Gemeinsame Zielfelder: ESPHome-Geräte-ID, HA-Geräte-ID, Entität oder Bereich.
+# "all" als device_id/entity_id adressiert alle Geräte.
+TARGET_FIELDS = {
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids,
+    vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+}
+
 # Service schemas
 IRRIGATION_SHOT_SCHEMA = vol.Schema({
     vol.Optional("shot_size", default=3.0): vol.Coerce(float),
     vol.Optional("duration", default=30): vol.Coerce(int),
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
 })
 
 SET_GROWTH_PHASE_SCHEMA = vol.Schema({
     vol.Required("phase"): vol.In(list(GROWTH_PHASES.keys())),
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
 })
 
 SET_CROP_STEERING_SCHEMA = vol.Schema({
     vol.Required("strategy"): vol.In(list(CROP_STEERING_STRATEGIES.keys())),
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
 })
 
 RESET_COUNTERS_SCHEMA = vol.Schema({
     vol.Optional("reset_water", default=False): cv.boolean,
     vol.Optional("reset_vwc", default=False): cv.boolean,
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
+})
+
+CLEAR_TARGET_OVERRIDES_SCHEMA = vol.Schema({
+    vol.Optional("targets"): vol.All(cv.ensure_list, [vol.In(list(TARGET_OVERRIDE_FIELDS))]),
+    **TARGET_FIELDS,
 })
 
 EMERGENCY_PROTOCOL_SCHEMA = vol.Schema({
     vol.Optional("disable_automation", default=True): cv.boolean,
     vol.Optional("stop_all_pumps", default=True): cv.boolean,
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
 })
 
 P1_SATURATION_SCHEMA = vol.Schema({
     vol.Optional("shot_count", default=3): vol.Coerce(int),
     vol.Optional("shot_size", default=4.0): vol.Coerce(float),
     vol.Optional("interval_minutes", default=20): vol.Coerce(int),
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
 })
 
 APPLY_CLIMATE_STRATEGY_SCHEMA = vol.Schema({
-    vol.Required("strategy"): cv.string,
-    vol.Optional("device_id"): cv.string,
+    vol.Optional("strategy"): vol.In(list(CLIMATE_STRATEGIES.keys())),
+    **TARGET_FIELDS,
 })
 
 SET_VENTILATION_MODE_SCHEMA = vol.Schema({
     vol.Required("mode"): vol.In(VENTILATION_MODES),
-    vol.Optional("device_id"): cv.string,
+    **TARGET_FIELDS,
 })
 
 OPTIMIZE_VPD_SCHEMA = vol.Schema({
-    vol.Required("target_vpd"): vol.Coerce(float),
-    vol.Optional("device_id"): cv.string,
+    vol.Optional("target_vpd"): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=2.0)),
+    **TARGET_FIELDS,
 })
 
-
-def get_coordinator_for_device(hass: HomeAssistant, device_id: str = None):
-    """Get coordinator for specific device or first available."""
-    domain_data = hass.data.get(DOMAIN, {})
-    
-    if device_id:
-        # Look for specific device
-        for entry_id, entry_data in domain_data.items():
-            if entry_id == "config":
-                continue
-            coordinator = entry_data.get("coordinator")
-            if coordinator and coordinator.device_id == device_id:
-                return coordinator
-    else:
-        # Return first available coordinator
-        for entry_id, entry_data in domain_data.items():
-            if entry_id == "config":
-                continue
-            coordinator = entry_data.get("coordinator")
-            if coordinator:
-                return coordinator
+SERVICES = [
+    "irrigation_shot",
+    "set_growth_phase",
+    "set_crop_steering",
+    "reset_counters",
+    "clear_target_overrides",
+    "emergency_protocol",
+    "p1_saturation_sequence",
+    "apply_climate_strategy",
+    "set_ventilation_mode",
+    "optimize_vpd",
+]
+
+
+def _skip_reason(coordinator) -> str:
+    """Return why the coordinator did not queue an irrigation shot."""
+    if not coordinator.availability.available:
+        return "device offline"
+    return "no pump configured"
+
+
+def get_coordinators_for_call(hass: HomeAssistant, call: ServiceCall) -> List:
+    """Resolve all coordinators targeted by a service call."""
+    return async_get_registry(hass).async_resolve(hass, call.data)
+
+
+async def _async_fan_out(
+    coordinators: List,
+    action: Callable[[Any], Awaitable[None]],
+    description: str,
+) -> ServiceResponse:
+    """Run ``action`` for every coordinator concurrently and summarize the results.
+
+    At most MAX_PARALLEL_SERVICE_CALLS devices are handled at the same time
+    so a room-wide call does not flood the ESPHome connections.
+    """
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_SERVICE_CALLS)
+
+    async def _run(coordinator) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                await action(coordinator)
+            except Exception as err:
+                _LOGGER.error(f"Error {description} on {coordinator.device_id}: {err}")
+                return {"success": False, "error": str(err)}
+            return {"success": True}
+
+    outcomes = await asyncio.gather(*(_run(coordinator) for coordinator in coordinators))
+    results = {
+        coordinator.device_id: outcome
+        for coordinator, outcome in zip(coordinators, outcomes)
+    }
+    succeeded = sum(1 for outcome in outcomes if outcome["success"])
     
-    return None
+    if len(coordinators) > 1:
+        _LOGGER.info(f"{description.capitalize()}: {succeeded}/{len(coordinators)} devices succeeded")
+
+    return {
+        "succeeded": succeeded,
+        "failed": len(coordinators) - succeeded,
+        "results": results,
+    }
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Athena Plant Monitor."""
 
-    async def handle_irrigation_shot(call: ServiceCall) -> None:
-        """Handle irrigation shot service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for irrigation shot service")
-            return
-            
+    async def irrigation_shot(coordinator, call: ServiceCall) -> None:
         shot_size = call.data.get("shot_size", 3.0)
         duration = call.data.get("duration", 30)
-        
-        try:
-            await coordinator.trigger_irrigation_shot(shot_size, duration)
-            _LOGGER.info(f"Manual irrigation shot executed: {shot_size}% for {duration}s")
-        except Exception as err:
-            _LOGGER.error(f"Error executing irrigation shot: {err}")
-
-    async def handle_set_growth_phase(call: ServiceCall) -> None:
-        """Handle set growth phase service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for growth phase service")
-            return
-            
+        job = await coordinator.trigger_irrigation_shot(shot_size, duration)
+        if job is None:
+            # Im Ergebnis je Gerät als Fehlschlag mit Grund melden
+            raise HomeAssistantError(f"irrigation shot not queued: {_skip_reason(coordinator)}")
+        _LOGGER.info(f"Manual irrigation shot queued on {coordinator.device_id}: {shot_size}% for {duration}s")
+
+    async def set_growth_phase(coordinator, call: ServiceCall) -> None:
         phase = call.data.get("phase")
-        
-        try:
-            await coordinator.set_growth_phase(phase)
-            _LOGGER.info(f"Growth phase set to: {phase}")
-        except Exception as err:
-            _LOGGER.error(f"Error setting growth phase: {err}")
-
-    async def handle_set_crop_steering(call: ServiceCall) -> None:
-        """Handle set crop steering service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for crop steering service")
-            return
-            
+        await coordinator.set_growth_phase(phase)
+        _LOGGER.info(f"Growth phase of {coordinator.device_id} set to: {phase}")
+
+    async def set_crop_steering(coordinator, call: ServiceCall) -> None:
         strategy = call.data.get("strategy")
-        
-        try:
-            await coordinator.set_crop_steering(strategy)
-            _LOGGER.info(f"Crop steering set to: {strategy}")
-        except Exception as err:
-            _LOGGER.error(f"Error setting crop steering: {err}")
-
-    async def handle_reset_counters(call: ServiceCall) -> None:
-        """Handle reset counters service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for reset counters service")
-            return
-            
-        reset_water = call.data.get("reset_water", False)
-        reset_vwc = call.data.get("reset_vwc", False)
-        
-        try:
-            if reset_water:
-                coordinator._irrigation_state["daily_water_total"] = 0.0
-                _LOGGER.info("Daily water counter reset")
-                
-            if reset_vwc:
-                coordinator._irrigation_state["max_vwc_today"] = 0.0
-                _LOGGER.info("Max VWC counter reset")
-                
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error(f"Error resetting counters: {err}")
-
-    async def handle_emergency_protocol(call: ServiceCall) -> None:
-        """Handle emergency protocol service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for emergency protocol service")
-            return
+        await coordinator.set_crop_steering(strategy)
+        _LOGGER.info(f"Crop steering of {coordinator.device_id} set to: {strategy}")
+
+    async def reset_counters(coordinator, call: ServiceCall) -> None:
+        await coordinator.reset_counters(
+            call.data.get("reset_water", False),
+            call.data.get("reset_vwc", False),
+        )
+
+    async def clear_target_overrides(coordinator, call: ServiceCall) -> None:
+        await coordinator.clear_target_overrides(call.data.get("targets"))
+
+    async def emergency_protocol(coordinator, call: ServiceCall) -> None:
+        if call.data.get("disable_automation", True):
+            await coordinator.set_automation_enabled(False)
+            _LOGGER.warning(f"Automation on {coordinator.device_id} disabled by emergency protocol")
             
-        disable_automation = call.data.get("disable_automation", True)
-        stop_all_pumps = call.data.get("stop_all_pumps", True)
-        
-        try:
-            if disable_automation:
-                coordinator._irrigation_state["automation_enabled"] = False
-                _LOGGER.warning("Automation disabled by emergency protocol")
-                
-            if stop_all_pumps:
-                pump_entity = coordinator.get_entity_id("pump")
-                if pump_entity:
-                    await hass.services.async_call(
-                        "switch", "turn_off",
-                        {"entity_id": pump_entity}
-                    )
-                _LOGGER.warning("All pumps stopped by emergency protocol")
-                
-            await coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error(f"Error executing emergency protocol: {err}")
-
-    async def handle_p1_saturation(call: ServiceCall) -> None:
-        """Handle P1 saturation sequence service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for P1 saturation service")
-            return
+        if call.data.get("stop_all_pumps", True):
+            # Laufende und geplante Schüsse abbrechen
+            await coordinator.cancel_irrigation()
+            pump_entity = coordinator.get_entity_id("pump")
+            if pump_entity:
+                await hass.services.async_call(
+                    "switch", "turn_off",
+                    {"entity_id": pump_entity},
+                    blocking=True,
+                )
+            _LOGGER.warning(f"All pumps on {coordinator.device_id} stopped by emergency protocol")
             
+        await coordinator.async_request_refresh()
+
+    async def p1_saturation(coordinator, call: ServiceCall) -> None:
+        # Schüsse werden im Hintergrund geplant, der Aufruf kehrt sofort zurück
         shot_count = call.data.get("shot_count", 3)
-        shot_size = call.data.get("shot_size", 4.0)
-        interval_minutes = call.data.get("interval_minutes", 20)
-        
-        try:
-            _LOGGER.info(f"Starting P1 saturation: {shot_count} shots of {shot_size}% every {interval_minutes} minutes")
-            
-            for i in range(shot_count):
-                if i > 0:
-                    # Wait between shots
-                    import asyncio
-                    await asyncio.sleep(interval_minutes * 60)
-                
-                # Execute shot
-                duration = int(30 * (shot_size / 3.0))  # Scale duration with shot size
-                await coordinator.trigger_irrigation_shot(shot_size, duration)
-                _LOGGER.info(f"P1 saturation shot {i+1}/{shot_count} completed")
-                
-        except Exception as err:
-            _LOGGER.error(f"Error executing P1 saturation: {err}")
-
-    async def handle_apply_climate_strategy(call: ServiceCall) -> None:
-        """Handle apply climate strategy service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for apply climate strategy service")
-            return
-            
+        queued = await coordinator.start_p1_saturation(
+            shot_count,
+            call.data.get("shot_size", 4.0),
+            call.data.get("interval_minutes", 20),
+        )
+        if shot_count and not queued:
+            raise HomeAssistantError(f"P1 saturation not scheduled: {_skip_reason(coordinator)}")
+
+    async def apply_climate_strategy(coordinator, call: ServiceCall) -> None:
         strategy = call.data.get("strategy")
-        
-        try:
-            await coordinator.apply_climate_strategy(strategy)
-            _LOGGER.info(f"Climate strategy applied: {strategy}")
-        except Exception as err:
-            _LOGGER.error(f"Error applying climate strategy: {err}")
-
-    async def handle_set_ventilation_mode(call: ServiceCall) -> None:
-        """Handle set ventilation mode service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for set ventilation mode service")
-            return
-            
+        await coordinator.apply_climate_strategy(strategy)
+        _LOGGER.info(f"Climate strategy applied on {coordinator.device_id}: {strategy}")
+
+    async def set_ventilation_mode(coordinator, call: ServiceCall) -> None:
         mode = call.data.get("mode")
-        
-        try:
-            await coordinator.set_ventilation_mode(mode)
-            _LOGGER.info(f"Ventilation mode set to: {mode}")
-        except Exception as err:
-            _LOGGER.error(f"Error setting ventilation mode: {err}")
-
-    async def handle_optimize_vpd(call: ServiceCall) -> None:
-        """Handle optimize VPD service."""
-        device_id = call.data.get("device_id")
-        coordinator = get_coordinator_for_device(hass, device_id)
-        
-        if not coordinator:
-            _LOGGER.error("No coordinator found for optimize VPD service")
-            return
-            
+        await coordinator.set_ventilation_mode(mode)
+        _LOGGER.info(f"Ventilation mode of {coordinator.device_id} set to: {mode}")
+
+    async def optimize_vpd(coordinator, call: ServiceCall) -> None:
         target_vpd = call.data.get("target_vpd")
-        
-        try:
-            await coordinator.optimize_vpd(target_vpd)
-            _LOGGER.info(f"VPD optimization started: target VPD = {target_vpd}")
-        except Exception as err:
-            _LOGGER.error(f"Error optimizing VPD: {err}")
+        await coordinator.optimize_vpd(target_vpd)
+        _LOGGER.info(f"VPD optimization started on {coordinator.device_id}: target VPD = {target_vpd}")
+
+    # Service -> (Aktion pro Gerät, Schema, Beschreibung für Logs)
+    service_actions = {
+        "irrigation_shot": (irrigation_shot, IRRIGATION_SHOT_SCHEMA, "executing irrigation shot"),
+        "set_growth_phase": (set_growth_phase, SET_GROWTH_PHASE_SCHEMA, "setting growth phase"),
+        "set_crop_steering": (set_crop_steering, SET_CROP_STEERING_SCHEMA, "setting crop steering"),
+        "reset_counters": (reset_counters, RESET_COUNTERS_SCHEMA, "resetting counters"),
+        "clear_target_overrides": (clear_target_overrides, CLEAR_TARGET_OVERRIDES_SCHEMA, "clearing manual targets"),
+        "emergency_protocol": (emergency_protocol, EMERGENCY_PROTOCOL_SCHEMA, "executing emergency protocol"),
+        "p1_saturation_sequence": (p1_saturation, P1_SATURATION_SCHEMA, "executing P1 saturation"),
+        "apply_climate_strategy": (apply_climate_strategy, APPLY_CLIMATE_STRATEGY_SCHEMA, "applying climate strategy"),
+        "set_ventilation_mode": (set_ventilation_mode, SET_VENTILATION_MODE_SCHEMA, "setting ventilation mode"),
+        "optimize_vpd": (optimize_vpd, OPTIMIZE_VPD_SCHEMA, "optimizing VPD"),
+    }
+
+    def _make_handler(service: str, action, description: str):
+        async def handle_service(call: ServiceCall) -> ServiceResponse:
+            """Resolve the targeted devices and run the action on all of them."""
+            coordinators = get_coordinators_for_call(hass, call)
+            
+            if not coordinators:
+                _LOGGER.error(f"No coordinator found for {service} service")
+                return {"succeeded": 0, "failed": 0, "results": {}}
+                
+            return await _async_fan_out(
+                coordinators,
+                lambda coordinator: action(coordinator, call),
+                description,
+            )
+
+        return handle_service
 
     # Register services
-    hass.services.async_register(
-        DOMAIN,
-        "irrigation_shot",
-        handle_irrigation_shot,
-        schema=IRRIGATION_SHOT_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "set_growth_phase",
-        handle_set_growth_phase,
-        schema=SET_GROWTH_PHASE_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "set_crop_steering",
-        handle_set_crop_steering,
-        schema=SET_CROP_STEERING_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "reset_counters",
-        handle_reset_counters,
-        schema=RESET_COUNTERS_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "emergency_protocol",
-        handle_emergency_protocol,
-        schema=EMERGENCY_PROTOCOL_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "p1_saturation_sequence",
-        handle_p1_saturation,
-        schema=P1_SATURATION_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "apply_climate_strategy",
-        handle_apply_climate_strategy,
-        schema=APPLY_CLIMATE_STRATEGY_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "set_ventilation_mode",
-        handle_set_ventilation_mode,
-        schema=SET_VENTILATION_MODE_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "optimize_vpd",
-        handle_optimize_vpd,
-        schema=OPTIMIZE_VPD_SCHEMA,
-    )
+    for service, (action, schema, description) in service_actions.items():
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            _make_handler(service, action, description),
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload services."""
-    services = [
-        "irrigation_shot",
-        "set_growth_phase", 
-        "set_crop_steering",
-        "reset_counters",
-        "emergency_protocol",
-        "p1_saturation_sequence",
-        "apply_climate_strategy",
-        "set_ventilation_mode",
-        "optimize_vpd",
-    ]
-    
-    for service in services:
+    for service in SERVICES:
         hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,346 @@
+"""Synthetic ESPHome tents for load and soak testing Athena Plant Monitor.
+
+Each simulated tent publishes every entity of ESPHOME_ENTITIES as a plain
+Home Assistant state (``sensor.sim_tent_001_vwc``, ...), so coordinators
+read it exactly like a real ESPHome node. The physics are deliberately
+simple first-order models, cheap enough for hundreds of tents:
+
+- VWC dries back exponentially (faster with lights on) and rises while
+  the pump runs, limited by the substrate's field capacity.
+- EC concentrates while the substrate dries back and is pulled towards
+  the feed EC by each shot; pH drifts slowly.
+- Air temperature and humidity follow a diurnal pattern, are heated and
+  humidified by lights and transpiration and pulled towards the outside
+  climate by the fans; humidifier and dehumidifier act on humidity.
+- CO₂ rises with the CO₂ valve, is consumed under light and vented by the
+  fans.
+
+``SimulatedTent`` has no Home Assistant dependency and can also be driven
+by scripts and benchmarks. ``TentSimulator`` writes the states into Home
+Assistant and feeds switch and light service calls for simulated entities
+back into the physics.
+"""
+import logging
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import EVENT_CALL_SERVICE, EVENT_HOMEASSISTANT_STOP, STATE_OFF, STATE_ON
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CONF_DEVICE_ID,
+    ESPHOME_ENTITIES,
+    DEFAULT_LIGHT_SCHEDULE_START,
+    DEFAULT_LIGHT_SCHEDULE_END,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SIMULATOR_PREFIX = "sim_tent"
+
+# Schaltbare Aktoren (Schlüssel aus ESPHOME_ENTITIES)
+ACTUATOR_KEYS = (
+    "pump", "fan_intake", "fan_exhaust", "humidifier", "dehumidifier", "co2_valve",
+    "led_panel", "grow_light_switch",
+)
+
+FIELD_CAPACITY = 82.0  # % VWC - darüber läuft Wasser ab
+FEED_EC = 3.0
+PUMP_RATE = 0.08  # % VWC pro Sekunde Pumpenlaufzeit
+TANK_DRAIN_RATE = 0.005  # % Tankfüllstand pro Sekunde Pumpenlaufzeit
+SPIKE_PROBABILITY = 0.002  # Messausreißer je Sensor und Schritt
+
+
+def simulated_device_ids(count: int, prefix: str = SIMULATOR_PREFIX) -> List[str]:
+    """Return the device ids of ``count`` simulated tents."""
+    return [f"{prefix}_{index:03d}" for index in range(1, count + 1)]
+
+
+def _hours(value: str) -> float:
+    hour, minute = value.split(":")
+    return int(hour) + int(minute) / 60
+
+
+def _approach(current: float, target: float, tau: float, dt: float) -> float:
+    """First-order lag towards ``target`` with time constant ``tau`` (s)."""
+    return target + (current - target) * math.exp(-dt / tau)
+
+
+class SimulatedTent:
+    """Physics and sensor readings of one simulated tent."""
+
+    def __init__(
+        self,
+        device_id: str,
+        seed: Optional[int] = None,
+        light_start: str = DEFAULT_LIGHT_SCHEDULE_START,
+        light_end: str = DEFAULT_LIGHT_SCHEDULE_END,
+    ) -> None:
+        """Initialize the tent with slightly randomized properties."""
+        self.device_id = device_id
+        self._random = random.Random(seed if seed is not None else device_id)
+        rnd = self._random
+        self._light_start = _hours(light_start)
+        self._light_end = _hours(light_end)
+
+        # Eigenschaften des Zelts (leicht gestreut)
+        self.dryback_day = rnd.uniform(0.035, 0.06)  # 1/h
+        self.dryback_night = rnd.uniform(0.008, 0.015)  # 1/h
+        self.light_heat = rnd.uniform(4.0, 7.0)  # °C über Umgebung bei Licht
+
+        self.actuators: Dict[str, bool] = {key: False for key in ACTUATOR_KEYS}
+        self.light_override: Optional[bool] = None
+        self._scheduled_lights: Optional[bool] = None  # Zeitplan beim letzten Schritt
+        self.vwc = rnd.uniform(55.0, 70.0)
+        self.ec = rnd.uniform(2.5, 3.5)
+        self.ph = rnd.uniform(5.8, 6.2)
+        self.temperature = 23.0
+        self.humidity = 60.0
+        self.co2 = 600.0
+        self.temp_substrate = 22.0
+        self.water_level = 100.0
+        self.pressure = rnd.uniform(1005.0, 1020.0)
+        self.outside_temperature = 15.0
+        self.outside_humidity = 60.0
+
+    @property
+    def entity_ids(self) -> Dict[str, str]:
+        """Return the entity id per ESPHome key."""
+        return {key: pattern.format(device_id=self.device_id) for key, pattern in ESPHOME_ENTITIES.items()}
+
+    def scheduled_lights(self, now: datetime) -> bool:
+        """Return whether the light schedule has the lights on."""
+        hour = now.hour + now.minute / 60
+        if self._light_start <= self._light_end:
+            return self._light_start <= hour < self._light_end
+        return hour >= self._light_start or hour < self._light_end
+
+    def lights_on(self, now: datetime) -> bool:
+        """Return whether the lights are on (schedule or manual override)."""
+        if self.light_override is not None:
+            return self.light_override
+        return self.scheduled_lights(now)
+
+    def set_actuator(self, key: str, on: bool) -> None:
+        """Switch an actuator; the lights override the schedule until its next transition."""
+        if key in ("led_panel", "grow_light_switch"):
+            self.light_override = on
+        self.actuators[key] = on
+
+    def step(self, dt: float, now: datetime) -> None:
+        """Advance the physics by ``dt`` seconds."""
+        rnd = self._random
+        scheduled = self.scheduled_lights(now)
+        if self._scheduled_lights is not None and scheduled != self._scheduled_lights:
+            # Wie eine Zeitschaltuhr: der nächste Schaltpunkt hebt das manuelle Schalten auf
+            self.light_override = None
+        self._scheduled_lights = scheduled
+        lights = self.lights_on(now)
+        self.actuators["led_panel"] = self.actuators["grow_light_switch"] = lights
+        hour = now.hour + now.minute / 60
+
+        # Außenklima: Tagesgang mit Minimum am frühen Morgen
+        diurnal = math.sin((hour - 9) / 24 * 2 * math.pi)
+        self.outside_temperature = 15.0 + 6.0 * diurnal + rnd.gauss(0, 0.05)
+        self.outside_humidity = min(95.0, max(30.0, 65.0 - 15.0 * diurnal + rnd.gauss(0, 0.2)))
+
+        # Lüftung: Luftwechsel zieht das Zeltklima Richtung Außenklima
+        fans = self.actuators["fan_intake"] + self.actuators["fan_exhaust"]
+        exchange_tau = 600 if fans == 2 else 1200 if fans == 1 else 5400
+
+        temp_target = self.outside_temperature + 8.0 + (self.light_heat if lights else 0.0)
+        self.temperature = _approach(self.temperature, temp_target, 900, dt)
+        self.temperature = _approach(self.temperature, self.outside_temperature, exchange_tau, dt)
+
+        humidity_target = 55.0 + (10.0 if lights else 5.0) * (self.vwc / FIELD_CAPACITY)
+        if self.actuators["humidifier"]:
+            humidity_target += 20.0
+        if self.actuators["dehumidifier"]:
+            humidity_target -= 20.0
+        self.humidity = _approach(self.humidity, humidity_target, 1200, dt)
+        self.humidity = _approach(self.humidity, self.outside_humidity, exchange_tau, dt)
+        self.humidity = min(99.0, max(20.0, self.humidity))
+
+        co2_target = 420.0 + (1200.0 if self.actuators["co2_valve"] else 0.0) - (80.0 if lights else -60.0)
+        self.co2 = _approach(self.co2, co2_target, 900, dt)
+        self.co2 = _approach(self.co2, 420.0, exchange_tau, dt)
+        self.temp_substrate = _approach(self.temp_substrate, self.temperature - 1.0, 3600, dt)
+
+        # Substrat: exponentielle Rücktrocknung, Anstieg bei laufender Pumpe
+        k = (self.dryback_day if lights else self.dryback_night) / 3600
+        previous_vwc = self.vwc
+        self.vwc *= math.exp(-k * dt)
+        if self.actuators["pump"] and self.water_level > 0:
+            added = PUMP_RATE * dt
+            self.vwc = min(FIELD_CAPACITY, self.vwc + added)
+            self.water_level = max(0.0, self.water_level - TANK_DRAIN_RATE * dt)
+            # Frische Nährlösung zieht den EC zum Dünger-EC
+            self.ec += (FEED_EC - self.ec) * min(1.0, added / 10)
+        elif self.vwc < previous_vwc:
+            # Aufkonzentrierung beim Abtrocknen
+            self.ec *= previous_vwc / self.vwc
+        self.ec = max(0.5, self.ec + rnd.gauss(0, 0.0005) * math.sqrt(dt))
+        self.ph = min(7.5, max(4.5, self.ph + rnd.gauss(0, 0.0003) * math.sqrt(dt) + (6.0 - self.ph) * 1e-5 * dt))
+
+    def _reading(self, value: float, noise: float, spike: float, digits: int = 2) -> str:
+        rnd = self._random
+        value += rnd.gauss(0, noise)
+        if rnd.random() < SPIKE_PROBABILITY:
+            value += rnd.choice((-1, 1)) * spike
+        return str(round(value, digits))
+
+    def sensor_values(self) -> Dict[str, str]:
+        """Return the current sensor readings (with noise) as state strings."""
+        leaf_offset = -1.5 if self.actuators["led_panel"] else -0.5
+        return {
+            "temperature": self._reading(self.temperature, 0.05, 5.0, 1),
+            "humidity": self._reading(self.humidity, 0.3, 15.0, 1),
+            "pressure": self._reading(self.pressure, 0.2, 0.0, 1),
+            "vwc": self._reading(self.vwc, 0.15, 20.0, 1),
+            "ec_substrate": self._reading(self.ec, 0.02, 3.0),
+            "ph_substrate": self._reading(self.ph, 0.01, 1.0),
+            "temp_substrate": self._reading(self.temp_substrate, 0.05, 0.0, 1),
+            "co2": self._reading(self.co2, 5.0, 400.0, 0),
+            "leaf_temperature": self._reading(self.temperature + leaf_offset, 0.1, 0.0, 1),
+            "water_level": self._reading(self.water_level, 0.1, 0.0, 1),
+            "temperature_outside": self._reading(self.outside_temperature, 0.05, 0.0, 1),
+            "humidity_outside": self._reading(self.outside_humidity, 0.3, 0.0, 1),
+            "pressure_outside": self._reading(self.pressure, 0.2, 0.0, 1),
+            "co2_outside": self._reading(420.0, 5.0, 0.0, 0),
+        }
+
+    def states(self) -> Dict[str, str]:
+        """Return the state of every ESPHome entity by entity id."""
+        entity_ids = self.entity_ids
+        states = {entity_ids[key]: value for key, value in self.sensor_values().items()}
+        for key in ACTUATOR_KEYS:
+            states[entity_ids[key]] = STATE_ON if self.actuators[key] else STATE_OFF
+        return states
+
+
+class TentSimulator:
+    """Publish simulated tents into Home Assistant.
+
+    ``time_scale`` speeds up the simulated clock for soak tests; with the
+    default of 1 it follows the wall clock, so the light schedule matches
+    the coordinators' schedule. With ``time_scale > 1`` only the physics
+    run faster: the simulated lights follow the simulated clock, while the
+    coordinators' photoperiod fallback and P0-P3 timers keep the wall
+    clock, so day/night and irrigation phases drift apart. Use it for load
+    and soak tests, not to check the phase logic.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        count: int,
+        interval: float = 10.0,
+        time_scale: float = 1.0,
+        prefix: str = SIMULATOR_PREFIX,
+    ) -> None:
+        """Create ``count`` tents."""
+        self.hass = hass
+        self.interval = interval
+        self.time_scale = time_scale
+        self.tents: Dict[str, SimulatedTent] = {
+            device_id: SimulatedTent(device_id) for device_id in simulated_device_ids(count, prefix)
+        }
+        self._by_entity_id: Dict[str, Tuple[SimulatedTent, str]] = {
+            entity_id: (tent, key)
+            for tent in self.tents.values()
+            for key, entity_id in tent.entity_ids.items()
+            if key in ACTUATOR_KEYS
+        }
+        self._clock = dt_util.now()
+        self._unsubs: List[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Publish the initial states and start stepping; returns a stop callback."""
+        self._publish(self.tents.values())
+        self._unsubs.append(
+            async_track_time_interval(self.hass, self._async_step, timedelta(seconds=self.interval))
+        )
+        self._unsubs.append(self.hass.bus.async_listen(EVENT_CALL_SERVICE, self._async_service_called))
+        _LOGGER.info(f"Simulating {len(self.tents)} tents every {self.interval}s (time scale {self.time_scale})")
+        if self.time_scale > 1:
+            _LOGGER.warning(
+                "Simulator time scale > 1: simulated light schedule and the coordinators' "
+                "wall-clock photoperiod and irrigation phases will diverge"
+            )
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop stepping and listening."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _publish(self, tents: Iterable[SimulatedTent]) -> None:
+        async_set = self.hass.states.async_set
+        for tent in tents:
+            for entity_id, state in tent.states().items():
+                async_set(entity_id, state)
+
+    @callback
+    def _async_step(self, _now: datetime) -> None:
+        dt = self.interval * self.time_scale
+        self._clock += timedelta(seconds=dt)
+        for tent in self.tents.values():
+            tent.step(dt, self._clock)
+        self._publish(self.tents.values())
+
+    @callback
+    def _async_service_called(self, event: Event) -> None:
+        """Feed turn_on/turn_off/toggle calls for simulated actuators back."""
+        service = event.data.get("service")
+        if service not in ("turn_on", "turn_off", "toggle"):
+            return
+        entity_ids = (event.data.get("service_data") or {}).get("entity_id")
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+
+        changed = {}
+        for entity_id in entity_ids or ():
+            target = self._by_entity_id.get(entity_id)
+            if target is None:
+                continue
+            tent, key = target
+            on = not tent.actuators[key] if service == "toggle" else service == "turn_on"
+            tent.set_actuator(key, on)
+            changed[tent.device_id] = tent
+        if changed:
+            self._publish(changed.values())
+
+
+@callback
+def async_setup_simulator(
+    hass: HomeAssistant, count: int, interval: float, time_scale: float
+) -> Tuple[TentSimulator, Callable[[], None]]:
+    """Start the simulator and create a config entry per simulated tent.
+
+    Returns the simulator and its stop callback, which also runs when Home
+    Assistant stops.
+    """
+    simulator = TentSimulator(hass, count, interval, time_scale)
+    stop = simulator.async_start()
+
+    @callback
+    def _async_stop(_event: Event) -> None:
+        stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    for device_id in simulator.tents:
+        hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data={CONF_DEVICE_ID: device_id}
+            )
+        )
+    return simulator, stop
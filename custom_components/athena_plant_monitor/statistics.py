@@ -0,0 +1,208 @@
+"""Long-term statistics of derived values for Athena Plant Monitor."""
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Mapping, NamedTuple, Optional
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+
+from .const import DOMAIN, STATISTICS_MEAN_KEYS, STATISTICS_SUM_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+SHORT_TERM_PERIOD = 300  # seconds
+LONG_TERM_PERIOD = 3600  # seconds
+SHORT_TERM_RETENTION = 288  # 5-Minuten-Werte = 24 h
+
+
+class Bucket:
+    """Running mean/min/max of one period."""
+
+    __slots__ = ("start", "count", "total", "minimum", "maximum", "last")
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.last = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "Bucket") -> None:
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.last = other.last
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the aggregate for diagnostics."""
+        return {
+            "start": datetime.fromtimestamp(self.start, timezone.utc).isoformat(),
+            "mean": self.mean,
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "count": self.count,
+        }
+
+
+class HourlyStatistic(NamedTuple):
+    """A completed hour of one key."""
+
+    key: str
+    start: float
+    bucket: Bucket
+    total: Optional[float]  # fortlaufende Summe (nur Summen-Schlüssel)
+
+
+class StatisticsAggregator:
+    """Stream 5-minute and hourly aggregates of the coordinator values.
+
+    Each sample updates the running bucket of its 5-minute period. When a
+    5-minute period ends its bucket is kept for ``SHORT_TERM_RETENTION``
+    periods and merged into the hour; when the hour ends it is returned
+    for the import. Sum keys (daily counters that reset at midnight) are
+    additionally turned into a monotonically increasing total.
+    """
+
+    def __init__(
+        self,
+        mean_keys: Mapping[str, Optional[str]] = STATISTICS_MEAN_KEYS,
+        sum_keys: Mapping[str, Optional[str]] = STATISTICS_SUM_KEYS,
+    ) -> None:
+        """Initialize for the keys (key -> unit)."""
+        self.mean_keys = mean_keys
+        self.sum_keys = sum_keys
+        self._current: Dict[str, Bucket] = {}
+        self._hour: Dict[str, Bucket] = {}
+        self._short_term: Dict[str, Deque[Bucket]] = {
+            key: deque(maxlen=SHORT_TERM_RETENTION) for key in (*mean_keys, *sum_keys)
+        }
+        self._totals: Dict[str, float] = {key: 0.0 for key in sum_keys}
+        self._last_counter: Dict[str, float] = {}
+
+    def restore(self, stored: Mapping[str, float]) -> None:
+        """Continue the running totals after a restart."""
+        for key, value in stored.items():
+            if key in self._totals:
+                self._totals[key] = float(value)
+
+    @property
+    def totals(self) -> Dict[str, float]:
+        """Return the running totals of the sum keys (persisted)."""
+        return dict(self._totals)
+
+    def short_term(self, key: str) -> List[Dict[str, Any]]:
+        """Return the completed 5-minute aggregates of a key, oldest first."""
+        return [bucket.as_dict() for bucket in self._short_term.get(key, ())]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the running totals and the 5-minute aggregates for diagnostics."""
+        return {
+            "totals": self.totals,
+            "short_term": {key: self.short_term(key) for key in self._short_term},
+        }
+
+    def add(self, data: Mapping[str, Any], timestamp: float) -> List[HourlyStatistic]:
+        """Add the values of an update and return the completed hours."""
+        completed: List[HourlyStatistic] = []
+        for key in self.mean_keys:
+            self._add(key, data.get(key), timestamp, completed)
+        for key in self.sum_keys:
+            value = data.get(key)
+            # erst die abgelaufene Stunde abschließen, dann den Zuwachs zählen
+            self._add(key, value, timestamp, completed)
+            if isinstance(value, (int, float)):
+                self._count(key, float(value))
+        return completed
+
+    def _count(self, key: str, value: float) -> None:
+        last = self._last_counter.get(key)
+        if last is not None:
+            # Rückgang = Tagesreset: der neue Wert ist bereits Zuwachs
+            self._totals[key] += value - last if value >= last else value
+        self._last_counter[key] = value
+
+    def _add(self, key: str, value: Any, timestamp: float, completed: List[HourlyStatistic]) -> None:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return
+        period = timestamp - timestamp % SHORT_TERM_PERIOD
+        bucket = self._current.get(key)
+        if bucket is not None and bucket.start != period:
+            self._close_period(key, bucket, period, completed)
+            bucket = None
+        if bucket is None:
+            bucket = self._current[key] = Bucket(period)
+        bucket.add(float(value))
+
+    def _close_period(self, key: str, bucket: Bucket, next_period: float, completed: List[HourlyStatistic]) -> None:
+        self._short_term[key].append(bucket)
+        hour_start = bucket.start - bucket.start % LONG_TERM_PERIOD
+        hour = self._hour.get(key)
+        if hour is None or hour.start != hour_start:
+            hour = self._hour[key] = Bucket(hour_start)
+        hour.merge(bucket)
+
+        if next_period - next_period % LONG_TERM_PERIOD != hour_start:
+            del self._hour[key]
+            completed.append(HourlyStatistic(key, hour_start, hour, self._totals.get(key)))
+
+
+def statistic_id(device_id: str, key: str) -> str:
+    """Return the external statistic id of a device key."""
+    return f"{DOMAIN}:{slugify(f'{device_id}_{key}')}"
+
+
+@callback
+def async_import_statistics(
+    hass: HomeAssistant,
+    device_id: str,
+    device_name: str,
+    completed: List[HourlyStatistic],
+    mean_keys: Mapping[str, Optional[str]] = STATISTICS_MEAN_KEYS,
+    sum_keys: Mapping[str, Optional[str]] = STATISTICS_SUM_KEYS,
+) -> None:
+    """Import completed hours as external long-term statistics."""
+    if "recorder" not in hass.config.components:
+        return
+    for stat in completed:
+        start = datetime.fromtimestamp(stat.start, timezone.utc)
+        is_sum = stat.key in sum_keys
+        metadata = StatisticMetaData(
+            has_mean=not is_sum,
+            has_sum=is_sum,
+            name=f"{device_name} {stat.key}",
+            source=DOMAIN,
+            statistic_id=statistic_id(device_id, stat.key),
+            unit_of_measurement=sum_keys[stat.key] if is_sum else mean_keys.get(stat.key),
+        )
+        if is_sum:
+            row = StatisticData(start=start, state=stat.bucket.last, sum=stat.total)
+        else:
+            row = StatisticData(
+                start=start,
+                mean=stat.bucket.mean,
+                min=stat.bucket.minimum,
+                max=stat.bucket.maximum,
+            )
+        async_add_external_statistics(hass, metadata, [row])
+    if completed:
+        _LOGGER.debug(f"Imported {len(completed)} hourly statistics for {device_id}")
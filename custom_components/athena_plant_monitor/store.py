@@ -0,0 +1,98 @@
+"""Persistent irrigation state for Athena Plant Monitor."""
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGE_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Zähler, die zum Tageswechsel verfallen
+DAILY_KEYS = ("daily_water_total", "max_vwc_today")
+
+# Als ISO-Zeitstempel gespeicherte Werte
+DATETIME_KEYS = ("last_irrigation", "phase_started")
+
+
+def _serialize(value: Any) -> Any:
+    """Convert datetimes to ISO strings for JSON."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class AthenaPlantStore:
+    """Versioned on-disk store of one device's irrigation and growth state.
+
+    Saves are delayed by STORAGE_SAVE_DELAY seconds and coalesced: any
+    number of changes within that window results in a single write of the
+    latest state. On unload ``async_save`` writes at once, so a reloaded
+    entry never reads a stale file and no delayed write lands afterwards.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str) -> None:
+        """Initialize the store for a device."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{device_id}")
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load the stored state, dropping daily counters of a previous day."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.error(f"Could not load stored state: {err}")
+            return None
+        if not stored:
+            return None
+
+        irrigation_state = dict(stored.get("irrigation_state", {}))
+        for key in DATETIME_KEYS:
+            value = irrigation_state.get(key)
+            if value:
+                try:
+                    irrigation_state[key] = datetime.fromisoformat(value)
+                except (TypeError, ValueError):
+                    irrigation_state[key] = None
+
+        # Wie der Tageswechsel im laufenden Betrieb (Mitternacht, HA-Zeitzone)
+        if stored.get("saved_on") != dt_util.now().date().isoformat():
+            for key in DAILY_KEYS:
+                irrigation_state.pop(key, None)
+
+        return {
+            "irrigation_state": irrigation_state,
+            "growth_config": dict(stored.get("growth_config", {})),
+            "target_overrides": dict(stored.get("target_overrides", {})),
+            "statistics": dict(stored.get("statistics", {})),
+        }
+
+    @callback
+    def async_schedule_save(self, data_func: Callable[[], Dict[str, Any]]) -> None:
+        """Schedule a coalesced write of ``data_func()``."""
+        self._store.async_delay_save(
+            lambda: self._prepare(data_func()), STORAGE_SAVE_DELAY
+        )
+
+    async def async_save(self, data: Dict[str, Any]) -> None:
+        """Write the state now, replacing a pending delayed write."""
+        await self._store.async_save(self._prepare(data))
+
+    @staticmethod
+    def _prepare(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make the state JSON serializable."""
+        return {
+            "saved_on": dt_util.now().date().isoformat(),
+            "irrigation_state": {
+                key: _serialize(value) for key, value in data["irrigation_state"].items()
+            },
+            "growth_config": dict(data["growth_config"]),
+            "target_overrides": dict(data["target_overrides"]),
+            "statistics": dict(data.get("statistics", {})),
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored state."""
+        await self._store.async_remove()
@@ -1,15 +1,15 @@
 """Switch platform for Athena Plant Monitor."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DATA_COORDINATOR
 from .coordinator import AthenaPlantCoordinator
+from .entity import CONTEXT_ATTRIBUTES, AthenaPlantEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,16 +87,18 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AthenaPlantSwitch(CoordinatorEntity, SwitchEntity):
+class AthenaPlantSwitch(AthenaPlantEntity, SwitchEntity):
     """Representation of an Athena Plant Monitor switch."""
 
+    _unrecorded_attributes = CONTEXT_ATTRIBUTES | {"last_irrigation", "daily_water_total"}
+
     def __init__(
         self,
         coordinator: AthenaPlantCoordinator,
         description: SwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_id}_switch_{description.key}"
         self._attr_device_info = coordinator.device_info
@@ -133,8 +135,7 @@ class AthenaPlantSwitch(CoordinatorEntity, SwitchEntity):
         
         if key == "automation_enabled":
             # Update internal state
-            self.coordinator._irrigation_state["automation_enabled"] = True
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.set_automation_enabled(True)
             
         elif key == "manual_pump":
             # Turn on ESPHome pump
@@ -191,8 +192,7 @@ class AthenaPlantSwitch(CoordinatorEntity, SwitchEntity):
         
         if key == "automation_enabled":
             # Update internal state
-            self.coordinator._irrigation_state["automation_enabled"] = False
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.set_automation_enabled(False)
             
         elif key == "manual_pump":
             # Turn off ESPHome pump
@@ -240,26 +240,20 @@ class AthenaPlantSwitch(CoordinatorEntity, SwitchEntity):
                 )
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        attrs = {}
-        
         # Add context information
-        irrigation_state = self.coordinator.data.get("irrigation_state", {})
-        growth_config = self.coordinator.data.get("growth_config", {})
-        
-        attrs.update({
-            "growth_phase": growth_config.get("phase"),
-            "crop_steering": growth_config.get("steering"),
-            "current_irrigation_phase": irrigation_state.get("current_phase"),
-        })
+        shared = self._shared_attributes("growth_irrigation")
         
         # Add specific attributes for pump
         if self.entity_description.key == "manual_pump":
+            irrigation_state = self.coordinator.data.get("irrigation_state", {})
+            attrs = dict(shared)
             attrs.update({
                 "last_irrigation": irrigation_state.get("last_irrigation"),
                 "daily_water_total": irrigation_state.get("daily_water_total", 0),
                 "automation_enabled": irrigation_state.get("automation_enabled", True),
             })
+            return attrs
         
-        return attrs
+        return shared
@@ -0,0 +1,109 @@
+"""Precomputed target profiles for Athena Plant Monitor."""
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+from .const import GROWTH_PHASES, CROP_STEERING_STRATEGIES
+
+# Manuelle Zielwerte der Number-Plattform -> Feld im TargetProfile
+TARGET_OVERRIDE_FIELDS = {
+    "vwc_target_manual": "vwc_target",
+    "ec_target_manual": "ec_target",
+    "ph_target_manual": "ph_target",
+    "vpd_target_manual": "vpd_target",
+}
+
+TargetKey = Tuple[str, str, bool]
+
+
+class TargetProfile(NamedTuple):
+    """All targets for one (growth phase, steering, day/night) combination."""
+
+    vwc_target: float
+    ec_target: float
+    ph_target: float
+    vpd_target: float
+    temperature_target: float
+    humidity_target: float
+    co2_target: int
+    dryback_target: float
+
+
+def _build_profile(phase: str, steering: str, is_day: bool) -> TargetProfile:
+    """Derive the targets from GROWTH_PHASES and CROP_STEERING_STRATEGIES."""
+    phase_config = GROWTH_PHASES[phase]
+    steering_config = CROP_STEERING_STRATEGIES[steering]
+
+    # VPD: Tag/Nacht-Wert, angepasst an Crop Steering
+    if is_day:
+        base_vpd = phase_config.get("vpd_target_day", 1.0)
+    else:
+        base_vpd = phase_config.get("vpd_target_night", 0.8)
+    if steering == "generative":
+        base_vpd += 0.2
+    elif steering == "vegetative":
+        base_vpd -= 0.1
+
+    # VWC: Higher multiplier means more water retention
+    base_vwc = phase_config.get("vwc_target", 75.0)
+    if steering_config.get("shot_multiplier", 1.0) > 1.0:
+        base_vwc += 5.0  # Vegetative steering - more water
+    elif steering_config.get("shot_multiplier", 1.0) < 1.0:
+        base_vwc -= 5.0  # Generative steering - less water
+
+    base_ec = phase_config.get("ec_target", 4.0)
+    if "ec_target_increase" in steering_config:
+        base_ec += steering_config["ec_target_increase"]
+    elif "ec_target_reduction" in steering_config:
+        base_ec -= steering_config["ec_target_reduction"]
+
+    base_dryback = phase_config.get("dryback_target", 35.0)
+    base_dryback += steering_config.get("dryback_increase", 0.0)
+    base_dryback -= steering_config.get("dryback_reduction", 0.0)
+
+    suffix = "day" if is_day else "night"
+    return TargetProfile(
+        vwc_target=round(max(50.0, min(95.0, base_vwc)), 1),
+        ec_target=round(max(1.5, min(10.0, base_ec)), 1),
+        ph_target=phase_config.get("ph_target", 6.0),
+        vpd_target=round(max(0.5, min(2.0, base_vpd)), 2),
+        temperature_target=phase_config.get(f"temp_target_{suffix}", 25.0 if is_day else 22.0),
+        humidity_target=phase_config.get(f"humidity_target_{suffix}", 65.0 if is_day else 70.0),
+        co2_target=phase_config.get(f"co2_target_{suffix}", 1200 if is_day else 1000),
+        dryback_target=round(base_dryback, 1),
+    )
+
+
+def build_target_table(overrides: Optional[Mapping[str, float]] = None) -> Mapping[TargetKey, TargetProfile]:
+    """Build the immutable target table, folding in manual overrides once."""
+    replacements = {
+        TARGET_OVERRIDE_FIELDS[key]: value
+        for key, value in (overrides or {}).items()
+        if key in TARGET_OVERRIDE_FIELDS and value is not None
+    }
+
+    table = {}
+    for phase in GROWTH_PHASES:
+        for steering in CROP_STEERING_STRATEGIES:
+            for is_day in (True, False):
+                profile = _build_profile(phase, steering, is_day)
+                if replacements:
+                    profile = profile._replace(**replacements)
+                table[(phase, steering, is_day)] = profile
+
+    return MappingProxyType(table)
+
+
+def lookup_targets(table: Mapping[TargetKey, TargetProfile], phase: str, steering: str, is_day: bool) -> TargetProfile:
+    """Index the table, falling back like the original per-read calculation."""
+    profile = table.get((phase, steering, is_day))
+    if profile is None:
+        if phase not in GROWTH_PHASES:
+            phase = "vegetative"
+        if steering not in CROP_STEERING_STRATEGIES:
+            steering = "balanced"
+        profile = table[(phase, steering, is_day)]
+    return profile
+
+
+# Tabelle ohne manuelle Overrides (wird beim Laden des Moduls einmal erstellt)
+DEFAULT_TARGET_TABLE = build_target_table()
@@ -0,0 +1,20 @@
+"""Import the integration's modules without running its ``__init__``.
+
+The package ``__init__`` sets up Home Assistant; the modules tested here
+(history, forecast, alerts, filters, ...) are plain Python and are loaded
+as submodules of an empty package object instead.
+"""
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "custom_components.athena_plant_monitor"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if PACKAGE not in sys.modules:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [str(ROOT / "custom_components" / "athena_plant_monitor")]
+    sys.modules[PACKAGE] = package
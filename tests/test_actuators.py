@@ -0,0 +1,135 @@
+"""Tests for the batched actuator commands."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor import actuators as actuators_module  # noqa: E402
+from custom_components.athena_plant_monitor.actuators import ActuatorDispatcher  # noqa: E402
+from custom_components.athena_plant_monitor.const import ACTUATOR_MIN_INTERVAL  # noqa: E402
+
+
+class FakeHass:
+    """Entity states, recorded service calls and pending timers."""
+
+    def __init__(self, states=None):
+        self.entity_states = dict(states or {})
+        self.calls = []
+        self.timers = []
+        self.tasks = []
+        self.states = SimpleNamespace(get=self._get_state)
+        self.services = SimpleNamespace(async_call=self._call)
+
+    def _get_state(self, entity_id):
+        state = self.entity_states.get(entity_id)
+        return None if state is None else SimpleNamespace(state=state)
+
+    async def _call(self, domain, service, data, blocking=False):
+        self.calls.append((domain, service, sorted(data["entity_id"])))
+        if domain == "climate":
+            raise RuntimeError("unavailable")
+        for entity_id in data["entity_id"]:
+            self.entity_states[entity_id] = "on" if service == "turn_on" else "off"
+
+    def async_create_task(self, coro):
+        self.tasks.append(coro)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(actuators_module.time, "monotonic", lambda: clock["now"])
+
+    def call_later(hass, delay, action):
+        timer = (clock["now"] + delay, action)
+        hass.timers.append(timer)
+        return lambda: hass.timers.remove(timer)
+
+    monkeypatch.setattr(actuators_module, "async_call_later", call_later)
+    return clock
+
+
+def test_entities_in_the_desired_state_are_skipped(clock):
+    hass = FakeHass({"switch.fan": "on", "switch.heater": "off"})
+    dispatcher = ActuatorDispatcher(hass)
+
+    assert asyncio.run(dispatcher.async_apply({"switch.fan": True, "switch.heater": False})) == 0
+    assert hass.calls == []
+    assert dispatcher.diagnostics()["skipped"] == 2
+
+
+def test_commands_are_grouped_by_domain_and_service(clock):
+    hass = FakeHass({"switch.fan": "off", "switch.pump": "off", "switch.heater": "on", "fan.exhaust": "off"})
+    dispatcher = ActuatorDispatcher(hass)
+
+    sent = asyncio.run(dispatcher.async_apply({
+        "switch.fan": True, "switch.pump": True, "switch.heater": False, "fan.exhaust": True,
+    }))
+
+    assert sent == 4
+    assert sorted(hass.calls) == [
+        ("fan", "turn_on", ["fan.exhaust"]),
+        ("switch", "turn_off", ["switch.heater"]),
+        ("switch", "turn_on", ["switch.fan", "switch.pump"]),
+    ]
+    stats = dispatcher.diagnostics()
+    assert (stats["batches"], stats["commands"], stats["failed"]) == (1, 4, 0)
+
+
+def test_failed_group_is_counted(clock):
+    hass = FakeHass({"climate.ac": "off", "switch.fan": "off"})
+    dispatcher = ActuatorDispatcher(hass)
+
+    assert asyncio.run(dispatcher.async_apply({"climate.ac": True, "switch.fan": True})) == 2
+    assert dispatcher.diagnostics()["failed"] == 1
+    assert hass.entity_states["switch.fan"] == "on"
+
+
+def test_commands_within_the_interval_are_coalesced(clock):
+    assert ACTUATOR_MIN_INTERVAL == 5
+    hass = FakeHass({"switch.fan": "off", "switch.heater": "off"})
+    dispatcher = ActuatorDispatcher(hass)
+    asyncio.run(dispatcher.async_apply({"switch.fan": True}))
+
+    clock["now"] += 2
+    assert asyncio.run(dispatcher.async_apply({"switch.fan": False, "switch.heater": True})) == 0
+    assert asyncio.run(dispatcher.async_apply({"switch.heater": False})) == 0
+    # Ein Timer bis zum Ende des Intervalls, der letzte Wunsch gewinnt
+    assert [due for due, _ in hass.timers] == [1005.0]
+    assert dispatcher.diagnostics()["pending"] == {"switch.fan": False, "switch.heater": False}
+    assert dispatcher.diagnostics()["coalesced"] == 3
+
+    clock["now"] += 3
+    due, action = hass.timers.pop()
+    action(clock["now"])
+    assert asyncio.run(hass.tasks.pop()) == 1
+    assert hass.calls[-1] == ("switch", "turn_off", ["switch.fan"])
+    assert dispatcher.diagnostics()["pending"] == {}
+
+
+def test_force_bypasses_the_interval(clock):
+    hass = FakeHass({"switch.fan": "off", "switch.pump": "off"})
+    dispatcher = ActuatorDispatcher(hass)
+    asyncio.run(dispatcher.async_apply({"switch.fan": True}))
+
+    clock["now"] += 1
+    asyncio.run(dispatcher.async_apply({"switch.fan": False}))
+    assert len(hass.timers) == 1
+
+    assert asyncio.run(dispatcher.async_apply({"switch.pump": True}, force=True)) == 2
+    assert hass.timers == []
+    assert hass.entity_states == {"switch.fan": "off", "switch.pump": "on"}
+
+
+def test_stop_drops_pending_commands(clock):
+    hass = FakeHass({"switch.fan": "off"})
+    dispatcher = ActuatorDispatcher(hass)
+    asyncio.run(dispatcher.async_apply({"switch.fan": True}))
+    clock["now"] += 1
+    asyncio.run(dispatcher.async_apply({"switch.fan": False}))
+
+    dispatcher.async_stop()
+    assert hass.timers == []
+    assert dispatcher.diagnostics()["pending"] == {}
@@ -0,0 +1,118 @@
+"""Tests for the alert engine (debounce, hysteresis, de-duplication)."""
+from custom_components.athena_plant_monitor.alerts import AlertEngine, build_rules
+
+
+def _engine(min_duration=60):
+    return AlertEngine(build_rules(
+        {"vwc_critical_low": 50.0, "ec_critical_high": 10.0}, min_duration=min_duration
+    ))
+
+
+def test_build_rules_maps_prefix_direction_and_hysteresis():
+    rules = {rule.alert_id: rule for rule in build_rules()}
+    vwc_low = rules["vwc_critical_low"]
+    assert vwc_low.key == "vwc"
+    assert not vwc_low.above
+    assert vwc_low.hysteresis == 2.0
+    assert vwc_low.severity == "critical"
+    assert rules["temp_critical_high"].key == "temperature"
+    assert rules["temp_critical_high"].severity == "warning"
+
+
+def test_build_rules_ignores_unknown_thresholds():
+    assert build_rules({"co2_critical_high": 1500.0, "vwc_critical_mid": 1.0}) == []
+
+
+def test_violation_is_debounced():
+    engine = _engine()
+    assert engine.evaluate({"vwc": 45.0}, 0.0) == ([], [])
+    assert engine.next_due() == 60.0
+
+    raised, _ = engine.evaluate({"vwc": 45.0}, 59.0)
+    assert raised == []
+
+    raised, _ = engine.evaluate({"vwc": 44.0}, 60.0)
+    assert [alert["id"] for alert in raised] == ["vwc_critical_low"]
+    assert raised[0]["value"] == 44.0
+    assert raised[0]["since"] == "1970-01-01T00:00:00+00:00"
+    assert engine.next_due() is None
+
+
+def test_short_violation_resets_the_debounce():
+    engine = _engine()
+    engine.evaluate({"vwc": 45.0}, 0.0)
+    engine.evaluate({"vwc": 55.0}, 30.0)
+    assert engine.next_due() is None
+
+    engine.evaluate({"vwc": 45.0}, 40.0)
+    raised, _ = engine.evaluate({"vwc": 45.0}, 90.0)
+    assert raised == []
+    raised, _ = engine.evaluate({"vwc": 45.0}, 100.0)
+    assert len(raised) == 1
+
+
+def test_pending_alert_completes_without_a_new_value():
+    engine = _engine()
+    engine.evaluate({"vwc": 45.0, "ec_substrate": 5.0}, 0.0)
+    # Nur EC hat sich geändert, der ausstehende VWC-Alert wird trotzdem geprüft
+    raised, _ = engine.evaluate({"vwc": 45.0, "ec_substrate": 5.5}, 60.0, changed=["ec_substrate"])
+    assert [alert["id"] for alert in raised] == ["vwc_critical_low"]
+
+
+def test_alert_clears_only_beyond_the_hysteresis_band():
+    engine = _engine(min_duration=0)
+    raised, _ = engine.evaluate({"vwc": 45.0}, 0.0)
+    assert len(raised) == 1
+
+    # Über dem Schwellwert, aber noch innerhalb der Hysterese (50 + 2)
+    assert engine.evaluate({"vwc": 51.0}, 10.0) == ([], [])
+    assert engine.alerts["critical"]
+
+    _, cleared = engine.evaluate({"vwc": 52.0}, 20.0)
+    assert [alert["id"] for alert in cleared] == ["vwc_critical_low"]
+    assert engine.alerts["critical"] == []
+
+
+def test_high_threshold_hysteresis_points_downwards():
+    engine = _engine(min_duration=0)
+    engine.evaluate({"ec_substrate": 10.5}, 0.0)
+    assert engine.evaluate({"ec_substrate": 9.8}, 10.0) == ([], [])
+    _, cleared = engine.evaluate({"ec_substrate": 9.7}, 20.0)
+    assert len(cleared) == 1
+
+
+def test_active_alert_is_not_raised_again():
+    engine = _engine(min_duration=0)
+    engine.evaluate({"vwc": 45.0}, 0.0)
+    snapshot = engine.alerts
+    assert engine.evaluate({"vwc": 40.0}, 10.0) == ([], [])
+    assert engine.alerts is snapshot
+    assert len(snapshot["critical"]) == 1
+
+
+def test_non_numeric_values_are_ignored():
+    engine = _engine(min_duration=0)
+    assert engine.evaluate({"vwc": None}, 0.0) == ([], [])
+    assert engine.evaluate({"vwc": "unavailable"}, 0.0) == ([], [])
+
+
+def test_unavailable_value_drops_pending_alert():
+    engine = _engine()
+    engine.evaluate({"vwc": 45.0}, 0.0)
+    assert engine.next_due() == 60.0
+
+    engine.evaluate({"vwc": None}, 10.0)
+    assert engine.next_due() is None
+    # Der Alarm-Check ohne neue Werte hält keinen Timer am Leben
+    assert engine.evaluate({"vwc": None}, 70.0, changed=set()) == ([], [])
+    assert engine.next_due() is None
+
+    engine.evaluate({"vwc": 45.0}, 80.0)
+    assert engine.next_due() == 140.0
+
+
+def test_unavailable_value_keeps_active_alert():
+    engine = _engine(min_duration=0)
+    engine.evaluate({"vwc": 45.0}, 0.0)
+    assert engine.evaluate({"vwc": None}, 10.0) == ([], [])
+    assert len(engine.alerts["critical"]) == 1
@@ -0,0 +1,100 @@
+"""Tests for the per-node availability circuit breaker."""
+from custom_components.athena_plant_monitor.availability import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    DeviceAvailability,
+)
+
+
+def _opened(grace_period=60.0, initial_backoff=30.0, max_backoff=200.0):
+    breaker = DeviceAvailability(grace_period, initial_backoff, max_backoff)
+    breaker.record(False, 0.0)
+    assert breaker.record(False, grace_period) == "opened"
+    return breaker
+
+
+def test_silent_node_opens_only_after_grace_period():
+    breaker = DeviceAvailability(grace_period=60.0, initial_backoff=30.0, max_backoff=200.0)
+    assert breaker.record(False, 0.0) is None
+    assert breaker.grace_remaining(20.0) == 40.0
+    assert breaker.record(False, 59.0) is None
+    assert breaker.available
+
+    assert breaker.record(False, 60.0) == "opened"
+    assert breaker.state == STATE_OPEN
+    assert not breaker.available
+    assert breaker.trips == 1
+    assert breaker.grace_remaining(60.0) is None
+    # Weitere Fehlschläge lösen keinen zweiten Übergang aus
+    assert breaker.record(False, 70.0) is None
+
+
+def test_update_within_grace_period_resets_it():
+    breaker = DeviceAvailability(grace_period=60.0, initial_backoff=30.0, max_backoff=200.0)
+    breaker.record(False, 0.0)
+    assert breaker.record(True, 50.0) is None
+    assert breaker.grace_remaining(50.0) is None
+    assert breaker.record(False, 100.0) is None
+    assert breaker.state == STATE_CLOSED
+
+
+def test_probe_backoff_doubles_up_to_max():
+    breaker = _opened()
+    assert not breaker.probe_due(89.0)
+    assert breaker.probe_due(90.0)
+
+    now = 90.0
+    for expected in (60.0, 120.0, 200.0, 200.0):
+        breaker.probe_result(False, now)
+        assert breaker.backoff == expected
+        assert breaker.next_probe == now + expected
+        now += expected
+    assert breaker.failed_probes == 4
+    assert breaker.state == STATE_OPEN
+
+
+def test_probe_now_makes_probe_due():
+    breaker = _opened()
+    assert not breaker.probe_due(61.0)
+    breaker.probe_now()
+    assert breaker.probe_due(61.0)
+
+
+def test_successful_probe_and_update_close_the_breaker():
+    breaker = _opened()
+    breaker.probe_result(False, 90.0)
+    breaker.probe_result(True, 150.0)
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.available
+    assert not breaker.probe_due(150.0)
+
+    assert breaker.record(True, 160.0) == "closed"
+    assert breaker.state == STATE_CLOSED
+    assert breaker.backoff == 30.0
+
+
+def test_failed_update_after_probe_reopens_with_doubled_backoff():
+    breaker = _opened()
+    breaker.probe_result(True, 90.0)
+    assert breaker.record(False, 100.0) is None
+    assert breaker.state == STATE_OPEN
+    assert breaker.backoff == 60.0
+    assert breaker.next_probe == 160.0
+    assert breaker.trips == 1
+
+
+def test_as_dict():
+    breaker = _opened()
+    assert breaker.as_dict(75.0) == {
+        "state": STATE_OPEN,
+        "offline_for": 75.0,
+        "backoff": 30.0,
+        "next_probe_in": 15.0,
+        "trips": 1,
+        "failed_probes": 0,
+    }
+    breaker.probe_result(True, 90.0)
+    breaker.record(True, 95.0)
+    assert breaker.as_dict(95.0)["next_probe_in"] is None
+    assert breaker.as_dict(95.0)["offline_for"] is None
@@ -0,0 +1,111 @@
+"""Tests for the incremental derivation graph."""
+import pytest
+
+from custom_components.athena_plant_monitor.dependency_graph import DerivationGraph
+
+
+def _graph(calls):
+    """vpd <- (temperature, humidity), vpd_status <- vpd, registered consumer first."""
+    graph = DerivationGraph()
+
+    def vpd_status(data):
+        calls.append("vpd_status")
+        return {"vpd_status": "high" if data["vpd"] > 1.2 else "ok"}
+
+    def vpd(data):
+        calls.append("vpd")
+        return {"vpd": round(data["temperature"] / 20 - data["humidity"] / 100, 2)}
+
+    def water(data):
+        calls.append("water")
+        return {"water_pct": data["vwc"] * 2}
+
+    graph.add("vpd_status", ["vpd"], ["vpd_status"], vpd_status)
+    graph.add("vpd", ["temperature", "humidity"], ["vpd"], vpd)
+    graph.add("water", ["vwc"], ["water_pct"], water)
+    return graph
+
+
+def _data(**values):
+    data = {"temperature": 25.0, "humidity": 60.0, "vwc": 40.0}
+    data.update(values)
+    return data
+
+
+def test_producers_run_before_consumers():
+    calls = []
+    graph = _graph(calls)
+    data = _data()
+
+    assert graph.evaluate(data) == {"vpd", "vpd_status", "water_pct"}
+    assert calls.index("vpd") < calls.index("vpd_status")
+    assert data["vpd"] == 0.65
+    assert data["vpd_status"] == "ok"
+    assert graph.outputs == {"vpd", "vpd_status", "water_pct"}
+
+
+def test_only_affected_derivations_run():
+    calls = []
+    graph = _graph(calls)
+    graph.evaluate(_data())
+    calls.clear()
+
+    data = _data(vwc=45.0)
+    assert graph.evaluate(data, {"vwc"}) == {"water_pct"}
+    assert calls == ["water"]
+    # Zwischengespeicherte Ergebnisse landen trotzdem in den Daten
+    assert data["vpd"] == 0.65
+    assert data["vpd_status"] == "ok"
+
+
+def test_unchanged_output_does_not_rerun_dependents():
+    calls = []
+    graph = _graph(calls)
+    graph.evaluate(_data())
+    calls.clear()
+
+    # Gleiche VPD trotz geänderter Eingänge
+    assert graph.evaluate(_data(temperature=26.0, humidity=65.0), {"temperature", "humidity"}) == set()
+    assert calls == ["vpd"]
+
+    calls.clear()
+    data = _data(temperature=40.0)
+    assert graph.evaluate(data, {"temperature"}) == {"vpd", "vpd_status"}
+    assert calls == ["vpd", "vpd_status"]
+    assert data["vpd_status"] == "high"
+
+
+def test_volatile_derivation_runs_every_time():
+    graph = DerivationGraph()
+    clock = {"hour": 8}
+    calls = []
+
+    def phase(data):
+        calls.append("phase")
+        return {"phase": "day" if clock["hour"] < 22 else "night"}
+
+    graph.add("phase", ["config:schedule"], ["phase"], phase, volatile=True)
+    graph.evaluate({})
+    assert graph.evaluate({}, set()) == set()
+    clock["hour"] = 23
+    assert graph.evaluate({}, set()) == {"phase"}
+    assert calls == ["phase"] * 3
+
+
+def test_invalidate_recomputes_everything():
+    calls = []
+    graph = _graph(calls)
+    graph.evaluate(_data())
+    graph.invalidate()
+    calls.clear()
+
+    assert graph.evaluate(_data(), set()) == {"vpd", "vpd_status", "water_pct"}
+    assert sorted(calls) == ["vpd", "vpd_status", "water"]
+
+
+def test_cycle_is_rejected():
+    graph = DerivationGraph()
+    graph.add("a", ["b"], ["a"], lambda data: {"a": 1})
+    graph.add("b", ["a"], ["b"], lambda data: {"b": 1})
+    with pytest.raises(ValueError, match="Cyclic dependency"):
+        graph.evaluate({})
@@ -0,0 +1,67 @@
+"""Tests for the streaming sensor filters."""
+import pytest
+
+from custom_components.athena_plant_monitor.filters import (
+    HampelFilter,
+    RateLimiter,
+    SampleFilter,
+    SensorFilters,
+)
+
+
+def test_sample_filter_is_abstract():
+    with pytest.raises(TypeError):
+        SampleFilter()
+
+
+def test_hampel_replaces_spike_by_median():
+    hampel = HampelFilter(5, n_sigmas=3.0, min_deviation=0.5)
+    for second, value in enumerate((50.0, 50.2, 49.9, 50.1)):
+        assert hampel.update(value, float(second)) == value
+    assert hampel.update(80.0, 4.0) == 50.1
+    assert hampel.rejected == 1
+
+
+def test_hampel_passes_step_change_after_half_window():
+    hampel = HampelFilter(5, min_deviation=0.5)
+    outputs = [hampel.update(value, float(second)) for second, value in enumerate([50.0] * 5 + [60.0] * 3)]
+    assert outputs[5] == 50.0
+    assert outputs[-1] == 60.0
+
+
+def test_hampel_min_deviation_keeps_small_noise():
+    hampel = HampelFilter(5, min_deviation=1.0)
+    for second in range(4):
+        hampel.update(20.0, float(second))
+    assert hampel.update(20.8, 4.0) == 20.8
+    assert hampel.rejected == 0
+
+
+def test_rate_limiter_limits_change_per_minute():
+    limiter = RateLimiter(max_rate=2.0)
+    assert limiter.update(50.0, 0.0) == 50.0
+    assert limiter.update(60.0, 60.0) == 52.0
+    assert limiter.update(40.0, 90.0) == 51.0
+    assert limiter.update(51.5, 120.0) == 51.5
+
+
+def test_rate_limiter_reset_accepts_next_value():
+    limiter = RateLimiter(max_rate=1.0)
+    limiter.update(50.0, 0.0)
+    limiter.reset()
+    assert limiter.update(70.0, 10.0) == 70.0
+
+
+def test_sensor_filters_keep_raw_value_and_reset_on_unavailable():
+    filters = SensorFilters({"vwc": {"max_rate": 2.0}})
+    raw = {}
+    filters.apply({"vwc": 50.0}, raw, 0.0)
+    data = {"vwc": 60.0}
+    filters.apply(data, raw, 60.0)
+    assert data["vwc"] == 52.0
+    assert raw["vwc"] == 60.0
+
+    filters.apply({"vwc": None}, raw, 90.0)
+    data = {"vwc": 60.0}
+    filters.apply(data, raw, 120.0)
+    assert data["vwc"] == 60.0
@@ -0,0 +1,55 @@
+"""Tests for the dryback forecast."""
+import math
+
+import pytest
+
+from custom_components.athena_plant_monitor.forecast import DrybackEstimator
+
+
+def _feed(estimator, vwc0, k, hours):
+    for step in range(hours * 4 + 1):
+        t = step * 900.0
+        estimator.add(t, vwc0 * math.exp(-k * t / 3600))
+
+
+def test_decay_fit_recovers_constant():
+    estimator = DrybackEstimator(window=6 * 3600)
+    _feed(estimator, 60.0, 0.05, 4)
+    assert estimator.decay_constant == pytest.approx(0.05)
+    assert estimator.dryback_rate(60.0) == pytest.approx(estimator.latest_vwc * 0.05 / 60.0 * 100)
+
+
+def test_hours_to_dryback():
+    estimator = DrybackEstimator(window=6 * 3600)
+    _feed(estimator, 60.0, 0.05, 2)
+    latest = estimator.latest_vwc
+    expected = math.log(latest / (60.0 * 0.8)) / 0.05
+    assert estimator.hours_to_dryback(20.0, 60.0) == pytest.approx(expected)
+    assert estimator.hours_to_dryback(1.0, 60.0) == 0.0
+
+
+def test_no_fit_below_min_samples():
+    estimator = DrybackEstimator(window=3600)
+    estimator.add(0.0, 50.0)
+    estimator.add(60.0, 49.9)
+    assert estimator.decay_constant is None
+    assert estimator.hours_to_dryback(20.0, 50.0) is None
+
+
+def test_vwc_rise_starts_new_curve():
+    estimator = DrybackEstimator(window=6 * 3600)
+    _feed(estimator, 60.0, 0.05, 2)
+    estimator.add(3 * 3600.0, 62.0)
+    assert estimator.latest_vwc == 62.0
+    assert estimator.decay_constant is None
+
+    estimator.add(3 * 3600.0 + 900, 61.5)
+    estimator.add(3 * 3600.0 + 1800, 61.0)
+    assert estimator.decay_constant > 0
+
+
+def test_small_rise_keeps_curve():
+    estimator = DrybackEstimator(window=6 * 3600)
+    _feed(estimator, 60.0, 0.05, 2)
+    estimator.add(2 * 3600.0 + 900, estimator.latest_vwc + 0.5)
+    assert estimator.decay_constant is not None
@@ -0,0 +1,48 @@
+"""Tests for the in-memory sensor history."""
+from custom_components.athena_plant_monitor.const import ESPHOME_ENTITIES
+from custom_components.athena_plant_monitor.history import HISTORY_KEYS, RingBuffer, SensorHistory
+
+# Abgeleitete Werte, die der Coordinator selbst berechnet
+DERIVED_HISTORY_KEYS = {"vpd_calculated", "dryback_percent"}
+
+
+def test_history_keys_are_ingested_keys():
+    unknown = set(HISTORY_KEYS) - DERIVED_HISTORY_KEYS - set(ESPHOME_ENTITIES)
+    assert not unknown
+
+
+def test_substrate_temperature_is_recorded():
+    history = SensorHistory(3600, 60)
+    history.record_snapshot({"temp_substrate": 21.5}, timestamp=1000.0)
+    assert history.samples("temp_substrate") == [(1000.0, 21.5)]
+
+
+def test_ring_buffer_overwrites_oldest_sample():
+    buffer = RingBuffer(3)
+    for second in range(5):
+        buffer.append(float(second), second * 10.0)
+    assert len(buffer) == 3
+    assert list(buffer.iter_window()) == [(4.0, 40.0), (3.0, 30.0), (2.0, 20.0)]
+    assert buffer.latest() == (4.0, 40.0)
+
+
+def test_ring_buffer_window_after_wraparound():
+    buffer = RingBuffer(4)
+    for second in range(10):
+        buffer.append(float(second), float(second))
+    assert [value for _, value in buffer.iter_window(2.5, now=9.0)] == [9.0, 8.0, 7.0]
+
+
+def test_samples_within_resolution_replace_latest():
+    history = SensorHistory(300, 60, keys=("vwc",))
+    history.record("vwc", 50.0, timestamp=0.0)
+    history.record("vwc", 49.0, timestamp=30.0)
+    history.record("vwc", 48.0, timestamp=60.0)
+    assert history.samples("vwc") == [(0.0, 49.0), (60.0, 48.0)]
+
+
+def test_history_keeps_retention_window():
+    history = SensorHistory(180, 60, keys=("vwc",))
+    for minute in range(10):
+        history.record("vwc", float(minute), timestamp=minute * 60.0)
+    assert [value for _, value in history.samples("vwc")] == [6.0, 7.0, 8.0, 9.0]
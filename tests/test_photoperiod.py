@@ -0,0 +1,81 @@
+"""Tests for the cached day/night decision."""
+from datetime import datetime, time
+
+from custom_components.athena_plant_monitor.photoperiod import Photoperiod
+
+
+def _at(hour, minute=0, day=1):
+    return datetime(2026, 3, day, hour, minute)
+
+
+class EntityState:
+    """Light entity stand-in that counts how often it is asked."""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_schedule_bounds():
+    photoperiod = Photoperiod("06:00", "22:00")
+    assert not photoperiod.is_scheduled_day(time(5, 59))
+    assert photoperiod.is_scheduled_day(time(6, 0))
+    assert photoperiod.is_scheduled_day(time(21, 59))
+    # Ende exklusiv: 22:00 ist bereits Nacht
+    assert not photoperiod.is_scheduled_day(time(22, 0))
+
+
+def test_result_is_cached_until_the_next_transition():
+    photoperiod = Photoperiod("06:00", "22:00")
+    entity = EntityState()
+
+    assert photoperiod.is_day(_at(12), entity) is True
+    assert photoperiod.source == "schedule"
+    assert photoperiod.next_transition == _at(22)
+    assert photoperiod.is_day(_at(21, 59), entity) is True
+    assert entity.calls == 1
+
+    assert photoperiod.is_day(_at(22), entity) is False
+    assert entity.calls == 2
+    assert photoperiod.next_transition == _at(6, day=2)
+
+
+def test_entity_result_is_cached_until_invalidated():
+    photoperiod = Photoperiod("06:00", "22:00")
+    entity = EntityState(False)
+
+    assert photoperiod.is_day(_at(12), entity) is False
+    assert photoperiod.source == "entity"
+    assert photoperiod.next_transition is None
+    entity.value = True
+    assert photoperiod.is_day(_at(23), entity) is False
+    assert entity.calls == 1
+
+    photoperiod.invalidate()
+    assert photoperiod.is_day(_at(23), entity) is True
+    assert entity.calls == 2
+
+
+def test_schedule_wrapping_midnight():
+    photoperiod = Photoperiod("18:00", "06:00")
+    assert photoperiod.is_scheduled_day(time(23, 0))
+    assert photoperiod.is_scheduled_day(time(0, 0))
+    assert photoperiod.is_scheduled_day(time(5, 59))
+    assert not photoperiod.is_scheduled_day(time(6, 0))
+    assert not photoperiod.is_scheduled_day(time(17, 59))
+
+    entity = EntityState()
+    assert photoperiod.is_day(_at(23), entity) is True
+    assert photoperiod.next_transition == _at(6, day=2)
+    assert photoperiod.is_day(_at(5, 59, day=2), entity) is True
+    assert photoperiod.is_day(_at(6, day=2), entity) is False
+    assert photoperiod.next_transition == _at(18, day=2)
+
+
+def test_invalid_schedule_falls_back_to_default():
+    photoperiod = Photoperiod("morgens", "22:00")
+    assert (photoperiod.schedule_start, photoperiod.schedule_end) == (time(6, 0), time(22, 0))
@@ -0,0 +1,50 @@
+"""Tests for the adaptive update interval."""
+from custom_components.athena_plant_monitor.polling import AdaptiveInterval
+
+THRESHOLDS = {"vwc": 6.0, "temperature": 3.0}
+
+
+def _interval(**kwargs):
+    return AdaptiveInterval(30, 5, 300, THRESHOLDS, **kwargs)
+
+
+def test_shots_and_p1_use_minimum():
+    adaptive = _interval()
+    assert adaptive.target("P2", True, True, {}) == (5, "irrigation")
+    assert adaptive.target("P1", True, False, {}) == (5, "P1")
+
+
+def test_day_uses_base_and_night_maximum():
+    adaptive = _interval()
+    assert adaptive.target("P2", True, False, {}) == (30, "P2")
+    assert adaptive.target("P3", False, False, {}) == (300, "night")
+
+
+def test_fast_trend_shortens_interval():
+    adaptive = _interval()
+    assert adaptive.target("P3", False, False, {"vwc": -12.0, "temperature": None}) == (150, "vwc_trend")
+    assert adaptive.target("P2", True, False, {"temperature": 300.0}) == (5, "temperature_trend")
+    assert adaptive.target("P2", True, False, {"vwc": 3.0}) == (30, "P2")
+
+
+def test_longer_interval_at_most_doubles():
+    adaptive = _interval()
+    assert adaptive.update("P3", False, False, {}) == 60
+    assert adaptive.update("P3", False, False, {}) == 120
+    assert adaptive.update("P3", False, False, {}) == 240
+    assert adaptive.update("P3", False, False, {}) == 300
+    assert adaptive.reason == "night"
+
+
+def test_shorter_interval_applies_at_once():
+    adaptive = _interval()
+    for _ in range(4):
+        adaptive.update("P3", False, False, {})
+    assert adaptive.update("P1", True, False, {}) == 5
+    assert adaptive.as_dict()["current"] == 5
+
+
+def test_bounds_are_clamped():
+    adaptive = AdaptiveInterval(600, 0, 120, THRESHOLDS)
+    assert adaptive.minimum == 1.0
+    assert adaptive.base == 120
@@ -0,0 +1,86 @@
+"""Tests for the per-stage update profiling."""
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.athena_plant_monitor import profiling
+from custom_components.athena_plant_monitor.profiling import NO_PROFILING, UpdateProfiler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(profiling.time, "perf_counter", lambda: clock["now"])
+    monkeypatch.setattr(profiling.time, "monotonic", lambda: clock["now"])
+    return clock
+
+
+def test_stage_records_duration(clock):
+    profiler = UpdateProfiler()
+    for seconds in (0.002, 0.004):
+        with profiler.stage("derive"):
+            clock["now"] += seconds
+
+    assert profiler.stages()["derive"] == {"count": 2, "last_ms": 4.0, "avg_ms": 3.0, "max_ms": 4.0}
+    assert profiler.updates == 0
+
+
+def test_failing_stage_is_still_timed(clock):
+    profiler = UpdateProfiler()
+    with pytest.raises(ValueError):
+        with profiler.stage("alerts"):
+            clock["now"] += 0.001
+            raise ValueError
+    assert profiler.stages()["alerts"]["count"] == 1
+
+
+def test_update_counts_only_on_success(clock):
+    profiler = UpdateProfiler()
+    with profiler.stage("refresh", update=True):
+        clock["now"] += 0.010
+    with pytest.raises(RuntimeError):
+        with profiler.stage("refresh", update=True):
+            clock["now"] += 0.020
+            raise RuntimeError
+
+    assert profiler.updates == 1
+    assert profiler.last_update == pytest.approx(0.010)
+    assert profiler.stages()["refresh"]["count"] == 1
+    assert profiler.updates_per_minute == 1
+
+    clock["now"] += profiling.RATE_WINDOW + 1
+    assert profiler.updates_per_minute == 0
+
+
+def test_as_dict(clock):
+    profiler = UpdateProfiler()
+    profiler.coalesced = 3
+    profiler.skipped = 1
+    with profiler.stage("event", update=True):
+        clock["now"] += 0.0015
+
+    result = profiler.as_dict()
+    assert result["updates"] == 1
+    assert result["last_update_ms"] == 1.5
+    assert (result["coalesced"], result["skipped"]) == (3, 1)
+    assert set(result["stages"]) == {"event"}
+
+
+def test_no_profiling_is_a_reusable_no_op():
+    for _ in range(2):
+        with NO_PROFILING as value:
+            assert value is None
+
+
+def test_coordinator_times_stages_explicitly():
+    coordinator_module = pytest.importorskip("custom_components.athena_plant_monitor.coordinator")
+    profile = coordinator_module.AthenaPlantCoordinator._profile
+
+    assert profile(SimpleNamespace(profiler=None), "derive") is NO_PROFILING
+
+    profiler = UpdateProfiler()
+    with profile(SimpleNamespace(profiler=profiler), "refresh", update=True):
+        pass
+    assert profiler.updates == 1
+    # Keine Methoden-Wrapper mehr, die beim Entladen zurückgesetzt werden müssten
+    assert not hasattr(profiling, "attach")
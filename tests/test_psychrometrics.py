@@ -0,0 +1,87 @@
+"""Tests for the psychrometric kernels (Tetens/Magnus over water)."""
+import pytest
+
+from custom_components.athena_plant_monitor import psychrometrics
+from custom_components.athena_plant_monitor.psychrometrics import QUANTITIES
+
+# Tetens: es(20 °C) = 2.3383 kPa, es(25 °C) = 3.1678 kPa
+ES_20 = 2.3383
+ES_25 = 3.1678
+
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    """Run the kernels without NumPy even where it is installed."""
+    monkeypatch.setattr(psychrometrics, "np", None)
+
+
+def test_scalar_values(pure_python):
+    assert psychrometrics.saturation_vapor_pressure(25.0) == pytest.approx(ES_25, abs=1e-4)
+    assert psychrometrics.actual_vapor_pressure(25.0, 60.0) == pytest.approx(ES_25 * 0.6, abs=1e-4)
+    assert psychrometrics.vpd(25.0, 60.0) == pytest.approx(ES_25 * 0.4, abs=1e-4)
+    assert psychrometrics.leaf_vpd(25.0, 60.0, leaf_offset=-5.0) == pytest.approx(ES_20 - ES_25 * 0.6, abs=1e-4)
+    assert psychrometrics.leaf_vpd(25.0, 60.0, leaf_temperature=20.0) == pytest.approx(ES_20 - ES_25 * 0.6, abs=1e-4)
+    assert psychrometrics.dew_point(25.0, 60.0) == pytest.approx(16.69, abs=0.01)
+    assert psychrometrics.dew_point(20.0, 100.0) == pytest.approx(20.0)
+    assert psychrometrics.absolute_humidity(25.0, 60.0) == pytest.approx(13.82, abs=0.01)
+    assert psychrometrics.enthalpy(25.0, 50.0) == pytest.approx(50.3, abs=0.1)
+
+
+def test_scalar_none(pure_python):
+    assert psychrometrics.vpd(None, 60.0) is None
+    assert psychrometrics.dew_point(25.0, None) is None
+
+
+def test_dew_point_at_zero_humidity_is_finite(pure_python):
+    assert psychrometrics.dew_point(25.0, 0.0) < -50
+
+
+def test_nested_lists_broadcast_scalars(pure_python):
+    result = psychrometrics.vpd([[25.0, 20.0], [25.0, None]], 60.0)
+    assert result[0] == pytest.approx([ES_25 * 0.4, ES_20 * 0.4], abs=1e-4)
+    assert result[1][0] == pytest.approx(ES_25 * 0.4, abs=1e-4)
+    assert result[1][1] is None
+
+
+def test_batched_call_returns_every_quantity(pure_python):
+    result = psychrometrics.psychrometrics(25.0, 60.0, leaf_offset=-5.0)
+    assert set(result) == set(QUANTITIES)
+    assert result["vpd"] == pytest.approx(psychrometrics.vpd(25.0, 60.0))
+    assert result["leaf_vpd"] == pytest.approx(ES_20 - ES_25 * 0.6, abs=1e-4)
+    assert result["dew_point"] == pytest.approx(16.69, abs=0.01)
+    assert result["enthalpy"] == pytest.approx(psychrometrics.enthalpy(25.0, 60.0))
+
+
+def test_batched_call_transposes_nested_lists(pure_python):
+    temps = [[25.0, 20.0], [None, 25.0]]
+    rhs = [[60.0, 60.0], [60.0, 60.0]]
+    result = psychrometrics.psychrometrics(temps, rhs)
+    assert set(result) == set(QUANTITIES)
+    assert result["vpd"][0] == pytest.approx([ES_25 * 0.4, ES_20 * 0.4], abs=1e-4)
+    assert result["vpd"][1][0] is None
+    assert result["dew_point"][1][1] == pytest.approx(16.69, abs=0.01)
+    assert all(result[key][1][0] is None for key in QUANTITIES)
+
+
+def test_batched_call_with_none_scalar(pure_python):
+    assert psychrometrics.psychrometrics(None, 60.0) == dict.fromkeys(QUANTITIES)
+
+
+def test_numpy_path_matches_pure_python(monkeypatch):
+    np = pytest.importorskip("numpy")
+    temps = [[25.0, 20.0], [18.0, 30.0]]
+    rhs = [[60.0, 55.0], [80.0, 40.0]]
+    vectorized = psychrometrics.psychrometrics(temps, rhs, leaf_offset=-2.0)
+    assert isinstance(vectorized["vpd"], np.ndarray)
+
+    monkeypatch.setattr(psychrometrics, "np", None)
+    expected = psychrometrics.psychrometrics(temps, rhs, leaf_offset=-2.0)
+    for key in QUANTITIES:
+        assert vectorized[key].tolist() == [pytest.approx(row) for row in expected[key]]
+
+
+def test_numpy_path_turns_none_into_nan():
+    np = pytest.importorskip("numpy")
+    result = psychrometrics.vpd([25.0, None], [60.0, 60.0])
+    assert result[0] == pytest.approx(ES_25 * 0.4, abs=1e-4)
+    assert np.isnan(result[1])
@@ -0,0 +1,133 @@
+"""Tests for resolving service targets to coordinators."""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor import registry as registry_module  # noqa: E402
+from custom_components.athena_plant_monitor.registry import CoordinatorRegistry  # noqa: E402
+
+HASS = object()
+
+
+def _coordinator(device_id):
+    return SimpleNamespace(
+        device_id=device_id,
+        tracked_entity_ids=[f"sensor.{device_id}_vwc", f"switch.{device_id}_pump"],
+    )
+
+
+class FakeRegistries:
+    """Device and entity registry with the lookups used by the resolution."""
+
+    def __init__(self):
+        self.devices = {}
+        self.entities = {}
+
+    def add_device(self, device_id, config_entries=(), area_id=None):
+        self.devices[device_id] = SimpleNamespace(id=device_id, config_entries=set(config_entries), area_id=area_id)
+
+    def add_entity(self, entity_id, device_id=None, config_entry_id=None, area_id=None):
+        self.entities[entity_id] = SimpleNamespace(
+            entity_id=entity_id, device_id=device_id, config_entry_id=config_entry_id, area_id=area_id
+        )
+
+    def install(self, monkeypatch):
+        device_registry = SimpleNamespace(async_get=self.devices.get)
+        entity_registry = SimpleNamespace(async_get=self.entities.get)
+        monkeypatch.setattr(registry_module, "dr", SimpleNamespace(
+            async_get=lambda hass: device_registry,
+            async_entries_for_area=lambda registry, area_id: [
+                device for device in self.devices.values() if device.area_id == area_id
+            ],
+        ))
+        monkeypatch.setattr(registry_module, "er", SimpleNamespace(
+            async_get=lambda hass: entity_registry,
+            async_entries_for_device=lambda registry, device_id: [
+                entity for entity in self.entities.values() if entity.device_id == device_id
+            ],
+            async_entries_for_area=lambda registry, area_id: [
+                entity for entity in self.entities.values() if entity.area_id == area_id
+            ],
+        ))
+
+
+@pytest.fixture
+def registries(monkeypatch):
+    registries = FakeRegistries()
+    registries.install(monkeypatch)
+    return registries
+
+
+@pytest.fixture
+def registry():
+    registry = CoordinatorRegistry()
+    registry.tent_1 = _coordinator("tent_1")
+    registry.tent_2 = _coordinator("tent_2")
+    registry.unregister_1 = registry.async_register("entry_1", registry.tent_1)
+    registry.async_register("entry_2", registry.tent_2)
+    return registry
+
+
+def test_resolve_esphome_device_id(registry, registries):
+    assert registry.async_resolve(HASS, {"device_id": "tent_2"}) == [registry.tent_2]
+    assert registry.get("tent_1") is registry.tent_1
+    assert registry.get_by_entry("entry_2") is registry.tent_2
+
+
+def test_resolve_own_device_registry_id(registry, registries):
+    registries.add_device("ha_device_1", config_entries=["entry_1"])
+    assert registry.async_resolve(HASS, {"device_id": ["ha_device_1"]}) == [registry.tent_1]
+
+
+def test_resolve_esphome_device_through_its_entities(registry, registries):
+    registries.add_device("esphome_device", config_entries=["esphome_entry"])
+    registries.add_entity("switch.tent_2_pump", device_id="esphome_device")
+    assert registry.async_resolve(HASS, {"device_id": "esphome_device"}) == [registry.tent_2]
+
+
+def test_resolve_unknown_device(registry, registries):
+    assert registry.async_resolve(HASS, {"device_id": "missing"}) == []
+
+
+def test_resolve_entities(registry, registries):
+    registries.add_entity("sensor.athena_tent_2_vpd", config_entry_id="entry_2")
+    registries.add_entity("light.kitchen", config_entry_id="hue_entry")
+
+    assert registry.async_resolve(HASS, {"entity_id": "sensor.tent_1_vwc"}) == [registry.tent_1]
+    assert registry.async_resolve(HASS, {"entity_id": ["sensor.athena_tent_2_vpd"]}) == [registry.tent_2]
+    assert registry.async_resolve(HASS, {"entity_id": ["light.kitchen", "sensor.unknown"]}) == []
+
+
+def test_resolve_area(registry, registries):
+    registries.add_device("ha_device_1", config_entries=["entry_1"], area_id="grow_room")
+    registries.add_entity("switch.tent_2_pump", area_id="grow_room")
+    registries.add_entity("sensor.tent_1_vwc", area_id="grow_room")
+
+    resolved = registry.async_resolve(HASS, {"area_id": "grow_room"})
+    assert resolved == [registry.tent_1, registry.tent_2]
+    assert registry.async_resolve(HASS, {"area_id": "kitchen"}) == []
+
+
+def test_resolve_all(registry, registries):
+    assert registry.async_resolve(HASS, {"device_id": ["all"]}) == [registry.tent_1, registry.tent_2]
+    assert registry.async_resolve(HASS, {"entity_id": "all"}) == [registry.tent_1, registry.tent_2]
+
+
+def test_no_target_with_several_devices_is_ambiguous(registry, registries, caplog):
+    assert registry.async_resolve(HASS, {}) == []
+    assert "please specify a device_id" in caplog.text
+
+
+def test_no_target_with_a_single_device(registry, registries):
+    registry.unregister_1()
+    assert registry.async_resolve(HASS, {}) == [registry.tent_2]
+
+
+def test_unregister_removes_all_indexes(registry, registries):
+    registry.unregister_1()
+    assert registry.get("tent_1") is None
+    assert registry.get_by_entry("entry_1") is None
+    assert registry.async_resolve(HASS, {"entity_id": "sensor.tent_1_vwc"}) == []
+    assert registry.coordinators == [registry.tent_2]
@@ -0,0 +1,200 @@
+"""Tests for the P0-P3 irrigation state machine."""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor import scheduler as scheduler_module  # noqa: E402
+from custom_components.athena_plant_monitor.scheduler import IrrigationScheduler  # noqa: E402
+
+START = datetime(2026, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+
+class Harness:
+    """Scheduler with a controllable clock, recorded shots and timers."""
+
+    def __init__(self, monkeypatch):
+        self.now = START
+        self.shots = []
+        self.timers = []
+        self.changes = 0
+        self.refreshes = 0
+        self.state = {"current_phase": "P3", "max_vwc_today": 0.0, "automation_enabled": True}
+
+        monkeypatch.setattr(scheduler_module.dt_util, "now", lambda: self.now)
+        monkeypatch.setattr(scheduler_module, "async_track_point_in_time", self._track)
+        self.restart()
+
+    def restart(self):
+        """Create a new scheduler on the same (persisted) state."""
+        hass = SimpleNamespace(async_create_task=self._create_task)
+        self.scheduler = IrrigationScheduler(
+            hass, self.state, self._fire_shot, self._on_change, self._request_refresh
+        )
+
+    def _track(self, hass, action, at):
+        self.timers.append(at)
+        return lambda: None
+
+    def _create_task(self, coro):
+        # Der Schuss-Callback wartet auf nichts: sofort ausführen
+        with pytest.raises(StopIteration):
+            coro.send(None)
+
+    async def _fire_shot(self, shot_size, source):
+        self.shots.append((source, shot_size))
+
+    def _on_change(self):
+        self.changes += 1
+
+    def _request_refresh(self):
+        self.refreshes += 1
+
+    def update(self, lights_on, vwc, vwc_target=70.0):
+        return self.scheduler.async_update(lights_on, vwc, vwc_target)
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+    def wake(self):
+        self.scheduler._async_wakeup(self.now)
+
+
+@pytest.fixture
+def harness(monkeypatch):
+    return Harness(monkeypatch)
+
+
+def _shots(harness, source):
+    return [shot for shot in harness.shots if shot[0] == source]
+
+
+def test_restart_in_the_dark_starts_in_p3(harness):
+    harness.update(False, 60.0)
+    assert harness.scheduler.phase == "P3"
+
+
+def test_lights_on_enters_p0_with_timer_to_its_end(harness):
+    harness.update(False, 60.0)
+    harness.advance(minutes=1)
+    assert harness.update(True, 60.0)
+    assert harness.scheduler.phase == "P0"
+    assert harness.scheduler.next_event == harness.now + timedelta(hours=1.5)
+    assert harness.shots == []
+
+
+def test_p0_timer_starts_p1_with_first_shot(harness):
+    harness.update(True, 60.0)
+    harness.state["max_vwc_today"] = 68.0
+    harness.advance(hours=1.5)
+    harness.wake()
+    assert harness.scheduler.phase == "P1"
+    assert _shots(harness, "P1") == [("P1", 4.0)]
+    assert harness.state["max_vwc_today"] == 60.0
+    assert harness.changes == 1
+
+
+def test_p1_shoots_until_target_then_p2(harness):
+    harness.update(True, 60.0)
+    harness.advance(hours=1.5)
+    harness.wake()
+    harness.advance(minutes=20)
+    harness.wake()
+    assert len(_shots(harness, "P1")) == 2
+
+    harness.update(True, 71.0)
+    assert harness.scheduler.phase == "P2"
+
+
+def test_p1_stops_after_max_shots(harness):
+    harness.update(True, 50.0)
+    harness.advance(hours=1.5)
+    harness.wake()
+    for _ in range(4):
+        harness.advance(minutes=20)
+        harness.wake()
+    assert len(_shots(harness, "P1")) == 4
+    assert harness.scheduler.phase == "P2"
+
+
+def test_p2_maintenance_shot_on_dryback(harness):
+    harness.update(True, 60.0)
+    harness.advance(hours=1.5)
+    harness.update(True, 72.0)
+    assert harness.scheduler.phase == "P2"
+    harness.state["max_vwc_today"] = 72.0
+
+    harness.advance(minutes=40)
+    harness.update(True, 70.0)
+    assert _shots(harness, "P2") == []
+
+    harness.update(True, 68.0)
+    assert _shots(harness, "P2") == [("P2", 2.5)]
+
+    # Mindestabstand zwischen zwei Erhaltungsschüssen
+    harness.advance(minutes=10)
+    harness.update(True, 67.0)
+    assert len(_shots(harness, "P2")) == 1
+    harness.advance(minutes=25)
+    harness.update(True, 67.0)
+    assert len(_shots(harness, "P2")) == 2
+
+
+def test_lights_off_enters_p3(harness):
+    harness.update(True, 60.0)
+    harness.advance(hours=12)
+    assert harness.update(False, 55.0)
+    assert harness.scheduler.phase == "P3"
+
+
+def test_disabled_automation_skips_shots(harness):
+    harness.state["automation_enabled"] = False
+    harness.update(True, 50.0)
+    harness.advance(hours=1.5)
+    harness.wake()
+    assert harness.scheduler.phase == "P1"
+    assert harness.shots == []
+
+
+def test_restart_during_p0_continues_the_dryback(harness):
+    harness.update(True, 60.0)
+    assert harness.state["phase_started"] == START
+
+    harness.advance(hours=1)
+    harness.restart()
+    harness.update(True, 60.0)
+    assert harness.scheduler.phase == "P0"
+    assert harness.scheduler.next_event == START + timedelta(hours=1.5)
+
+
+def test_restart_after_p0_end_starts_p1(harness):
+    harness.update(True, 60.0)
+    harness.advance(hours=2)
+    harness.restart()
+    harness.update(True, 60.0)
+    assert harness.scheduler.phase == "P1"
+    assert _shots(harness, "P1") == [("P1", 4.0)]
+
+
+def test_restart_ignores_a_p0_start_of_an_earlier_day(harness):
+    harness.update(True, 60.0)
+    harness.advance(hours=25)
+    harness.restart()
+    harness.update(True, 60.0)
+    assert harness.scheduler.phase == "P0"
+    assert harness.state["phase_started"] == harness.now
+
+
+def test_restart_in_p2_does_not_saturate_again(harness):
+    harness.update(True, 60.0)
+    harness.advance(hours=1.5)
+    harness.update(True, 72.0)
+    assert harness.scheduler.phase == "P2"
+
+    harness.advance(hours=1)
+    harness.restart()
+    harness.update(True, 70.0)
+    assert harness.scheduler.phase == "P2"
+    assert harness.shots == []
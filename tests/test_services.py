@@ -0,0 +1,82 @@
+"""Tests for the per-device results of the fan-out services."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor import services as services_module  # noqa: E402
+
+
+class FakeCoordinator:
+    """Coordinator with the irrigation API used by the services."""
+
+    def __init__(self, device_id, available=True, pump=True):
+        self.device_id = device_id
+        self.availability = SimpleNamespace(available=available)
+        self.pump = pump
+        self.shots = []
+
+    async def trigger_irrigation_shot(self, shot_size, duration, delay=0, source="manual"):
+        if not self.pump or not self.availability.available:
+            return None
+        self.shots.append((shot_size, duration, delay))
+        return object()
+
+    async def start_p1_saturation(self, shot_count, shot_size, interval_minutes):
+        queued = 0
+        for i in range(shot_count):
+            if await self.trigger_irrigation_shot(shot_size, 30, delay=i * interval_minutes * 60):
+                queued += 1
+        return queued
+
+
+@pytest.fixture
+def call_service(monkeypatch):
+    handlers = {}
+    hass = SimpleNamespace(
+        services=SimpleNamespace(
+            async_register=lambda domain, service, handler, **kwargs: handlers.__setitem__(service, handler)
+        )
+    )
+    asyncio.run(services_module.async_setup_services(hass))
+
+    def _call(service, coordinators, **data):
+        monkeypatch.setattr(services_module, "get_coordinators_for_call", lambda hass, call: coordinators)
+        return asyncio.run(handlers[service](SimpleNamespace(data=data)))
+
+    return _call
+
+
+def test_irrigation_shot_reports_skipped_devices(call_service):
+    online = FakeCoordinator("tent_1")
+    offline = FakeCoordinator("tent_2", available=False)
+    no_pump = FakeCoordinator("tent_3", pump=False)
+
+    response = call_service("irrigation_shot", [online, offline, no_pump], shot_size=3.0, duration=30)
+
+    assert response["succeeded"] == 1
+    assert response["failed"] == 2
+    assert response["results"]["tent_1"] == {"success": True}
+    assert response["results"]["tent_2"]["success"] is False
+    assert "device offline" in response["results"]["tent_2"]["error"]
+    assert "no pump configured" in response["results"]["tent_3"]["error"]
+    assert online.shots == [(3.0, 30, 0)]
+
+
+def test_p1_saturation_fails_when_nothing_was_queued(call_service):
+    online = FakeCoordinator("tent_1")
+    offline = FakeCoordinator("tent_2", available=False)
+
+    response = call_service(
+        "p1_saturation_sequence", [online, offline], shot_count=3, shot_size=4.0, interval_minutes=20
+    )
+
+    assert response["results"]["tent_1"] == {"success": True}
+    assert "device offline" in response["results"]["tent_2"]["error"]
+    assert [shot[2] for shot in online.shots] == [0, 1200, 2400]
+
+
+def test_no_targeted_device(call_service):
+    assert call_service("irrigation_shot", []) == {"succeeded": 0, "failed": 0, "results": {}}
@@ -0,0 +1,74 @@
+"""Tests for the simulated tent."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.const import EVENT_CALL_SERVICE, EVENT_HOMEASSISTANT_STOP  # noqa: E402
+
+from custom_components.athena_plant_monitor import simulator as simulator_module  # noqa: E402
+from custom_components.athena_plant_monitor.simulator import SimulatedTent, async_setup_simulator  # noqa: E402
+
+
+def test_light_override_ends_at_next_schedule_transition():
+    tent = SimulatedTent("sim_tent_001", seed=1, light_start="06:00", light_end="22:00")
+    now = datetime(2026, 1, 1, 12, 0)
+    tent.step(60, now)
+    assert tent.actuators["led_panel"] is True
+
+    tent.set_actuator("led_panel", False)
+    now += timedelta(hours=1)
+    tent.step(60, now)
+    assert tent.actuators["led_panel"] is False
+
+    # 22:00 Schaltpunkt: Zeitplan übernimmt wieder (Nacht), 06:00 dann Tag
+    now = datetime(2026, 1, 1, 22, 30)
+    tent.step(60, now)
+    assert tent.light_override is None
+    tent.step(60, datetime(2026, 1, 2, 6, 30))
+    assert tent.actuators["led_panel"] is True
+
+
+class FakeBus:
+    """Bus that records its listeners."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.once = {}
+
+    def async_listen(self, event_type, listener):
+        self.listeners[event_type] = listener
+        return lambda: self.listeners.pop(event_type)
+
+    def async_listen_once(self, event_type, listener):
+        self.once[event_type] = listener
+        return lambda: self.once.pop(event_type)
+
+
+def test_simulator_stops_with_home_assistant(monkeypatch):
+    timers = []
+    monkeypatch.setattr(
+        simulator_module, "async_track_time_interval",
+        lambda hass, action, interval: timers.append(action) or (lambda: timers.remove(action)),
+    )
+    flows = []
+    hass = SimpleNamespace(
+        bus=FakeBus(),
+        states=SimpleNamespace(async_set=lambda entity_id, state: None),
+        config_entries=SimpleNamespace(flow=SimpleNamespace(
+            async_init=lambda domain, context, data: flows.append(data)
+        )),
+        async_create_task=lambda target: None,
+    )
+
+    simulator, stop = async_setup_simulator(hass, 2, 10.0, 1.0)
+    assert len(flows) == 2
+    assert len(timers) == 1
+    assert EVENT_CALL_SERVICE in hass.bus.listeners
+
+    hass.bus.once[EVENT_HOMEASSISTANT_STOP](None)
+    assert timers == []
+    assert hass.bus.listeners == {}
+    assert stop == simulator.async_stop
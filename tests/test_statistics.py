@@ -0,0 +1,121 @@
+"""Tests for the 5-minute/hourly statistics aggregation and import."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor import statistics as statistics_module  # noqa: E402
+from custom_components.athena_plant_monitor.statistics import (  # noqa: E402
+    StatisticsAggregator,
+    async_import_statistics,
+    statistic_id,
+)
+
+HOUR = 1_767_225_600.0  # 2026-01-01 00:00 UTC
+
+
+def _aggregator():
+    return StatisticsAggregator(mean_keys={"vwc": "%"}, sum_keys={"daily_water_total": "L"})
+
+
+def test_five_minute_buckets_merge_into_the_hour():
+    aggregator = _aggregator()
+    assert aggregator.add({"vwc": 60.0}, HOUR + 10) == []
+    assert aggregator.add({"vwc": 64.0}, HOUR + 200) == []
+    assert aggregator.add({"vwc": 50.0}, HOUR + 310) == []
+    assert aggregator.add({"vwc": 70.0}, HOUR + 3500) == []
+
+    short_term = aggregator.short_term("vwc")
+    assert [bucket["count"] for bucket in short_term] == [2, 1]
+    assert short_term[0]["mean"] == 62.0
+
+    completed = aggregator.add({"vwc": 55.0}, HOUR + 3610)
+    assert len(completed) == 1
+    hour = completed[0]
+    assert hour.key == "vwc"
+    assert hour.start == HOUR
+    assert hour.bucket.count == 4
+    assert hour.bucket.mean == 61.0
+    assert (hour.bucket.minimum, hour.bucket.maximum) == (50.0, 70.0)
+    assert hour.total is None
+
+
+def test_non_numeric_values_are_skipped():
+    aggregator = _aggregator()
+    aggregator.add({"vwc": None}, HOUR)
+    aggregator.add({"vwc": True}, HOUR + 400)
+    assert aggregator.add({"vwc": 60.0}, HOUR + 3700) == []
+    assert aggregator.short_term("vwc") == []
+
+
+def test_daily_counter_becomes_running_total():
+    aggregator = _aggregator()
+    aggregator.restore({"daily_water_total": 100.0, "unknown": 1.0})
+    aggregator.add({"daily_water_total": 2.0}, HOUR)
+    aggregator.add({"daily_water_total": 5.0}, HOUR + 600)
+    # Tagesreset: 1 L nach Mitternacht ist Zuwachs
+    aggregator.add({"daily_water_total": 1.0}, HOUR + 1200)
+    assert aggregator.totals == {"daily_water_total": 104.0}
+
+    completed = aggregator.add({"daily_water_total": 1.0}, HOUR + 3600)
+    assert completed[0].total == 104.0
+    assert completed[0].bucket.last == 1.0
+
+
+def test_as_dict_lists_short_term_aggregates():
+    aggregator = _aggregator()
+    aggregator.add({"vwc": 60.0}, HOUR)
+    aggregator.add({"vwc": 61.0}, HOUR + 300)
+    result = aggregator.as_dict()
+    assert result["totals"] == {"daily_water_total": 0.0}
+    assert result["short_term"]["vwc"] == [{
+        "start": "2026-01-01T00:00:00+00:00", "mean": 60.0, "min": 60.0, "max": 60.0, "count": 1,
+    }]
+    assert result["short_term"]["daily_water_total"] == []
+
+
+@pytest.fixture
+def imported(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        statistics_module, "async_add_external_statistics",
+        lambda hass, metadata, rows: calls.append((metadata, rows)),
+    )
+    return calls
+
+
+def _completed_hour():
+    aggregator = _aggregator()
+    aggregator.add({"vwc": 60.0, "daily_water_total": 2.0}, HOUR)
+    aggregator.add({"vwc": 64.0, "daily_water_total": 3.0}, HOUR + 600)
+    return aggregator.add({"vwc": 70.0, "daily_water_total": 3.5}, HOUR + 3600)
+
+
+def test_import_rows(imported):
+    hass = SimpleNamespace(config=SimpleNamespace(components={"recorder"}))
+    async_import_statistics(
+        hass, "tent_1", "Tent 1", _completed_hour(),
+        mean_keys={"vwc": "%"}, sum_keys={"daily_water_total": "L"},
+    )
+    by_id = {metadata["statistic_id"]: (metadata, rows) for metadata, rows in imported}
+    start = datetime.fromtimestamp(HOUR, timezone.utc)
+
+    metadata, rows = by_id[statistic_id("tent_1", "vwc")]
+    assert metadata["statistic_id"] == "athena_plant_monitor:tent_1_vwc"
+    assert metadata["has_mean"] and not metadata["has_sum"]
+    assert metadata["unit_of_measurement"] == "%"
+    assert metadata["name"] == "Tent 1 vwc"
+    assert rows == [{"start": start, "mean": 62.0, "min": 60.0, "max": 64.0}]
+
+    metadata, rows = by_id[statistic_id("tent_1", "daily_water_total")]
+    assert metadata["has_sum"] and not metadata["has_mean"]
+    assert metadata["unit_of_measurement"] == "L"
+    assert rows == [{"start": start, "state": 3.0, "sum": 1.0}]
+
+
+def test_import_needs_the_recorder(imported):
+    hass = SimpleNamespace(config=SimpleNamespace(components=set()))
+    async_import_statistics(hass, "tent_1", "Tent 1", _completed_hour())
+    assert imported == []
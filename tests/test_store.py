@@ -0,0 +1,84 @@
+"""Tests for the persisted irrigation state."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor import store as store_module  # noqa: E402
+from custom_components.athena_plant_monitor.store import AthenaPlantStore  # noqa: E402
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    def __init__(self, hass, version, key):
+        self.key = key
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = {"now": NOW}
+    monkeypatch.setattr(store_module, "Store", FakeStore)
+    monkeypatch.setattr(store_module.dt_util, "now", lambda: clock["now"])
+    return clock
+
+
+def _state():
+    return {
+        "irrigation_state": {
+            "current_phase": "P2",
+            "phase_started": NOW - timedelta(hours=2),
+            "daily_water_total": 3.5,
+            "max_vwc_today": 71.0,
+            "last_irrigation": NOW - timedelta(minutes=30),
+        },
+        "growth_config": {"phase": "flower_early", "steering": "generative"},
+        "target_overrides": {"vwc_target": 68.0},
+        "statistics": {"daily_water_total": 120.0},
+    }
+
+
+def test_round_trip_same_day(clock):
+    store = AthenaPlantStore(None, "tent_1")
+    asyncio.run(store.async_save(_state()))
+    assert store._store.key == "athena_plant_monitor.tent_1"
+    assert store._store.data["saved_on"] == "2026-03-01"
+    assert store._store.data["irrigation_state"]["last_irrigation"] == "2026-03-01T11:30:00+00:00"
+
+    loaded = asyncio.run(store.async_load())
+    assert loaded == _state()
+
+
+def test_daily_counters_dropped_on_a_later_day(clock):
+    store = AthenaPlantStore(None, "tent_1")
+    asyncio.run(store.async_save(_state()))
+    clock["now"] = NOW + timedelta(days=1)
+
+    loaded = asyncio.run(store.async_load())
+    assert "daily_water_total" not in loaded["irrigation_state"]
+    assert "max_vwc_today" not in loaded["irrigation_state"]
+    assert loaded["irrigation_state"]["current_phase"] == "P2"
+    assert loaded["statistics"] == {"daily_water_total": 120.0}
+
+
+def test_invalid_last_irrigation(clock):
+    store = AthenaPlantStore(None, "tent_1")
+    store._store.data = {"saved_on": "2026-03-01", "irrigation_state": {"last_irrigation": "gestern"}}
+    loaded = asyncio.run(store.async_load())
+    assert loaded["irrigation_state"]["last_irrigation"] is None
+    assert loaded["target_overrides"] == {}
+
+
+def test_empty_store(clock):
+    assert asyncio.run(AthenaPlantStore(None, "tent_1").async_load()) is None
@@ -0,0 +1,107 @@
+"""Tests for the precomputed target table and the manual overrides."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.athena_plant_monitor.const import CROP_STEERING_STRATEGIES, GROWTH_PHASES  # noqa: E402
+from custom_components.athena_plant_monitor.coordinator import AthenaPlantCoordinator as Coordinator  # noqa: E402
+from custom_components.athena_plant_monitor.targets import (  # noqa: E402
+    DEFAULT_TARGET_TABLE,
+    TargetProfile,
+    build_target_table,
+    lookup_targets,
+)
+
+
+def test_table_covers_every_combination():
+    assert len(DEFAULT_TARGET_TABLE) == len(GROWTH_PHASES) * len(CROP_STEERING_STRATEGIES) * 2
+    assert DEFAULT_TARGET_TABLE[("flowering_bulk", "balanced", True)] == TargetProfile(
+        vwc_target=85.0, ec_target=7.0, ph_target=6.0, vpd_target=1.2,
+        temperature_target=22.0, humidity_target=55.0, co2_target=1500, dryback_target=45.0,
+    )
+    with pytest.raises(TypeError):
+        DEFAULT_TARGET_TABLE[("flowering_bulk", "balanced", True)] = None
+
+
+def test_steering_adjusts_the_phase_targets():
+    night = DEFAULT_TARGET_TABLE[("flowering_bulk", "generative", False)]
+    assert night.vwc_target == 80.0
+    assert night.ec_target == 8.5
+    assert night.dryback_target == 50.0
+    assert night.vpd_target == 1.2
+    assert night.temperature_target == 19.0
+
+
+def test_overrides_replace_only_their_field():
+    table = build_target_table({"vwc_target_manual": 72.0, "ec_target_manual": None, "unknown": 1.0})
+    for key, profile in table.items():
+        assert profile == DEFAULT_TARGET_TABLE[key]._replace(vwc_target=72.0)
+
+
+def test_lookup_falls_back_to_vegetative_balanced():
+    assert lookup_targets(DEFAULT_TARGET_TABLE, "seedling", "aggressive", False) is (
+        DEFAULT_TARGET_TABLE[("vegetative", "balanced", False)]
+    )
+
+
+class OverrideCoordinator:
+    """The override handling of the coordinator without Home Assistant."""
+
+    set_growth_phase = Coordinator.set_growth_phase
+    set_target_override = Coordinator.set_target_override
+    clear_target_overrides = Coordinator.clear_target_overrides
+    _rebuild_target_table = Coordinator._rebuild_target_table
+    _current_targets = Coordinator._current_targets
+
+    def __init__(self):
+        self.device_id = "tent_1"
+        self._growth_config = {"phase": "flowering_bulk", "steering": "balanced"}
+        self._target_overrides = {}
+        self._target_table = DEFAULT_TARGET_TABLE
+        self.saves = 0
+        self.refreshes = 0
+
+    def _is_day_cycle(self):
+        return True
+
+    def _mark_dirty(self, *inputs):
+        pass
+
+    def _schedule_save(self):
+        self.saves += 1
+
+    async def async_request_refresh(self):
+        self.refreshes += 1
+
+
+def test_override_applies_until_cleared():
+    coordinator = OverrideCoordinator()
+    asyncio.run(coordinator.set_target_override("ec_target_manual", 6.2))
+    assert coordinator._current_targets().ec_target == 6.2
+    assert coordinator._current_targets().vwc_target == 85.0
+
+    asyncio.run(coordinator.clear_target_overrides(["ec_target_manual"]))
+    assert coordinator._target_table is DEFAULT_TARGET_TABLE
+    assert coordinator.refreshes == 2
+
+
+def test_growth_phase_change_clears_overrides():
+    coordinator = OverrideCoordinator()
+    asyncio.run(coordinator.set_target_override("vwc_target_manual", 72.0))
+
+    asyncio.run(coordinator.set_growth_phase("flowering_bulk"))
+    assert coordinator._current_targets().vwc_target == 72.0
+
+    asyncio.run(coordinator.set_growth_phase("flowering_finish"))
+    assert coordinator._target_overrides == {}
+    assert coordinator._target_table is DEFAULT_TARGET_TABLE
+    assert coordinator._current_targets() == DEFAULT_TARGET_TABLE[("flowering_finish", "balanced", True)]
+
+
+def test_unknown_override_is_ignored():
+    coordinator = OverrideCoordinator()
+    asyncio.run(coordinator.set_target_override("co2_target_manual", 900))
+    assert coordinator._target_overrides == {}
+    assert coordinator.refreshes == 0